@@ -64,7 +64,7 @@ INSTALLED_APPS = [
 REST_FRAMEWORK = {
     # Authentication
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'brashfox_app.api.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     
@@ -95,18 +95,44 @@ REST_FRAMEWORK = {
         'contact': '5/hour',     # Contact form: 5 messages per hour
         'register': '3/hour',    # Registration: 3 attempts per hour
         'login': '10/hour',      # Login: 10 attempts per hour
+        'token_refresh': '100/hour',  # JWT refresh: 100 per hour
     },
     
     # Schema - for API documentation
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     
-    # Rendering
+    # Rendering / parsing - see API_FAST_JSON below
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
 }
 
+# orjson-based JSON renderer/parser (brashfox_app.api.renderers/parsers).
+# Off by default; install orjson and set API_FAST_JSON = True in
+# local_settings.py to opt in.
+API_FAST_JSON = False
+
+try:
+    from brashfox.local_settings import API_FAST_JSON
+except ImportError:
+    pass
+
+if API_FAST_JSON:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'brashfox_app.api.renderers.ORJSONRenderer',
+    ]
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = [
+        'brashfox_app.api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ]
+
+# The browsable API costs a template render per request - development only
+if DEBUG:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append(
+        'rest_framework.renderers.BrowsableAPIRenderer'
+    )
+
 # CORS Configuration
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = [
@@ -180,6 +206,55 @@ except ModuleNotFoundError:
     exit(0)
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory by default. With several server processes use a shared
+# backend in local_settings.py, e.g.:
+#   'django.core.cache.backends.filebased.FileBasedCache'
+#   'django.core.cache.backends.redis.RedisCache'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'brashfox',
+    },
+}
+
+try:
+    from brashfox.local_settings import CACHES
+except ImportError:
+    pass
+
+# Cache alias used for public API responses (brashfox_app.api.cache)
+API_RESPONSE_CACHE = 'default'
+
+# Store for the sliding-window throttles (brashfox_app.api.throttles):
+# 'database' works across workers on one node; 'cache' uses THROTTLE_CACHE
+# and needs a shared backend (Redis/Memcached) to be enforced globally.
+THROTTLE_STORE = 'database'
+THROTTLE_CACHE = 'default'
+
+try:
+    from brashfox.local_settings import THROTTLE_STORE
+except ImportError:
+    pass
+
+try:
+    from brashfox.local_settings import THROTTLE_CACHE
+except ImportError:
+    pass
+
+
+# E-mail
+# Contact form notifications go to ADMINS through the outbox table and are
+# sent by `manage.py deliver_outbox`. Set ADMINS / EMAIL_* in local_settings.py.
+
+try:
+    from brashfox.local_settings import ADMINS
+except ImportError:
+    ADMINS = []
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -234,7 +309,18 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 # File upload settings
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10000000  # 10MB
+# Uploads are spooled to a temporary file chunk by chunk (never held in
+# memory) and rejected early on bad magic bytes or FileUpload.MAX_IMAGE_SIZE
+FILE_UPLOAD_HANDLERS = [
+    'brashfox_app.api.upload_handlers.StreamingImageUploadHandler',
+]
+
+# Sparse temporary files of resumable photo uploads (/api/photo-uploads/);
+# same filesystem as MEDIA_ROOT lets finalized files be moved, not copied.
+# Abandoned sessions (FileUpload.UPLOAD_SESSION_LIFETIME) are purged when a
+# new upload starts, by an idle `manage.py process_images` and by
+# `manage.py purge_uploads` (e.g. from cron).
+CHUNKED_UPLOAD_DIR = os.path.join(BASE_DIR, 'upload_tmp')
 
 # JWT Settings
 SIMPLE_JWT = {
@@ -8,7 +8,10 @@ from brashfox_app.models import (
     FotoDescription,
     FotoCategory,
     FotoTags,
+    ImageBlob,
     AboutMe,
+    ImageProcessingJob,
+    OutgoingEmail,
 )
 
 
@@ -22,6 +25,31 @@ admin.site.register(FotoCategory)
 admin.site.register(FotoTags)
 
 
+@admin.register(ImageProcessingJob)
+class ImageProcessingJobAdmin(admin.ModelAdmin):
+    """
+    Admin for the image processing queue (read-mostly, for monitoring).
+    """
+    list_display = ['photo', 'status', 'attempts', 'created', 'updated']
+    list_filter = ['status']
+    readonly_fields = ['created', 'updated']
+
+
+@admin.register(ImageBlob)
+class ImageBlobAdmin(admin.ModelAdmin):
+    """
+    Admin for deduplicated photo files (read-only, counts are kept by ImageBlobService).
+    """
+    list_display = ['path', 'size', 'ref_count', 'created']
+    readonly_fields = ['sha256', 'path', 'size', 'ref_count', 'created']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(AboutMe)
 class AboutMeAdmin(admin.ModelAdmin):
     """
@@ -40,3 +68,12 @@ class AboutMeAdmin(admin.ModelAdmin):
         """Prevent deletion of the singleton."""
         return False
 
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """
+    Admin for the e-mail outbox (read-mostly, for monitoring).
+    """
+    list_display = ['subject', 'status', 'attempts', 'next_attempt', 'sent']
+    list_filter = ['status']
+    readonly_fields = ['created', 'sent']
@@ -4,19 +4,20 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
+from brashfox_app.api.throttles import LoginThrottle, TokenRefreshThrottle
+
 
-# Simplified versions without throttling (can be added later with proper cache setup)
 class ThrottledTokenObtainPairView(TokenObtainPairView):
     """
     JWT Token obtain view.
-    Note: Throttling disabled - requires cache backend for production use.
+    Rate limited per IP (login scope) to slow down brute force attacks.
     """
-    pass
+    throttle_classes = [LoginThrottle]
 
 
 class ThrottledTokenRefreshView(TokenRefreshView):
     """
     JWT Token refresh view.
-    Note: Throttling disabled - requires cache backend for production use.
+    Rate limited per IP (token_refresh scope).
     """
-    pass
+    throttle_classes = [TokenRefreshThrottle]
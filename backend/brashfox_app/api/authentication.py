@@ -0,0 +1,63 @@
+"""
+Custom DRF authentication classes.
+"""
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.utils.constants import API
+
+
+PRINCIPAL_FIELDS = ('id', 'username', 'is_staff', 'is_active')
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that caches the user principal instead of loading
+    the user row on every request.
+
+    The cached principal (id, username, is_staff, is_active) becomes a
+    User instance with the other fields deferred - reading e.g. `email`
+    loads it on demand, and save() only writes loaded fields.
+    Entries are dropped when the user is saved or deleted (see signals)
+    and expire after API.AUTH_USER_CACHE_TIMEOUT.
+    """
+
+    @staticmethod
+    def principal_key(user_id):
+        return f'auth-user:{user_id}'
+
+    @classmethod
+    def invalidate(cls, user_id):
+        ResponseCache.backend().delete(cls.principal_key(user_id))
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != 'id':
+            # Revocation compares the password hash, which isn't cached
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        cache = ResponseCache.backend()
+        key = self.principal_key(user_id)
+        principal = cache.get(key)
+        if principal is None:
+            principal = (
+                self.user_model.objects
+                .filter(id=user_id)
+                .values_list(*PRINCIPAL_FIELDS)
+                .first()
+            )
+            if principal is None:
+                raise AuthenticationFailed(_('User not found'), code='user_not_found')
+            cache.set(key, principal, API.AUTH_USER_CACHE_TIMEOUT)
+
+        user = self.user_model.from_db(None, PRINCIPAL_FIELDS, principal)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
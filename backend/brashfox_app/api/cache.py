@@ -0,0 +1,173 @@
+"""
+Response cache for read-heavy public endpoints.
+
+Anonymous GET responses are cached per namespace (one per endpoint group).
+Every namespace carries a version number that is part of the cache key;
+model signals bump the version of the namespaces a change affects once its
+transaction commits, so stale entries are never served again
+(see brashfox_app/signals.py).
+"""
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+from brashfox_app.api.utils.constants import API
+
+
+KEY_PREFIX = 'api-response'
+
+
+class ResponseCache:
+    """
+    Versioned response cache with hit/miss counters.
+    Uses the cache alias from settings.API_RESPONSE_CACHE ('default').
+    """
+
+    @staticmethod
+    def backend():
+        return caches[getattr(settings, 'API_RESPONSE_CACHE', 'default')]
+
+    @staticmethod
+    def version_key(namespace):
+        return f'{KEY_PREFIX}:{namespace}:version'
+
+    @staticmethod
+    def changed_key(namespace):
+        return f'{KEY_PREFIX}:{namespace}:changed'
+
+    @staticmethod
+    def stats_key(namespace, kind):
+        return f'{KEY_PREFIX}:{namespace}:{kind}'
+
+    @staticmethod
+    def get_version(namespace):
+        cache = ResponseCache.backend()
+        key = ResponseCache.version_key(namespace)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, 1, timeout=None)
+            version = cache.get(key, 1)
+        return version
+
+    @staticmethod
+    def invalidate(*namespaces):
+        """
+        Make every cached response of the given namespaces unreachable.
+
+        Args:
+            namespaces: Namespace names (e.g. 'photos', 'blog-posts')
+        """
+        cache = ResponseCache.backend()
+        now = int(time.time())
+        for namespace in namespaces:
+            cache.set(ResponseCache.changed_key(namespace), now, timeout=None)
+            key = ResponseCache.version_key(namespace)
+            cache.add(key, 1, timeout=None)
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Evicted between add() and incr()
+                cache.set(key, 2, timeout=None)
+
+    @staticmethod
+    def last_changed(namespace):
+        """
+        Return when the namespace was last invalidated (epoch seconds).
+        Unknown (e.g. after a cache restart) counts as "now".
+        """
+        cache = ResponseCache.backend()
+        key = ResponseCache.changed_key(namespace)
+        changed = cache.get(key)
+        if changed is None:
+            cache.add(key, int(time.time()), timeout=None)
+            changed = cache.get(key, int(time.time()))
+        return changed
+
+    @staticmethod
+    def build_key(namespace, request):
+        """
+        Build the cache key for a request (host, path, normalized query string).
+        Host is included because serializers build absolute media URLs.
+        """
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        url = f'{request.get_host()}{request.path}?{query}'
+        digest = hashlib.md5(url.encode()).hexdigest()
+        version = ResponseCache.get_version(namespace)
+        return f'{KEY_PREFIX}:{namespace}:v{version}:{digest}'
+
+    @staticmethod
+    def record(namespace, hit):
+        cache = ResponseCache.backend()
+        key = ResponseCache.stats_key(namespace, 'hits' if hit else 'misses')
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+    @staticmethod
+    def get_stats(namespaces):
+        """
+        Return hit/miss counters.
+
+        Args:
+            namespaces: Iterable of namespace names
+
+        Returns:
+            Dictionary {namespace: {'hits': int, 'misses': int}}
+        """
+        cache = ResponseCache.backend()
+        return {
+            namespace: {
+                'hits': cache.get(ResponseCache.stats_key(namespace, 'hits'), 0),
+                'misses': cache.get(ResponseCache.stats_key(namespace, 'misses'), 0),
+            }
+            for namespace in namespaces
+        }
+
+
+class CachedResponseMixin:
+    """
+    Cache anonymous GET responses of a view.
+
+    Set `cache_namespace` on the view; ViewSets get `list` and `retrieve`
+    cached automatically, plain APIViews call `cached_response()`.
+    Responses carry an `X-Cache: HIT|MISS` header.
+    """
+    cache_namespace = None
+    cache_timeout = API.CACHE_LONG
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        if (
+            self.cache_namespace is None
+            or request.method != 'GET'
+            or request.user.is_authenticated
+        ):
+            return handler(request, *args, **kwargs)
+
+        cache = ResponseCache.backend()
+        key = ResponseCache.build_key(self.cache_namespace, request)
+        cached = cache.get(key)
+        if cached is not None:
+            ResponseCache.record(self.cache_namespace, hit=True)
+            data, status_code = cached
+            response = Response(data, status=status_code)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = handler(request, *args, **kwargs)
+        ResponseCache.record(self.cache_namespace, hit=False)
+        if response.status_code == 200:
+            cache.set(key, (response.data, response.status_code), self.cache_timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,119 @@
+"""
+Conditional GET (ETag / Last-Modified) support for API views.
+
+Views with a response cache namespace (see brashfox_app.api.cache) build
+validators from the request path plus the namespace version and change
+time. Signals bump the namespace on every relevant save/delete, including
+related models embedded in the payload (comment counts, categories,
+tags...). No query is needed, so cache hits stay query-free.
+
+Other views use the object's timestamp on detail endpoints and
+MAX(timestamp) + COUNT over the plain model rows on list endpoints.
+A matching If-None-Match / If-Modified-Since request gets a 304 without
+serialization.
+"""
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from brashfox_app.api.cache import ResponseCache
+
+
+class ConditionalGetMixin:
+    """
+    Add ETag/Last-Modified headers to list/retrieve and answer
+    conditional requests with 304 Not Modified.
+
+    - `cache_namespace`: response cache namespace covering the view's data
+    - `last_modified_field`: timestamp field of the model (None if absent),
+      used by views without a namespace
+    """
+    last_modified_field = 'edited'
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        if self.cache_namespace:
+            return self.conditional_response(
+                request, [request.get_full_path()], None, super().list, *args, **kwargs
+            )
+
+        # Annotations and joins of get_queryset() would only slow this down
+        model = self.get_queryset().model
+        queryset = self.filter_queryset(model._default_manager.all()).order_by()
+        aggregates = {'count': Count('pk'), 'last_pk': Max('pk')}
+        if self.last_modified_field:
+            aggregates['last_modified'] = Max(self.last_modified_field)
+        state = queryset.aggregate(**aggregates)
+
+        return self.conditional_response(
+            request,
+            [request.get_full_path(), state['count'], state['last_pk']],
+            state.get('last_modified'),
+            super().list, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.cache_namespace:
+            return self.conditional_response(
+                request, [request.get_full_path()], None, super().retrieve, *args, **kwargs
+            )
+
+        instance = self.get_object()
+        last_modified = None
+        if self.last_modified_field:
+            last_modified = getattr(instance, self.last_modified_field)
+
+        return self.conditional_response(
+            request,
+            [instance.pk],
+            last_modified,
+            super().retrieve, *args, **kwargs
+        )
+
+    def get_object(self):
+        # retrieve() needs the object twice (validators + serialization)
+        if not hasattr(self, '_conditional_object'):
+            self._conditional_object = super().get_object()
+        return self._conditional_object
+
+    def conditional_response(self, request, etag_parts, last_modified, handler, *args, **kwargs):
+        """
+        Return 304 if the client's copy is current, else run the handler.
+
+        Args:
+            request: DRF Request
+            etag_parts: Values identifying the representation
+            last_modified: datetime of the newest data (or None)
+            handler: View method producing the full response
+        """
+        timestamp = None
+        etag_parts = list(etag_parts) + [request.accepted_renderer.format]
+        if isinstance(last_modified, datetime):
+            timestamp = int(last_modified.timestamp())
+            # Full precision: edits within the same second get a new ETag
+            etag_parts.append(last_modified.isoformat())
+
+        if self.cache_namespace:
+            # Related data changes bump the namespace, not our timestamp
+            changed = ResponseCache.last_changed(self.cache_namespace)
+            timestamp = max(timestamp or 0, changed)
+            etag_parts.append(ResponseCache.get_version(self.cache_namespace))
+
+        digest = hashlib.md5(':'.join(map(str, etag_parts)).encode()).hexdigest()
+        etag = f'W/"{digest}"'
+
+        not_modified = get_conditional_response(
+            request._request, etag=etag, last_modified=timestamp
+        )
+        if not_modified is not None:
+            return not_modified
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if timestamp:
+                response['Last-Modified'] = http_date(timestamp)
+        return response
@@ -0,0 +1,78 @@
+"""
+Custom DRF filter backends.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from brashfox_app.api.services import BlogSearchService, PhotoService
+
+
+class BlogPostSearchFilter(BaseFilterBackend):
+    """
+    Full-text search for blog posts (`?search=`).
+    Replaces SearchFilter's ILIKE scan with the indexed, ranked
+    BlogSearchService lookup.
+    """
+    search_param = api_settings.SEARCH_PARAM
+    search_title = 'Search'
+    search_description = 'Full-text search in post title and content (prefix matching).'
+
+    def get_search_query(self, request):
+        return request.query_params.get(self.search_param, '').strip()
+
+    def filter_queryset(self, request, queryset, view):
+        query = self.get_search_query(request)
+        if not query:
+            return queryset
+        return BlogSearchService.search(queryset, query)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.search_param,
+                'required': False,
+                'in': 'query',
+                'description': self.search_description,
+                'schema': {'type': 'string'},
+            },
+        ]
+
+
+class PhotoTagFilter(BaseFilterBackend):
+    """
+    Filter photos by tag names (`?tags=a,b`).
+    `?match=all` requires every tag, default `any` requires one of them.
+    """
+    tags_param = 'tags'
+    match_param = 'match'
+    match_choices = ('any', 'all')
+
+    def filter_queryset(self, request, queryset, view):
+        raw = request.query_params.get(self.tags_param, '')
+        names = [name for name in raw.split(',') if name.strip()]
+        if not names:
+            return queryset
+
+        match = request.query_params.get(self.match_param, 'any')
+        if match not in self.match_choices:
+            raise ValidationError({self.match_param: 'Dozwolone wartości: any, all.'})
+        return PhotoService.filter_by_tags(queryset, names, match)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.tags_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Comma-separated tag names (case-insensitive, exact).',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.match_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Tag matching mode: "any" (default) or "all".',
+                'schema': {'type': 'string', 'enum': list(self.match_choices)},
+            },
+        ]
@@ -0,0 +1,71 @@
+"""
+Custom DRF pagination classes.
+"""
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    PageNumberPagination,
+)
+
+
+class CreatedCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (-created, -id) for infinite scroll.
+    No COUNT(*) and no OFFSET scan, so deep pages cost the same as the
+    first one. Backed by matching composite indexes on the models.
+    """
+    ordering = ('-created', '-id')
+
+
+class CursorOrPageNumberPagination(BasePagination):
+    """
+    Page-number pagination by default, cursor pagination on request.
+
+    - `?page=2` (or nothing) - classic pages with `count` total
+    - `?pagination=cursor` - first cursor page; follow `next`/`previous`
+    """
+    mode_query_param = 'pagination'
+    cursor_mode = 'cursor'
+    page_number_class = PageNumberPagination
+    cursor_class = CreatedCursorPagination
+
+    def __init__(self):
+        self.paginator = self.page_number_class()
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or self.cursor_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request):
+            self.paginator = self.cursor_class()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.paginator.get_paginated_response_schema(schema)
+
+    @property
+    def display_page_controls(self):
+        return self.paginator.display_page_controls
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Set to "cursor" for cursor (keyset) pagination without totals.',
+                'schema': {'type': 'string', 'enum': [self.cursor_mode]},
+            },
+        ]
+        parameters += self.page_number_class().get_schema_operation_parameters(view)
+        parameters += self.cursor_class().get_schema_operation_parameters(view)
+        return parameters
@@ -0,0 +1,45 @@
+"""
+Custom DRF renderers.
+
+ORJSONRenderer renders JSON with orjson (optional dependency) - several
+times faster than the stdlib `json` module on large pages. Output matches
+DRF's JSONRenderer: datetimes, Decimals, lazy translation strings and
+other non-native types go through DRF's JSONEncoder.
+"""
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for JSONRenderer backed by orjson.
+    Pretty printing (`; indent=N`, browsable API) always uses 2 spaces.
+    """
+    # Same text for datetimes as JSONRenderer (DRF trims to milliseconds, 'Z' for UTC)
+    options = 0 if orjson is None else orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('ORJSONRenderer requires the orjson package.')
+        self.default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.default, option=options)
+
+        # Keep JSONRenderer's escaping of U+2028/U+2029 (strict JavaScript subset)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
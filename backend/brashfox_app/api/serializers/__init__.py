@@ -11,9 +11,12 @@ from .user import (
 # Photo serializers
 from .photo import (
     FotoCategorySerializer,
+    FotoCategoryNestedSerializer,
     FotoDescriptionListSerializer,
     FotoDescriptionDetailSerializer,
     FotoTagsSerializer,
+    FotoTagsExpandedSerializer,
+    PhotoUploadSerializer,
 )
 
 # Blog serializers
@@ -40,9 +43,12 @@ __all__ = [
     'GroupSerializer',
     # Photo
     'FotoCategorySerializer',
+    'FotoCategoryNestedSerializer',
     'FotoDescriptionListSerializer',
     'FotoDescriptionDetailSerializer',
     'FotoTagsSerializer',
+    'FotoTagsExpandedSerializer',
+    'PhotoUploadSerializer',
     # Blog
     'BlogPostListSerializer',
     'BlogPostDetailSerializer',
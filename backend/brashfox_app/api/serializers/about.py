@@ -20,6 +20,7 @@ class AboutMeSerializer(serializers.ModelSerializer):
             'bio',
             'profile_image',
             'profile_image_url',
+            'profile_image_placeholder',
             'specializations',
             'email',
             'phone',
@@ -27,7 +28,7 @@ class AboutMeSerializer(serializers.ModelSerializer):
             'updated',
             'created',
         ]
-        read_only_fields = ['id', 'created', 'updated']
+        read_only_fields = ['id', 'profile_image_placeholder', 'created', 'updated']
     
     def get_profile_image_url(self, obj):
         """Get full URL for profile image."""
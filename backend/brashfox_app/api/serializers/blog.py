@@ -5,6 +5,7 @@ from django.contrib.auth.models import User
 from rest_framework import serializers
 from django.utils.text import slugify
 from brashfox_app.models import BlogPost, PostCategory
+from brashfox_app.api.services import BlogPostService
 from .user import UserSerializer
 
 
@@ -17,7 +18,6 @@ class BlogPostListSerializer(serializers.ModelSerializer):
         write_only=True,
         required=False
     )
-    comments_count = serializers.SerializerMethodField()
     excerpt = serializers.SerializerMethodField()
     
     class Meta:
@@ -26,10 +26,7 @@ class BlogPostListSerializer(serializers.ModelSerializer):
             'id', 'title', 'excerpt', 'slug', 'author', 'author_id',
             'created', 'edited', 'comments_count'
         ]
-        read_only_fields = ['id', 'slug', 'created', 'edited']
-    
-    def get_comments_count(self, obj):
-        return obj.comments.count()
+        read_only_fields = ['id', 'slug', 'created', 'edited', 'comments_count']
     
     def get_excerpt(self, obj):
         """Return first 200 characters of post"""
@@ -45,7 +42,6 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
         write_only=True,
         required=False
     )
-    comments_count = serializers.SerializerMethodField()
     
     class Meta:
         model = BlogPost
@@ -53,27 +49,26 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
             'id', 'title', 'post', 'slug', 'author', 'author_id',
             'created', 'edited', 'comments_count'
         ]
-        read_only_fields = ['id', 'slug', 'created', 'edited']
-    
-    def get_comments_count(self, obj):
-        return obj.comments.count()
+        read_only_fields = ['id', 'slug', 'created', 'edited', 'comments_count']
     
     def create(self, validated_data):
-        # Auto-generate slug from title
-        if 'title' in validated_data:
-            validated_data['slug'] = slugify(validated_data['title'])
-        
         # Set author from request user if not provided
+        author = validated_data.get('author')
         request = self.context.get('request')
-        if request and not validated_data.get('author'):
-            validated_data['author'] = request.user
+        if request and not author:
+            author = request.user
         
-        return super().create(validated_data)
+        # Slug is allocated from the title by the service
+        return BlogPostService.create_post(author, validated_data)
     
     def update(self, instance, validated_data):
-        # Update slug if title changed
+        # Re-allocate slug if title changed
         if 'title' in validated_data and validated_data['title'] != instance.title:
-            validated_data['slug'] = slugify(validated_data['title'])
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            return BlogPostService.save_with_unique_slug(
+                instance, slugify(validated_data['title'])
+            )
         
         return super().update(instance, validated_data)
 
@@ -94,4 +89,8 @@ class PostCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
     
     def get_posts_count(self, obj):
-        return obj.blog_post.count()
+        # Annotated by PostCategoryViewSet; fall back for unannotated instances
+        count = getattr(obj, 'posts_count', None)
+        if count is None:
+            count = obj.blog_post.count()
+        return count
@@ -8,8 +8,8 @@ from brashfox_app.models import Message
 class MessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = Message
-        fields = ['id', 'name', 'email', 'topic', 'message', 'created']
-        read_only_fields = ['id', 'created']
+        fields = ['id', 'name', 'email', 'topic', 'message', 'created', 'edited']
+        read_only_fields = ['id', 'created', 'edited']
     
     def validate_email(self, value):
         """Validate email format"""
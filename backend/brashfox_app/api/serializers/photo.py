@@ -1,8 +1,8 @@
 """
-Photo-related serializers: FotoCategory, FotoDescription, FotoTags
+Photo-related serializers: FotoCategory, FotoDescription, FotoTags, PhotoUpload
 """
 from rest_framework import serializers
-from brashfox_app.models import FotoCategory, FotoDescription, FotoTags
+from brashfox_app.models import FotoCategory, FotoDescription, FotoTags, PhotoUpload
 
 
 class FotoCategorySerializer(serializers.ModelSerializer):
@@ -14,54 +14,93 @@ class FotoCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
     
     def get_photos_count(self, obj):
-        return obj.photos.count()
+        # Annotated by FotoCategoryViewSet; fall back for unannotated instances
+        count = getattr(obj, 'photos_count', None)
+        if count is None:
+            count = obj.photos.count()
+        return count
+
+
+class FotoCategoryNestedSerializer(serializers.ModelSerializer):
+    """Category embedded in photo payloads - no per-row count"""
+    
+    class Meta:
+        model = FotoCategory
+        fields = ['id', 'category']
+        read_only_fields = fields
 
 
 class FotoDescriptionListSerializer(serializers.ModelSerializer):
     """Serializer for listing photos - minimal data"""
-    foto_category = FotoCategorySerializer(read_only=True)
+    foto_category = FotoCategoryNestedSerializer(read_only=True)
     foto_category_id = serializers.PrimaryKeyRelatedField(
         queryset=FotoCategory.objects.all(),
         source='foto_category',
         write_only=True
     )
+    srcset = serializers.SerializerMethodField()
+    # Reads the prefetched `tags` relation - prefetch it in the view
+    tags = serializers.SlugRelatedField(slug_field='tags', many=True, read_only=True)
     
     class Meta:
         model = FotoDescription
         fields = [
-            'id', 'name', 'author', 'event', 'image', 
-            'foto_category', 'foto_category_id', 'created', 'edited'
+            'id', 'name', 'author', 'event', 'image', 'srcset', 'placeholder',
+            'width', 'height', 'file_size', 'image_format', 'orientation',
+            'processing_status', 'foto_category', 'foto_category_id', 'tags',
+            'created', 'edited'
         ]
-        read_only_fields = ['id', 'created', 'edited']
+        read_only_fields = [
+            'id', 'placeholder', 'width', 'height', 'file_size', 'image_format',
+            'orientation', 'processing_status', 'created', 'edited',
+        ]
+    
+    def get_srcset(self, obj):
+        """Return URL and dimensions of every generated image variant"""
+        # Variants of a replaced image are stale until the worker catches up
+        if obj.processing_status != FotoDescription.PROCESSING_READY or not obj.variants:
+            return None
+        
+        request = self.context.get('request')
+        storage = obj.image.storage
+        srcset = {}
+        for variant, data in obj.variants.items():
+            url = storage.url(data['path'])
+            srcset[variant] = {
+                'url': request.build_absolute_uri(url) if request else url,
+                'width': data['width'],
+                'height': data['height'],
+            }
+        return srcset
 
 
 class FotoDescriptionDetailSerializer(serializers.ModelSerializer):
     """Serializer for photo details - full data with tags"""
-    foto_category = FotoCategorySerializer(read_only=True)
+    foto_category = FotoCategoryNestedSerializer(read_only=True)
     foto_category_id = serializers.PrimaryKeyRelatedField(
         queryset=FotoCategory.objects.all(),
         source='foto_category',
         write_only=True
     )
-    tags = serializers.SerializerMethodField()
+    tags = serializers.SlugRelatedField(slug_field='tags', many=True, read_only=True)
     
     class Meta:
         model = FotoDescription
         fields = [
-            'id', 'name', 'author', 'event', 'image',
-            'foto_category', 'foto_category_id', 'tags',
+            'id', 'name', 'author', 'event', 'image', 'placeholder',
+            'width', 'height', 'file_size', 'image_format', 'orientation',
+            'processing_status', 'foto_category', 'foto_category_id', 'tags',
             'created', 'edited'
         ]
-        read_only_fields = ['id', 'created', 'edited']
-    
-    def get_tags(self, obj):
-        # Get all tags related to this photo
-        tags = FotoTags.objects.filter(foto_description=obj)
-        return [tag.tags for tag in tags]
+        read_only_fields = [
+            'id', 'placeholder', 'width', 'height', 'file_size', 'image_format',
+            'orientation', 'processing_status', 'created', 'edited',
+        ]
 
 
 class FotoTagsSerializer(serializers.ModelSerializer):
-    photos = FotoDescriptionListSerializer(source='foto_description', many=True, read_only=True)
+    """Serializer for tags - compact tag-cloud data"""
+    photo_count = serializers.SerializerMethodField()
     photo_ids = serializers.PrimaryKeyRelatedField(
         queryset=FotoDescription.objects.all(),
         source='foto_description',
@@ -71,5 +110,40 @@ class FotoTagsSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = FotoTags
-        fields = ['id', 'tags', 'photos', 'photo_ids']
+        fields = ['id', 'tags', 'photo_count', 'photo_ids']
         read_only_fields = ['id']
+    
+    def get_photo_count(self, obj):
+        # Annotated by FotoTagsViewSet; fall back for unannotated instances
+        count = getattr(obj, 'photo_count', None)
+        if count is None:
+            count = obj.foto_description.count()
+        return count
+    
+    def validate_tags(self, value):
+        """Tags are unique regardless of case and spacing"""
+        duplicates = FotoTags.objects.filter(normalized=FotoTags.normalize(value))
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError('Taki tag już istnieje.')
+        return value
+
+
+class FotoTagsExpandedSerializer(FotoTagsSerializer):
+    """Serializer for tags with embedded photos (?expand=photos)"""
+    photos = FotoDescriptionListSerializer(source='foto_description', many=True, read_only=True)
+    
+    class Meta(FotoTagsSerializer.Meta):
+        fields = FotoTagsSerializer.Meta.fields + ['photos']
+
+
+class PhotoUploadSerializer(serializers.ModelSerializer):
+    """Resumable upload session - clients resume from `received_ranges`"""
+    complete = serializers.BooleanField(source='is_complete', read_only=True)
+    
+    class Meta:
+        model = PhotoUpload
+        fields = ['id', 'filename', 'size', 'received', 'received_ranges', 'complete', 'created']
+        read_only_fields = ['id', 'received', 'received_ranges', 'created']
+        extra_kwargs = {'size': {'min_value': 1}}
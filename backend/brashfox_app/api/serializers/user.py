@@ -4,6 +4,8 @@ User and Group serializers
 from django.contrib.auth.models import Group, User
 from rest_framework import serializers
 
+from brashfox_app.models import AuthorStats
+
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for User model - used for nested representations"""
@@ -15,7 +17,11 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
     
     def get_blog_posts_count(self, obj):
-        return obj.blog_posts.count()
+        # Stored counter (select_related('author_stats') to avoid a query)
+        try:
+            return obj.author_stats.blog_posts_count
+        except AuthorStats.DoesNotExist:
+            return 0
 
 
 class UserCreateSerializer(serializers.ModelSerializer):
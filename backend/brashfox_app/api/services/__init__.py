@@ -9,13 +9,25 @@ Organization:
 - BlogPostService: Post creation, updates, slug management
 - CommentService: Comment creation and validation
 - PhotoService: Photo upload, validation, queries
+- ImageBlobService: Content-addressed, reference-counted photo files
+- ImageVariantService: Thumbnail/medium/large renditions of photos
+- ImageProcessingService: Background queue for variant generation
+- UploadService: Resumable chunked photo uploads
 - MessageService: Contact messages, notifications
+- OutboxService: Deferred, batched e-mail delivery
+- BlogSearchService: Full-text search index for blog posts
+- TagSuggestService: In-memory prefix index for tag autocomplete
 """
 
 from .user_service import UserService
 from .blog_service import BlogPostService, CommentService
 from .photo_service import PhotoService
+from .image_service import ImageBlobService, ImageVariantService, ImageProcessingService
+from .upload_service import UploadService
 from .message_service import MessageService
+from .outbox_service import OutboxService
+from .search_service import BlogSearchService
+from .tag_service import TagSuggestService
 
 
 __all__ = [
@@ -23,5 +35,12 @@ __all__ = [
     'BlogPostService',
     'CommentService',
     'PhotoService',
+    'ImageBlobService',
+    'ImageVariantService',
+    'ImageProcessingService',
+    'UploadService',
     'MessageService',
+    'OutboxService',
+    'BlogSearchService',
+    'TagSuggestService',
 ]
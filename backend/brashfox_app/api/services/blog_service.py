@@ -1,11 +1,13 @@
 """
 Blog Service - Business logic for blog posts
 """
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils.text import slugify
 from rest_framework.exceptions import ValidationError
 
-from brashfox_app.models import BlogPost, PostComments
+from brashfox_app.models import AuthorStats, BlogPost, PostComments
 from brashfox_app.api.utils.helpers import generate_unique_slug
 from brashfox_app.api.utils.validators import validate_comment_length
 
@@ -16,8 +18,44 @@ class BlogPostService:
     - Post creation with auto-slug generation
     - Post updates with slug validation
     - Comment management
+    - Denormalized comment/post counters
     """
     
+    # Inserts retried when a concurrent request takes the same slug
+    SLUG_ALLOCATION_ATTEMPTS = 5
+    
+    @staticmethod
+    def save_with_unique_slug(post, base_slug):
+        """
+        Allocate a free slug for a post and save it.
+        
+        The free suffix is found in one query; if another request inserts
+        the same slug in between, the unique constraint fails and the
+        allocation is retried.
+        
+        Args:
+            post: BlogPost instance (new or existing)
+            base_slug: Slug to derive from (e.g. slugified title)
+            
+        Returns:
+            Saved BlogPost instance
+            
+        Raises:
+            IntegrityError: If no slug could be saved after all attempts
+        """
+        base_slug = base_slug or 'post'
+        attempts = BlogPostService.SLUG_ALLOCATION_ATTEMPTS
+        
+        for attempt in range(1, attempts + 1):
+            post.slug = generate_unique_slug(BlogPost, base_slug, instance_id=post.pk)
+            try:
+                with transaction.atomic():
+                    post.save()
+                return post
+            except IntegrityError:
+                if attempt == attempts:
+                    raise
+    
     @staticmethod
     def create_post(author, validated_data):
         """
@@ -29,29 +67,15 @@ class BlogPostService:
             
         Returns:
             BlogPost instance
-            
-        Raises:
-            ValidationError: If slug already exists
         """
-        title = validated_data.get('title')
-        slug = validated_data.get('slug')
+        data = dict(validated_data)
+        data.pop('author', None)
         
         # Auto-generate slug if not provided
-        if not slug:
-            slug = slugify(title)
+        base_slug = data.pop('slug', None) or slugify(data.get('title', ''))
         
-        # Ensure slug uniqueness using helper
-        slug = generate_unique_slug(BlogPost, slug)
-        
-        validated_data['slug'] = slug
-        
-        with transaction.atomic():
-            post = BlogPost.objects.create(
-                author=author,
-                **validated_data
-            )
-        
-        return post
+        post = BlogPost(author=author, **data)
+        return BlogPostService.save_with_unique_slug(post, base_slug)
     
     @staticmethod
     def update_post(post, validated_data):
@@ -89,6 +113,93 @@ class BlogPostService:
         return post.comments.select_related('author').order_by('-created')
 
 
+    @staticmethod
+    def adjust_comments_count(post_id, delta):
+        """
+        Add delta to a post's stored comment counter (F() increment).
+        
+        Args:
+            post_id: BlogPost primary key
+            delta: +1 on comment create, -1 on delete
+        """
+        BlogPost.objects.filter(pk=post_id).update(
+            comments_count=F('comments_count') + delta
+        )
+    
+    @staticmethod
+    def adjust_author_posts_count(author_id, delta):
+        """
+        Add delta to an author's stored post counter (F() increment).
+        The stats row is created from a real COUNT on the author's first post.
+        
+        Args:
+            author_id: User primary key
+            delta: +1 on post create, -1 on delete
+        """
+        updated = AuthorStats.objects.filter(user_id=author_id).update(
+            blog_posts_count=F('blog_posts_count') + delta
+        )
+        if updated or delta < 0:
+            return
+        
+        try:
+            with transaction.atomic():
+                AuthorStats.objects.create(
+                    user_id=author_id,
+                    blog_posts_count=BlogPost.objects.filter(author_id=author_id).count(),
+                )
+        except IntegrityError:
+            # Created concurrently - our post isn't in its COUNT yet
+            AuthorStats.objects.filter(user_id=author_id).update(
+                blog_posts_count=F('blog_posts_count') + delta
+            )
+    
+    @staticmethod
+    def recount():
+        """
+        Recompute stored counters from the source tables.
+        
+        Returns:
+            Tuple (posts, authors) - number of corrected rows
+        """
+        comments = (
+            PostComments.objects
+            .filter(blog_post=OuterRef('pk'))
+            .order_by()
+            .values('blog_post')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        posts_fixed = (
+            BlogPost.objects
+            .annotate(real_count=Coalesce(Subquery(comments), Value(0)))
+            .exclude(comments_count=F('real_count'))
+            .update(comments_count=Coalesce(Subquery(comments), Value(0)))
+        )
+        
+        real = dict(
+            BlogPost.objects.order_by()
+            .values_list('author').annotate(total=Count('pk'))
+        )
+        stored = dict(AuthorStats.objects.values_list('user_id', 'blog_posts_count'))
+        authors_fixed = 0
+        with transaction.atomic():
+            for user_id, count in stored.items():
+                if real.get(user_id, 0) != count:
+                    AuthorStats.objects.filter(user_id=user_id).update(
+                        blog_posts_count=real.get(user_id, 0)
+                    )
+                    authors_fixed += 1
+            missing = [
+                AuthorStats(user_id=user_id, blog_posts_count=count)
+                for user_id, count in real.items() if user_id not in stored
+            ]
+            AuthorStats.objects.bulk_create(missing, ignore_conflicts=True)
+            authors_fixed += len(missing)
+        
+        return posts_fixed, authors_fixed
+
+
 class CommentService:
     """
     Handles comment-related business logic:
@@ -0,0 +1,526 @@
+"""
+Image Service - Content-addressed image storage, responsive variant
+generation and its background queue
+"""
+import base64
+import hashlib
+import os
+from datetime import timedelta
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from brashfox_app.models import FotoDescription, ImageBlob, ImageProcessingJob
+from brashfox_app.api.utils.constants import FileUpload
+
+
+class ImageBlobService:
+    """
+    Handles content-addressed storage of photo files:
+    - Streaming SHA-256 of uploads (chunk by chunk, never fully in memory)
+    - One stored file per distinct content, shared by every photo using it
+    - Reference counting, so a file is deleted only with its last photo
+    """
+
+    UPLOAD_DIRECTORY = 'photos'
+
+    @staticmethod
+    def hash_file(file):
+        """
+        Compute the SHA-256 of a file in chunks.
+
+        Args:
+            file: Django File/UploadedFile
+
+        Returns:
+            Tuple (hex digest, size in bytes)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in file.chunks():
+            digest.update(chunk)
+            size += len(chunk)
+        return digest.hexdigest(), size
+
+    @staticmethod
+    def blob_path(sha256, filename):
+        """
+        Build the storage path of a blob.
+
+        Args:
+            sha256: Hex digest of the content
+            filename: Original file name (only its extension is kept)
+
+        Returns:
+            String path like 'photos/ab/ab12...ef.jpg'
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        return f"{ImageBlobService.UPLOAD_DIRECTORY}/{sha256[:2]}/{sha256}{extension}"
+
+    @staticmethod
+    def acquire(file, storage=None):
+        """
+        Store an uploaded file, or reuse the stored copy of identical content,
+        and take one reference on it.
+
+        Call inside the transaction that saves the photo pointing at the blob.
+
+        Args:
+            file: Django File/UploadedFile
+            storage: Storage backend (default: default_storage)
+
+        Returns:
+            ImageBlob instance
+        """
+        storage = storage or default_storage
+        sha256, size = ImageBlobService.hash_file(file)
+
+        if ImageBlob.objects.filter(sha256=sha256).update(ref_count=F('ref_count') + 1):
+            return ImageBlob.objects.get(sha256=sha256)
+
+        path = ImageBlobService.blob_path(sha256, file.name)
+        # The path is derived from the content, so a file already there
+        # (e.g. left by a rolled back upload) holds the same bytes
+        if not storage.exists(path):
+            saved_path = storage.save(path, file)
+            if saved_path != path:
+                # Saved concurrently by another upload
+                storage.delete(saved_path)
+
+        try:
+            with transaction.atomic():
+                return ImageBlob.objects.create(
+                    sha256=sha256, path=path, size=size, ref_count=1
+                )
+        except IntegrityError:
+            # Another upload of the same content created the row first
+            ImageBlob.objects.filter(sha256=sha256).update(ref_count=F('ref_count') + 1)
+            return ImageBlob.objects.get(sha256=sha256)
+
+    @staticmethod
+    def release(blob_id, storage=None):
+        """
+        Drop one reference; the last one deletes the blob and, after
+        commit, its file and variant files.
+
+        Args:
+            blob_id: ImageBlob primary key
+            storage: Storage backend (default: default_storage)
+        """
+        storage = storage or default_storage
+        ImageBlob.objects.filter(pk=blob_id, ref_count__gt=0).update(
+            ref_count=F('ref_count') - 1
+        )
+
+        blob = ImageBlob.objects.filter(pk=blob_id, ref_count=0).first()
+        if blob is None:
+            return
+        # Conditional delete: a concurrent acquire() may have revived it
+        deleted, _ = ImageBlob.objects.filter(pk=blob_id, ref_count=0).delete()
+        if deleted:
+            transaction.on_commit(
+                lambda: ImageBlobService.delete_files(blob.sha256, blob.path, storage)
+            )
+
+    @staticmethod
+    def adopt(photo):
+        """
+        Attach a photo stored before deduplication to a blob.
+
+        The first photo with given content turns its file into the blob
+        (in place); later duplicates are pointed at that blob and their own
+        file and variants are deleted after commit.
+
+        Args:
+            photo: FotoDescription instance without image_blob
+
+        Returns:
+            Tuple (merged, bytes freed) - merged is False for adopted files
+        """
+        storage = photo.image.storage
+        old_name = photo.image.name
+        with storage.open(old_name, 'rb') as file:
+            sha256, size = ImageBlobService.hash_file(file)
+
+        with transaction.atomic():
+            if not ImageBlob.objects.filter(sha256=sha256).update(
+                ref_count=F('ref_count') + 1
+            ):
+                photo.image_blob = ImageBlob.objects.create(
+                    sha256=sha256, path=old_name, size=size, ref_count=1
+                )
+                photo.save(update_fields=['image_blob'])
+                return False, 0
+
+            blob = ImageBlob.objects.get(sha256=sha256)
+            photo.image_blob = blob
+            if blob.path == old_name:
+                # Several rows pointing at one file: nothing to delete
+                photo.save(update_fields=['image_blob'])
+                return False, 0
+
+            ImageVariantService.delete_variants(photo)
+            photo.image = blob.path
+            photo.save(update_fields=['image', 'image_blob', 'variants'])
+            ImageProcessingService.enqueue(photo)
+
+            def delete_duplicate():
+                if not FotoDescription.objects.filter(image=old_name).exists():
+                    storage.delete(old_name)
+
+            transaction.on_commit(delete_duplicate)
+
+        return True, size
+
+    @staticmethod
+    def delete_files(sha256, path, storage=None):
+        """
+        Remove a blob's file and its variants, unless the content
+        has been uploaded (and the blob recreated) again meanwhile.
+        """
+        storage = storage or default_storage
+        if ImageBlob.objects.filter(sha256=sha256).exists():
+            return
+
+        paths = [path] + [
+            ImageVariantService.variant_path(path, variant)
+            for variant in FileUpload.IMAGE_VARIANTS
+        ]
+        for file_path in paths:
+            if storage.exists(file_path):
+                storage.delete(file_path)
+
+
+class ImageVariantService:
+    """
+    Handles resized renditions of photo uploads:
+    - Thumbnail/medium/large generation with Pillow
+    - Variant path and dimension bookkeeping
+    - Cleanup of stale variant files
+    """
+
+    @staticmethod
+    def variant_path(image_name, variant):
+        """
+        Build storage path for a variant of an image.
+
+        Args:
+            image_name: Storage name of the original image (e.g. 'photos/a.jpg')
+            variant: Variant name (e.g. 'thumbnail')
+
+        Returns:
+            String path like 'photos/variants/a_thumbnail.webp'
+        """
+        directory, filename = os.path.split(image_name)
+        stem = os.path.splitext(filename)[0]
+        return os.path.join(
+            directory, 'variants', f"{stem}_{variant}.{FileUpload.VARIANT_EXTENSION}"
+        )
+
+    @staticmethod
+    def render_variants(source):
+        """
+        Resize an image into every configured variant.
+
+        Runs without touching the database, so it is safe to call
+        from worker processes.
+
+        Args:
+            source: Path, bytes or file-like object with the original image
+
+        Returns:
+            Dictionary {variant: (bytes, width, height)}
+        """
+        if isinstance(source, bytes):
+            source = BytesIO(source)
+
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ('RGB', 'RGBA'):
+                has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+                image = image.convert('RGBA' if has_alpha else 'RGB')
+
+            rendered = {}
+            for variant, size in FileUpload.IMAGE_VARIANTS.items():
+                resized = image.copy()
+                resized.thumbnail(size, Image.LANCZOS)
+
+                buffer = BytesIO()
+                resized.save(
+                    buffer,
+                    format=FileUpload.VARIANT_FORMAT,
+                    quality=FileUpload.VARIANT_QUALITY,
+                )
+                rendered[variant] = (buffer.getvalue(), resized.width, resized.height)
+
+        return rendered
+
+    @staticmethod
+    def render_placeholder(source):
+        """
+        Render a tiny blurred-on-upscale preview (LQIP) of an image.
+
+        Args:
+            source: Path, bytes or file-like object with the image
+
+        Returns:
+            String 'data:image/webp;base64,...' (a few hundred bytes)
+        """
+        if isinstance(source, bytes):
+            source = BytesIO(source)
+
+        with Image.open(source) as image:
+            # JPEG: decode at reduced scale, the output is 20px anyway
+            image.draft('RGB', FileUpload.PLACEHOLDER_SIZE)
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+            image.thumbnail(FileUpload.PLACEHOLDER_SIZE, Image.LANCZOS)
+
+            buffer = BytesIO()
+            image.save(buffer, format='WEBP', quality=FileUpload.PLACEHOLDER_QUALITY)
+
+        encoded = base64.b64encode(buffer.getvalue()).decode('ascii')
+        return f'data:image/webp;base64,{encoded}'
+
+    @staticmethod
+    def read_source(photo):
+        """
+        Get something Pillow can open for a photo's image.
+
+        Returns the local file path when the storage has one (cheap to pass
+        to worker processes), otherwise the raw bytes.
+
+        Args:
+            photo: FotoDescription instance
+
+        Returns:
+            String path or bytes
+        """
+        try:
+            return photo.image.path
+        except NotImplementedError:
+            photo.image.open('rb')
+            try:
+                return photo.image.read()
+            finally:
+                photo.image.close()
+
+    @staticmethod
+    def store_variants(photo, rendered):
+        """
+        Save rendered variants to storage and record them on the photo.
+
+        Args:
+            photo: FotoDescription instance
+            rendered: Output of render_variants()
+
+        Returns:
+            Dictionary with variant paths and dimensions
+        """
+        # Variant paths derive from the image name, so this overwrites the
+        # previous rendering of the same file. Variants of a replaced image
+        # go with that image (PhotoService.update_photo, ImageBlobService).
+        storage = photo.image.storage
+        variants = {}
+        for variant, (content, width, height) in rendered.items():
+            path = ImageVariantService.variant_path(photo.image.name, variant)
+            if storage.exists(path):
+                storage.delete(path)
+            saved_path = storage.save(path, ContentFile(content))
+            variants[variant] = {
+                'path': saved_path,
+                'width': width,
+                'height': height,
+            }
+
+        # The smallest rendition is the cheapest source for the placeholder
+        smallest = min(rendered.values(), key=lambda item: item[1] * item[2])
+        photo.placeholder = ImageVariantService.render_placeholder(smallest[0])
+
+        photo.variants = variants
+        photo.processing_status = FotoDescription.PROCESSING_READY
+        photo.save(update_fields=['variants', 'placeholder', 'processing_status'])
+        return variants
+
+    @staticmethod
+    def generate_variants(photo):
+        """
+        Generate and store all variants for a photo's image (synchronously).
+
+        Args:
+            photo: FotoDescription instance with a saved image
+
+        Returns:
+            Dictionary with variant paths and dimensions (also saved on photo)
+        """
+        if not photo.image:
+            ImageVariantService.delete_variants(photo)
+            return {}
+
+        source = ImageVariantService.read_source(photo)
+        rendered = ImageVariantService.render_variants(source)
+        return ImageVariantService.store_variants(photo, rendered)
+
+    @staticmethod
+    def delete_variants(photo):
+        """
+        Remove variant files of a photo from storage.
+
+        Args:
+            photo: FotoDescription instance
+        """
+        if not photo.variants:
+            return
+
+        storage = photo.image.storage
+        for data in photo.variants.values():
+            path = data.get('path')
+            if path and storage.exists(path):
+                storage.delete(path)
+        photo.variants = {}
+
+
+class ImageProcessingService:
+    """
+    Handles the DB-backed image processing queue:
+    - Enqueueing photos after upload
+    - Claiming jobs for `manage.py process_images`
+    - Recording job results on photos
+    """
+
+    # A claimed job is hidden from other workers for this long;
+    # if the worker dies, the job is claimed again afterwards.
+    CLAIM_LEASE = timedelta(minutes=10)
+
+    @staticmethod
+    def enqueue(photo):
+        """
+        Mark a photo as pending and queue variant generation
+        (or reuse the variants of its already processed blob).
+
+        Call inside the transaction that saved the photo, so the job
+        only becomes visible together with the photo.
+
+        Args:
+            photo: FotoDescription instance
+
+        Returns:
+            ImageProcessingJob instance, or None when the photo's blob
+            already has variants
+        """
+        if photo.image_blob_id:
+            # Same file already processed for another photo: share its variants
+            processed = (
+                FotoDescription.objects
+                .filter(
+                    image_blob_id=photo.image_blob_id,
+                    processing_status=FotoDescription.PROCESSING_READY,
+                )
+                .exclude(pk=photo.pk)
+                .values_list('variants', 'placeholder')
+                .first()
+            )
+            if processed and processed[0]:
+                photo.variants, photo.placeholder = processed
+                photo.processing_status = FotoDescription.PROCESSING_READY
+                photo.save(update_fields=['variants', 'placeholder', 'processing_status'])
+                return None
+
+        if photo.processing_status != FotoDescription.PROCESSING_PENDING or photo.placeholder:
+            # The placeholder of a replaced image is stale like its variants
+            photo.processing_status = FotoDescription.PROCESSING_PENDING
+            photo.placeholder = ''
+            photo.save(update_fields=['processing_status', 'placeholder'])
+
+        # Older jobs for the same photo would only redo the same work
+        ImageProcessingJob.objects.filter(
+            photo=photo,
+            status=ImageProcessingJob.STATUS_PENDING,
+        ).delete()
+
+        return ImageProcessingJob.objects.create(photo=photo)
+
+    @staticmethod
+    def claim_jobs(limit):
+        """
+        Atomically take up to `limit` pending jobs, plus processing jobs
+        whose claim is older than CLAIM_LEASE (their worker died).
+
+        Uses SKIP LOCKED where supported, so several workers can share
+        the queue without processing the same job twice.
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            List of ImageProcessingJob instances (with photo loaded)
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                ImageProcessingJob.objects
+                .filter(
+                    Q(status=ImageProcessingJob.STATUS_PENDING)
+                    | Q(
+                        status=ImageProcessingJob.STATUS_PROCESSING,
+                        updated__lt=now - ImageProcessingService.CLAIM_LEASE,
+                    )
+                )
+                .order_by('created')
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)[:limit]
+            )
+            # update() skips auto_now; `updated` is the claim time
+            ImageProcessingJob.objects.filter(id__in=ids).update(
+                status=ImageProcessingJob.STATUS_PROCESSING,
+                attempts=F('attempts') + 1,
+                updated=now,
+            )
+
+        return list(
+            ImageProcessingJob.objects
+            .filter(id__in=ids)
+            .select_related('photo')
+            .order_by('created')
+        )
+
+    @staticmethod
+    def complete_job(job, rendered):
+        """
+        Store rendered variants and mark the job as done.
+
+        Args:
+            job: ImageProcessingJob instance
+            rendered: Output of ImageVariantService.render_variants()
+        """
+        ImageVariantService.store_variants(job.photo, rendered)
+        job.status = ImageProcessingJob.STATUS_DONE
+        job.error = ''
+        job.save(update_fields=['status', 'error', 'updated'])
+
+    @staticmethod
+    def fail_job(job, error, max_attempts):
+        """
+        Record a failed attempt; requeue until attempts are exhausted.
+
+        Args:
+            job: ImageProcessingJob instance
+            error: Exception or message
+            max_attempts: Attempts after which the job is given up
+        """
+        job.error = str(error)
+        if job.attempts >= max_attempts:
+            job.status = ImageProcessingJob.STATUS_FAILED
+            # save(), not update(): post_save invalidates cached photo responses
+            photo = job.photo
+            photo.processing_status = FotoDescription.PROCESSING_FAILED
+            photo.save(update_fields=['processing_status', 'edited'])
+        else:
+            job.status = ImageProcessingJob.STATUS_PENDING
+        job.save(update_fields=['status', 'error', 'updated'])
@@ -1,79 +1,82 @@
 """
 Message Service - Business logic for contact messages
 """
-from django.core.mail import send_mail
 from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
+from rest_framework.exceptions import ValidationError
 
 from brashfox_app.models import Message
 from brashfox_app.api.utils.validators import validate_message_length
+from .outbox_service import OutboxService
 
 
 class MessageService:
     """
     Handles contact form message business logic:
     - Message validation
-    - Email notifications
+    - Email notifications (queued in the outbox)
     - Spam prevention
     """
     
     @staticmethod
     def create_message(validated_data):
         """
-        Create a contact message and optionally send notification.
+        Create a contact message and queue the admin notification.
         
         Args:
-            validated_data: Dictionary with message data (name, email, subject, message)
+            validated_data: Dictionary with message data (name, email, topic, message)
             
         Returns:
             Message instance
         """
         # Validate using centralized validator
-        validate_message_length(validated_data['message'])
+        try:
+            validate_message_length(validated_data['message'])
+        except DjangoValidationError as exc:
+            raise ValidationError({'message': exc.messages})
         
         with transaction.atomic():
             message = Message.objects.create(**validated_data)
             
-            # Send email notification to admin (if configured)
-            MessageService.send_admin_notification(message)
+            # Queue email notification to admin (if configured);
+            # delivered later by `manage.py deliver_outbox`
+            MessageService.queue_admin_notification(message)
         
         return message
     
     @staticmethod
-    def send_admin_notification(message):
+    def queue_admin_notification(message):
         """
-        Send email notification to admin about new contact message.
+        Queue email notification to admin about new contact message.
         
         Args:
             message: Message instance
+            
+        Returns:
+            OutgoingEmail instance or None if no admins are configured
         """
-        if not hasattr(settings, 'ADMINS') or not settings.ADMINS:
-            return
+        if not getattr(settings, 'ADMINS', None):
+            return None
         
-        try:
-            admin_emails = [email for name, email in settings.ADMINS]
-            
-            send_mail(
-                subject=f'New Contact Message: {message.subject}',
-                message=f"""
+        admin_emails = [email for name, email in settings.ADMINS]
+        
+        return OutboxService.enqueue(
+            subject=f'New Contact Message: {message.topic}',
+            body=f"""
 New contact form submission:
 
 From: {message.name} <{message.email}>
-Subject: {message.subject}
+Subject: {message.topic}
 
 Message:
 {message.message}
 
 ---
 Sent: {message.created}
-                """.strip(),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=admin_emails,
-                fail_silently=True,
-            )
-        except Exception:
-            # Don't fail message creation if email fails
-            pass
+            """.strip(),
+            recipients=admin_emails,
+        )
     
     @staticmethod
     def mark_as_read(message):
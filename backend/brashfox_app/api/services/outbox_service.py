@@ -0,0 +1,165 @@
+"""
+Outbox Service - Deferred e-mail delivery
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from brashfox_app.models import OutgoingEmail
+
+
+class OutboxService:
+    """
+    Handles the transactional e-mail outbox:
+    - Queueing e-mails inside the caller's transaction
+    - Claiming due e-mails for `manage.py deliver_outbox`
+    - Batched delivery over one SMTP connection with retry/backoff
+    """
+
+    # A claimed e-mail is hidden from other workers for this long;
+    # if the worker dies, the e-mail becomes due again afterwards.
+    CLAIM_LEASE = timedelta(minutes=5)
+
+    # Retry delays: BACKOFF_BASE * 2 ** (attempt - 1), capped at BACKOFF_MAX
+    BACKOFF_BASE = timedelta(minutes=1)
+    BACKOFF_MAX = timedelta(hours=6)
+
+    MAX_ATTEMPTS = 8
+
+    @staticmethod
+    def enqueue(subject, body, recipients, from_email=None):
+        """
+        Queue an e-mail for delivery.
+
+        Call inside the transaction that creates the data the e-mail is
+        about - the row is committed (or rolled back) together with it.
+
+        Args:
+            subject: E-mail subject
+            body: Plain text body
+            recipients: List of addresses
+            from_email: Sender (defaults to settings.DEFAULT_FROM_EMAIL)
+
+        Returns:
+            OutgoingEmail instance
+        """
+        return OutgoingEmail.objects.create(
+            subject=subject[:255],
+            body=body,
+            recipients=list(recipients),
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        )
+
+    @staticmethod
+    def claim_batch(limit):
+        """
+        Atomically take up to `limit` due e-mails.
+
+        Args:
+            limit: Maximum number of e-mails to claim
+
+        Returns:
+            List of OutgoingEmail instances
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                OutgoingEmail.objects
+                .filter(status=OutgoingEmail.STATUS_PENDING, next_attempt__lte=now)
+                .order_by('next_attempt')
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)[:limit]
+            )
+            OutgoingEmail.objects.filter(id__in=ids).update(
+                attempts=F('attempts') + 1,
+                next_attempt=now + OutboxService.CLAIM_LEASE,
+            )
+
+        return list(OutgoingEmail.objects.filter(id__in=ids).order_by('created'))
+
+    @staticmethod
+    def retry_delay(attempts):
+        """
+        Backoff before the next attempt.
+
+        Args:
+            attempts: Number of attempts made so far
+
+        Returns:
+            timedelta
+        """
+        delay = OutboxService.BACKOFF_BASE * (2 ** max(attempts - 1, 0))
+        return min(delay, OutboxService.BACKOFF_MAX)
+
+    @staticmethod
+    def deliver_batch(emails, max_attempts=None, connection=None):
+        """
+        Send e-mails over a single connection and record the outcome.
+
+        Args:
+            emails: OutgoingEmail instances (claimed)
+            max_attempts: Attempts after which an e-mail is given up
+            connection: E-mail backend connection (default: get_connection())
+
+        Returns:
+            Tuple (sent, failed) counts
+        """
+        max_attempts = max_attempts or OutboxService.MAX_ATTEMPTS
+        if not emails:
+            return 0, 0
+
+        connection = connection or get_connection()
+        sent = failed = 0
+        try:
+            connection.open()
+        except Exception as exc:
+            for email in emails:
+                OutboxService.record_failure(email, exc, max_attempts)
+            return 0, len(emails)
+
+        try:
+            for email in emails:
+                message = EmailMessage(
+                    subject=email.subject,
+                    body=email.body,
+                    from_email=email.from_email,
+                    to=email.recipients,
+                    connection=connection,
+                )
+                try:
+                    message.send()
+                except Exception as exc:
+                    OutboxService.record_failure(email, exc, max_attempts)
+                    failed += 1
+                    continue
+
+                email.status = OutgoingEmail.STATUS_SENT
+                email.sent = timezone.now()
+                email.last_error = ''
+                email.save(update_fields=['status', 'sent', 'last_error'])
+                sent += 1
+        finally:
+            connection.close()
+
+        return sent, failed
+
+    @staticmethod
+    def record_failure(email, error, max_attempts):
+        """
+        Schedule a retry with backoff, or give up after max_attempts.
+
+        Args:
+            email: OutgoingEmail instance
+            error: Exception or message
+            max_attempts: Attempts after which the e-mail is marked failed
+        """
+        email.last_error = str(error)
+        if email.attempts >= max_attempts:
+            email.status = OutgoingEmail.STATUS_FAILED
+        else:
+            email.next_attempt = timezone.now() + OutboxService.retry_delay(email.attempts)
+        email.save(update_fields=['status', 'next_attempt', 'last_error'])
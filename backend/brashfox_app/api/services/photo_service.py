@@ -1,10 +1,28 @@
 """
 Photo Service - Business logic for photo management
 """
+import hashlib
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
+from django.db.models import Count
+from PIL import ExifTags, Image
+from rest_framework.exceptions import ValidationError
 
-from brashfox_app.models import FotoDescription, FotoCategory
-from brashfox_app.api.utils.validators import validate_image_file
+from brashfox_app.models import FotoDescription, FotoCategory, FotoTags
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.utils.constants import API
+from brashfox_app.api.utils.validators import (
+    read_image_format,
+    validate_image_dimensions,
+    validate_image_file,
+)
+from .image_service import (
+    ImageBlobService,
+    ImageProcessingService,
+    ImageVariantService,
+)
 
 
 class PhotoService:
@@ -13,8 +31,18 @@ class PhotoService:
     - Photo upload validation
     - Image processing
     - Photo metadata management
+    - Faceted gallery search
     """
     
+    # Facet name -> FotoDescription lookup used for multi-select filtering
+    FACET_LOOKUPS = {
+        'category': 'foto_category_id__in',
+        'tag': None,  # resolved through the tag M2M table, see filter_photos()
+        'event': 'event__in',
+        'author': 'author__in',
+    }
+    FACETS_CACHE_NAMESPACE = 'photo-facets'
+    
     @staticmethod
     def validate_image(image_file):
         """
@@ -27,12 +55,68 @@ class PhotoService:
             ValidationError: If file is invalid
         """
         # Use centralized validator
-        validate_image_file(image_file)
+        try:
+            validate_image_file(image_file)
+        except DjangoValidationError as exc:
+            raise ValidationError({'image': exc.messages})
+    
+    @staticmethod
+    def read_image_metadata(image_file):
+        """
+        Read dimensions, format and orientation of an uploaded image.
+        Pillow parses only the header here, pixel data is not decoded.
+        
+        Args:
+            image_file: UploadedFile instance
+            
+        Returns:
+            Dictionary with width, height (as displayed, after EXIF
+            rotation), file_size, image_format and orientation
+            
+        Raises:
+            ValidationError: If the header is unreadable or the image too large
+        """
+        position = image_file.tell()
+        image_file.seek(0)
+        try:
+            with Image.open(image_file) as image:
+                width, height = image.size
+                exif_orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+            raise ValidationError({'image': ['Unable to read image.']})
+        finally:
+            image_file.seek(position)
+        
+        # EXIF orientations 5-8 are rotated by 90 degrees
+        if exif_orientation in (5, 6, 7, 8):
+            width, height = height, width
+        
+        try:
+            validate_image_dimensions(width, height)
+        except DjangoValidationError as exc:
+            raise ValidationError({'image': exc.messages})
+        
+        if width > height:
+            orientation = FotoDescription.ORIENTATION_LANDSCAPE
+        elif width < height:
+            orientation = FotoDescription.ORIENTATION_PORTRAIT
+        else:
+            orientation = FotoDescription.ORIENTATION_SQUARE
+        
+        return {
+            'width': width,
+            'height': height,
+            'file_size': image_file.size,
+            'image_format': read_image_format(image_file),
+            'orientation': orientation,
+        }
     
     @staticmethod
     def create_photo(author, validated_data):
         """
         Create a new photo with validation.
+        The image is stored content-addressed (identical uploads share one
+        file) and variant generation is queued for `manage.py process_images`.
         
         Args:
             author: User instance or username string
@@ -45,22 +129,26 @@ class PhotoService:
         
         # Validate image
         PhotoService.validate_image(image)
+        validated_data.update(PhotoService.read_image_metadata(image))
         
         # Get author username
         author_username = author.username if hasattr(author, 'username') else str(author)
         
+        validated_data['author'] = author_username
+        
         with transaction.atomic():
-            photo = FotoDescription.objects.create(
-                author=author_username,
-                **validated_data
-            )
+            blob = ImageBlobService.acquire(image)
+            validated_data['image'] = blob.path
+            validated_data['image_blob'] = blob
+            photo = FotoDescription.objects.create(**validated_data)
+            ImageProcessingService.enqueue(photo)
         
         return photo
     
     @staticmethod
     def update_photo(photo, validated_data):
         """
-        Update existing photo.
+        Update existing photo (requeues variants if image changed).
         
         Args:
             photo: FotoDescription instance
@@ -74,11 +162,26 @@ class PhotoService:
         # Validate new image if provided
         if new_image:
             PhotoService.validate_image(new_image)
+            validated_data.update(PhotoService.read_image_metadata(new_image))
         
         with transaction.atomic():
+            old_blob_id = photo.image_blob_id
+            if new_image:
+                if not old_blob_id:
+                    # Variants of an image stored before deduplication
+                    ImageVariantService.delete_variants(photo)
+                blob = ImageBlobService.acquire(new_image)
+                validated_data['image'] = blob.path
+                photo.image_blob = blob
+            
             for attr, value in validated_data.items():
                 setattr(photo, attr, value)
             photo.save()
+            
+            if new_image:
+                if old_blob_id:
+                    ImageBlobService.release(old_blob_id)
+                ImageProcessingService.enqueue(photo)
         
         return photo
     
@@ -103,11 +206,142 @@ class PhotoService:
         Get all photos with a specific tag.
         
         Args:
-            tag_name: Tag name
+            tag_name: Tag name (matched case-insensitively, exact)
             
         Returns:
             QuerySet of FotoDescription
         """
         return FotoDescription.objects.filter(
-            foto_tags__tags__icontains=tag_name
+            tags__normalized=FotoTags.normalize(tag_name)
         ).select_related('foto_category').order_by('-created')
+    
+    @staticmethod
+    def filter_by_tags(queryset, tag_names, match='any'):
+        """
+        Filter photos by several tags.
+        
+        The matching photo ids come from one grouped query on the tag
+        table (HAVING COUNT = number of tags for 'all'), used as subquery.
+        
+        Args:
+            queryset: FotoDescription QuerySet
+            tag_names: Iterable of tag names
+            match: 'any' (OR) or 'all' (AND)
+            
+        Returns:
+            Filtered QuerySet
+        """
+        names = {FotoTags.normalize(name) for name in tag_names} - {''}
+        if not names:
+            return queryset
+        
+        tagged = FotoTags.foto_description.through.objects.filter(
+            fototags__normalized__in=names
+        ).values('fotodescription_id')
+        if match == 'all':
+            tagged = tagged.annotate(
+                matched=Count('fototags_id')
+            ).filter(matched=len(names))
+        return queryset.filter(id__in=tagged.values('fotodescription_id'))
+    
+    @staticmethod
+    def filter_photos(queryset, filters, exclude_facet=None):
+        """
+        Apply multi-select facet filters to a photo queryset.
+        
+        Values inside one facet are OR-ed, facets are AND-ed.
+        
+        Args:
+            queryset: FotoDescription QuerySet
+            filters: Dictionary {facet: [values]} (see FACET_LOOKUPS)
+            exclude_facet: Facet to leave out (for disjunctive counts)
+            
+        Returns:
+            Filtered QuerySet
+        """
+        for facet, values in filters.items():
+            if not values or facet == exclude_facet:
+                continue
+            if facet == 'tag':
+                # Subquery instead of a join keeps rows unique without DISTINCT
+                tagged = FotoTags.foto_description.through.objects.filter(
+                    fototags_id__in=values
+                ).values('fotodescription_id')
+                queryset = queryset.filter(id__in=tagged)
+            else:
+                queryset = queryset.filter(**{PhotoService.FACET_LOOKUPS[facet]: values})
+        return queryset
+    
+    @staticmethod
+    def get_facet_counts(filters):
+        """
+        Count photos per category, tag, event and author.
+        
+        Each facet is counted with every filter except its own, so the
+        client can offer the other values of a multi-select facet.
+        Four grouped queries; results are cached until photos, categories
+        or tags change.
+        
+        Args:
+            filters: Dictionary {facet: [values]}
+            
+        Returns:
+            Dictionary with 'categories', 'tags', 'events', 'authors' lists
+        """
+        cache = ResponseCache.backend()
+        normalized = {facet: sorted(map(str, values)) for facet, values in filters.items() if values}
+        digest = hashlib.md5(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+        version = ResponseCache.get_version(PhotoService.FACETS_CACHE_NAMESPACE)
+        key = f'photo-facets:v{version}:{digest}'
+        
+        facets = cache.get(key)
+        if facets is not None:
+            return facets
+        
+        photos = FotoDescription.objects.order_by()
+        
+        def base(facet):
+            return PhotoService.filter_photos(photos, filters, exclude_facet=facet)
+        
+        categories = (
+            base('category')
+            .values('foto_category_id', 'foto_category__category')
+            .annotate(count=Count('id'))
+            .order_by('-count', 'foto_category__category')
+        )
+        tags = (
+            FotoTags.foto_description.through.objects
+            .filter(fotodescription_id__in=base('tag').values('id'))
+            .values('fototags_id', 'fototags__tags')
+            .annotate(count=Count('fotodescription_id'))
+            .order_by('-count', 'fototags__tags')
+        )
+        events = (
+            base('event')
+            .exclude(event__isnull=True).exclude(event='')
+            .values('event')
+            .annotate(count=Count('id'))
+            .order_by('-count', 'event')
+        )
+        authors = (
+            base('author')
+            .exclude(author__isnull=True).exclude(author='')
+            .values('author')
+            .annotate(count=Count('id'))
+            .order_by('-count', 'author')
+        )
+        
+        facets = {
+            'categories': [
+                {'id': row['foto_category_id'], 'name': row['foto_category__category'], 'count': row['count']}
+                for row in categories
+            ],
+            'tags': [
+                {'id': row['fototags_id'], 'name': row['fototags__tags'], 'count': row['count']}
+                for row in tags
+            ],
+            'events': [{'value': row['event'], 'count': row['count']} for row in events],
+            'authors': [{'value': row['author'], 'count': row['count']} for row in authors],
+        }
+        cache.set(key, facets, API.CACHE_LONG)
+        return facets
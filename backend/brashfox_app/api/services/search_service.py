@@ -0,0 +1,199 @@
+"""
+Search Service - Full-text search index for blog posts
+"""
+import re
+import sqlite3
+from functools import lru_cache
+
+from django.db import connection
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from brashfox_app.models import BlogPost
+
+
+# PostgreSQL: generated tsvector column + GIN index on the blog post table
+PG_VECTOR_COLUMN = 'search_vector'
+PG_INDEX_NAME = 'brashfox_app_blogpost_search_gin'
+PG_CONFIG = 'simple'
+
+# SQLite: FTS5 shadow table keyed by blog post id (rowid)
+SQLITE_FTS_TABLE = 'brashfox_app_blogpost_fts'
+
+# Title matches weigh more than body matches
+TITLE_WEIGHT = 10.0
+POST_WEIGHT = 1.0
+
+TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+@lru_cache(maxsize=None)
+def sqlite_has_fts5():
+    """Check whether the bundled SQLite library was compiled with FTS5."""
+    with sqlite3.connect(':memory:') as conn:
+        options = {row[0] for row in conn.execute('PRAGMA compile_options')}
+    return 'ENABLE_FTS5' in options
+
+
+class BlogSearchService:
+    """
+    Handles the blog post full-text index:
+    - Ranked, prefix-matching search for the API
+    - Keeping the SQLite shadow table in sync with BlogPost
+    - Rebuilding the index
+
+    PostgreSQL uses a generated tsvector column, so it never needs
+    per-row syncing. Other databases fall back to icontains.
+    """
+
+    @staticmethod
+    def backend():
+        """
+        Return the index flavour for the current database.
+
+        Returns:
+            'postgresql', 'sqlite' or None (no full-text support)
+        """
+        if connection.vendor == 'postgresql':
+            return 'postgresql'
+        if connection.vendor == 'sqlite' and sqlite_has_fts5():
+            return 'sqlite'
+        return None
+
+    @staticmethod
+    def parse_terms(query):
+        """
+        Split a user query into search terms.
+
+        Args:
+            query: Raw search string
+
+        Returns:
+            List of lower-cased word terms (punctuation stripped)
+        """
+        return [term.lower() for term in TERM_PATTERN.findall(query or '')]
+
+    @staticmethod
+    def search(queryset, query):
+        """
+        Filter a BlogPost queryset by full-text query, ranked by relevance.
+
+        Every term must match, as a word prefix ("makij" finds "makijaż").
+
+        Args:
+            queryset: BlogPost QuerySet
+            query: Raw search string
+
+        Returns:
+            QuerySet annotated with `search_rank`, best matches first
+        """
+        terms = BlogSearchService.parse_terms(query)
+        if not terms:
+            return queryset
+
+        backend = BlogSearchService.backend()
+        table = BlogPost._meta.db_table
+
+        if backend == 'postgresql':
+            tsquery = ' & '.join(f"{term}:*" for term in terms)
+            vector = f'"{table}"."{PG_VECTOR_COLUMN}"'
+            rank = RawSQL(
+                f"ts_rank({vector}, to_tsquery('{PG_CONFIG}', %s))",
+                (tsquery,),
+                output_field=FloatField(),
+            )
+            matches = RawSQL(
+                f"SELECT id FROM \"{table}\" "
+                f"WHERE {PG_VECTOR_COLUMN} @@ to_tsquery('{PG_CONFIG}', %s)",
+                (tsquery,),
+            )
+        elif backend == 'sqlite':
+            match = ' '.join(f'"{term}"*' for term in terms)
+            bm25 = f"bm25({SQLITE_FTS_TABLE}, {TITLE_WEIGHT}, {POST_WEIGHT})"
+            # bm25() is lower for better matches, negate it for DESC ordering
+            rank = RawSQL(
+                f"SELECT -{bm25} FROM {SQLITE_FTS_TABLE} "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH %s "
+                f"AND rowid = \"{table}\".\"id\"",
+                (match,),
+                output_field=FloatField(),
+            )
+            matches = RawSQL(
+                f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+                (match,),
+            )
+        else:
+            condition = Q()
+            for term in terms:
+                condition &= Q(title__icontains=term) | Q(post__icontains=term)
+            return queryset.filter(condition)
+
+        return (
+            queryset
+            .filter(id__in=matches)
+            .annotate(search_rank=rank)
+            .order_by('-search_rank', '-created')
+        )
+
+    @staticmethod
+    def index_post(post):
+        """
+        Add or refresh a post in the index.
+
+        Args:
+            post: BlogPost instance
+        """
+        if BlogSearchService.backend() != 'sqlite':
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s", [post.pk]
+            )
+            cursor.execute(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, post) VALUES (%s, %s, %s)",
+                [post.pk, post.title, post.post],
+            )
+
+    @staticmethod
+    def remove_post(post_id):
+        """
+        Drop a post from the index.
+
+        Args:
+            post_id: BlogPost primary key
+        """
+        if BlogSearchService.backend() != 'sqlite':
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s", [post_id]
+            )
+
+    @staticmethod
+    def rebuild():
+        """
+        Rebuild the whole index from the blog post table.
+
+        Returns:
+            Number of indexed posts
+        """
+        backend = BlogSearchService.backend()
+        table = BlogPost._meta.db_table
+
+        with connection.cursor() as cursor:
+            if backend == 'sqlite':
+                cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE}")
+                cursor.execute(
+                    f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, post) "
+                    f"SELECT id, title, post FROM \"{table}\""
+                )
+                cursor.execute(
+                    f"INSERT INTO {SQLITE_FTS_TABLE} ({SQLITE_FTS_TABLE}) VALUES ('optimize')"
+                )
+            elif backend == 'postgresql':
+                # The tsvector column is generated; only the index can drift
+                cursor.execute(f"REINDEX INDEX {PG_INDEX_NAME}")
+
+        return BlogPost.objects.count()
@@ -0,0 +1,110 @@
+"""
+Tag Service - Type-ahead suggestions for photo tags
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left
+
+from django.db.models import Count
+
+from brashfox_app.models import FotoTags
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.utils.constants import API
+
+
+class TagSuggestService:
+    """
+    Handles tag autocomplete from a process-local prefix index:
+    - Sorted list of normalized tag names, searched with bisect
+    - Suggestions ranked by number of tagged photos
+    - Lazy rebuild when the 'photo-tags' cache version changes
+
+    The version counter is bumped by signals on every tag, tag-photo link
+    and photo change, so all worker processes pick up edits on the next
+    request without any cross-process messaging.
+    """
+
+    CACHE_NAMESPACE = 'photo-tags'
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 50
+
+    # A flushed cache restarts versions at 1, which could match an old
+    # index; rebuilding at least this often bounds the staleness.
+    MAX_AGE = API.CACHE_SHORT
+
+    _lock = threading.Lock()
+    _version = None
+    _built = 0.0
+    _keys = []      # sorted normalized names, for bisect
+    _entries = []   # (normalized, id, name, photo_count), same order as _keys
+
+    @classmethod
+    def build_index(cls):
+        """
+        Load all tags with photo counts in one query.
+
+        Returns:
+            Tuple (keys, entries) sorted by normalized name
+        """
+        rows = (
+            FotoTags.objects
+            .annotate(photo_count=Count('foto_description'))
+            .order_by('normalized')
+            .values_list('normalized', 'id', 'tags', 'photo_count')
+        )
+        entries = list(rows)
+        return [entry[0] for entry in entries], entries
+
+    @classmethod
+    def get_index(cls):
+        """Return the current index, rebuilding it if tags changed."""
+        version = ResponseCache.get_version(cls.CACHE_NAMESPACE)
+
+        def stale():
+            return cls._version != version or time.monotonic() - cls._built > cls.MAX_AGE
+
+        if stale():
+            with cls._lock:
+                if stale():
+                    cls._keys, cls._entries = cls.build_index()
+                    cls._version = version
+                    cls._built = time.monotonic()
+        return cls._keys, cls._entries
+
+    @classmethod
+    def reset(cls):
+        """Drop the in-memory index (next call rebuilds it)."""
+        with cls._lock:
+            cls._version = None
+            cls._keys, cls._entries = [], []
+
+    @classmethod
+    def suggest(cls, query, limit=None):
+        """
+        Suggest tags starting with the query.
+
+        Args:
+            query: Typed prefix (case-insensitive)
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of dicts {'id', 'tags', 'photo_count'}, most used first
+        """
+        prefix = FotoTags.normalize(query or '')
+        if not prefix:
+            return []
+        limit = min(limit or cls.DEFAULT_LIMIT, cls.MAX_LIMIT)
+
+        keys, entries = cls.get_index()
+        start = bisect_left(keys, prefix)
+        # Every name with the prefix sorts before prefix + the highest code point
+        end = bisect_left(keys, prefix + '\U0010ffff', lo=start)
+
+        best = heapq.nsmallest(
+            limit, entries[start:end], key=lambda entry: (-entry[3], entry[0])
+        )
+        return [
+            {'id': tag_id, 'tags': name, 'photo_count': photo_count}
+            for _, tag_id, name, photo_count in best
+        ]
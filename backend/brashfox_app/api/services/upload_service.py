@@ -0,0 +1,215 @@
+"""
+Upload Service - Resumable chunked photo uploads
+"""
+import os
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from brashfox_app.models import PhotoUpload
+from brashfox_app.api.utils.constants import FileUpload
+from brashfox_app.api.utils.validators import detect_image_format, validate_image_header
+
+
+class AssembledUpload(UploadedFile):
+    """
+    The finished temporary file of an upload session.
+    Exposes temporary_file_path(), so storages move the file into place
+    and Pillow validation reads it from disk.
+    """
+
+    def __init__(self, path, name, size, image_format=None):
+        super().__init__(open(path, 'rb'), name, None, size)
+        self.path = path
+        self.image_format = image_format
+
+    def temporary_file_path(self):
+        return self.path
+
+
+class UploadService:
+    """
+    Handles the resumable upload protocol:
+    - Sessions with a sparse temporary file of the announced size
+    - Writing byte ranges (in any order, re-sends allowed)
+    - Handing the assembled file to PhotoService on finalize
+    """
+
+    @staticmethod
+    def upload_dir():
+        return getattr(
+            settings, 'CHUNKED_UPLOAD_DIR',
+            os.path.join(tempfile.gettempdir(), 'brashfox-uploads'),
+        )
+
+    @staticmethod
+    def temp_path(upload):
+        return os.path.join(UploadService.upload_dir(), f'{upload.pk}.part')
+
+    @staticmethod
+    def create_session(user, filename, size):
+        """
+        Start an upload session.
+
+        Args:
+            user: User instance
+            filename: Original file name
+            size: Total file size in bytes
+
+        Returns:
+            PhotoUpload instance
+        """
+        if size > FileUpload.MAX_IMAGE_SIZE:
+            raise ValidationError({'size': [
+                f'File size exceeds maximum allowed size of '
+                f'{FileUpload.MAX_IMAGE_SIZE / (1024*1024):.0f}MB.'
+            ]})
+
+        UploadService.purge_expired()
+
+        upload = PhotoUpload.objects.create(user=user, filename=filename, size=size)
+        os.makedirs(UploadService.upload_dir(), exist_ok=True)
+        with open(UploadService.temp_path(upload), 'wb') as file:
+            # Sparse: no blocks are allocated until chunks are written
+            file.truncate(size)
+        return upload
+
+    @staticmethod
+    def write_chunk(upload, start, end, stream):
+        """
+        Write bytes [start, end) from a stream into the session's file.
+
+        The file's leading bytes are checked against image magic bytes
+        as soon as they are all available - while reading the range that
+        starts at 0, or when a later range completes them. The range is
+        recorded only after all of its bytes were written and checked.
+
+        Args:
+            upload: PhotoUpload instance
+            start: First byte offset
+            end: Offset after the last byte
+            stream: File-like object (the request body)
+
+        Returns:
+            Refreshed PhotoUpload instance
+        """
+        if not 0 <= start < end <= upload.size:
+            raise ValidationError({'range': [f'Range must lie within 0-{upload.size - 1}.']})
+
+        header_length = min(FileUpload.SIGNATURE_LENGTH, upload.size)
+        header = b''
+        remaining = end - start
+        with open(UploadService.temp_path(upload), 'r+b') as file:
+            file.seek(start)
+            while remaining:
+                data = stream.read(min(remaining, FileUpload.UPLOAD_CHUNK_READ_SIZE))
+                if not data:
+                    break
+                if start == 0 and len(header) < header_length:
+                    # A read can be shorter than the signature
+                    header += data[:header_length - len(header)]
+                    if len(header) == header_length:
+                        UploadService.check_header(header)
+                file.write(data)
+                remaining -= len(data)
+
+        if remaining:
+            raise ValidationError({'range': ['Request body is shorter than the range.']})
+
+        with transaction.atomic():
+            upload = PhotoUpload.objects.select_for_update().get(pk=upload.pk)
+            ranges = UploadService.merge_range(upload.received_ranges, start, end)
+            if (
+                len(header) < header_length
+                and UploadService.covers(ranges, header_length)
+                and not UploadService.covers(upload.received_ranges, header_length)
+            ):
+                # This range completed leading bytes sent in several ranges
+                with open(UploadService.temp_path(upload), 'rb') as file:
+                    UploadService.check_header(file.read(header_length))
+            upload.received_ranges = ranges
+            upload.received = sum(stop - begin for begin, stop in upload.received_ranges)
+            upload.save(update_fields=['received_ranges', 'received', 'updated'])
+        return upload
+
+    @staticmethod
+    def check_header(header):
+        try:
+            validate_image_header(header)
+        except DjangoValidationError as exc:
+            raise ValidationError({'image': exc.messages})
+
+    @staticmethod
+    def covers(ranges, length):
+        """Whether merged ranges contain the first `length` bytes."""
+        return bool(ranges) and ranges[0][0] == 0 and ranges[0][1] >= length
+
+    @staticmethod
+    def merge_range(ranges, start, end):
+        """
+        Add [start, end) to a sorted list of disjoint half-open ranges.
+
+        Returns:
+            New list of merged ranges
+        """
+        merged = []
+        for begin, stop in sorted(list(ranges) + [[start, end]]):
+            if merged and begin <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([begin, stop])
+        return merged
+
+    @staticmethod
+    def assemble(upload):
+        """
+        Open the finished file of a complete session (nothing is read).
+
+        Args:
+            upload: PhotoUpload instance
+
+        Returns:
+            AssembledUpload instance
+        """
+        if not upload.is_complete:
+            raise ValidationError({'upload': ['Upload is incomplete.']})
+
+        path = UploadService.temp_path(upload)
+        with open(path, 'rb') as file:
+            image_format = detect_image_format(file.read(FileUpload.SIGNATURE_LENGTH))
+        return AssembledUpload(path, upload.filename, upload.size, image_format)
+
+    @staticmethod
+    def discard(upload):
+        """
+        Delete a session and whatever is left of its temporary file.
+
+        Args:
+            upload: PhotoUpload instance
+        """
+        try:
+            os.remove(UploadService.temp_path(upload))
+        except FileNotFoundError:
+            # Moved into storage on finalize
+            pass
+        upload.delete()
+
+    @staticmethod
+    def purge_expired():
+        """
+        Discard sessions older than FileUpload.UPLOAD_SESSION_LIFETIME.
+
+        Returns:
+            Number of discarded sessions
+        """
+        cutoff = timezone.now() - timedelta(seconds=FileUpload.UPLOAD_SESSION_LIFETIME)
+        expired = list(PhotoUpload.objects.filter(created__lt=cutoff))
+        for upload in expired:
+            UploadService.discard(upload)
+        return len(expired)
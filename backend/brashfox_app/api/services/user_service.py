@@ -3,17 +3,26 @@ User Service - Business logic for user management
 """
 from django.contrib.auth.models import User
 from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from rest_framework.exceptions import ValidationError
 
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.utils.constants import API
+
 
 class UserService:
     """
     Handles user-related business logic:
     - User registration with validation
     - Profile updates
-    - User statistics
+    - User statistics (cached, updated incrementally by signals)
     """
     
+    STATISTICS = ('blog_posts_count', 'comments_count', 'photos_count')
+    # Bounds drift from races between a cache miss and concurrent writes
+    STATISTICS_TIMEOUT = API.CACHE_MEDIUM
+    
     @staticmethod
     def create_user(validated_data):
         """
@@ -79,11 +88,45 @@ class UserService:
         
         return user
     
+    @staticmethod
+    def statistics_key(username, field):
+        return f'user-stats:{username}:{field}'
+    
     @staticmethod
     def get_user_statistics(user):
         """
         Get user activity statistics.
         
+        Served from the cache; on a miss all counters are computed in
+        one aggregated query and cached.
+        
+        Args:
+            user: User instance
+            
+        Returns:
+            Dictionary with statistics
+        """
+        cache = ResponseCache.backend()
+        keys = {
+            field: UserService.statistics_key(user.username, field)
+            for field in UserService.STATISTICS
+        }
+        cached = cache.get_many(keys.values())
+        if len(cached) == len(keys):
+            return {field: cached[key] for field, key in keys.items()}
+        
+        statistics = UserService.count_user_statistics(user)
+        cache.set_many(
+            {keys[field]: value for field, value in statistics.items()},
+            UserService.STATISTICS_TIMEOUT,
+        )
+        return statistics
+    
+    @staticmethod
+    def count_user_statistics(user):
+        """
+        Count a user's posts, comments and photos in a single query.
+        
         Args:
             user: User instance
             
@@ -92,8 +135,41 @@ class UserService:
         """
         from brashfox_app.models import BlogPost, PostComments, FotoDescription
         
-        return {
-            'blog_posts_count': BlogPost.objects.filter(author=user).count(),
-            'comments_count': PostComments.objects.filter(author=user).count(),
-            'photos_count': FotoDescription.objects.filter(author=user.username).count(),
-        }
+        def count(queryset, field):
+            return Coalesce(
+                Subquery(
+                    queryset.order_by().values(field).annotate(total=Count('pk')).values('total'),
+                    output_field=IntegerField(),
+                ),
+                Value(0),
+            )
+        
+        return User.objects.filter(pk=user.pk).annotate(
+            blog_posts_count=count(BlogPost.objects.filter(author=OuterRef('pk')), 'author'),
+            # Comments and photos store the author's username
+            comments_count=count(PostComments.objects.filter(author=OuterRef('username')), 'author'),
+            photos_count=count(FotoDescription.objects.filter(author=OuterRef('username')), 'author'),
+        ).values(*UserService.STATISTICS).get()
+    
+    @staticmethod
+    def adjust_user_statistic(username, field, delta):
+        """
+        Increment a cached counter once the current transaction commits.
+        Missing counters are left alone - the next read recounts them.
+        
+        Args:
+            username: Username the counter belongs to
+            field: One of STATISTICS
+            delta: +1 or -1
+        """
+        if not username:
+            return
+        key = UserService.statistics_key(username, field)
+        
+        def apply():
+            try:
+                ResponseCache.backend().incr(key, delta)
+            except ValueError:
+                pass
+        
+        transaction.on_commit(apply)
@@ -1,25 +1,176 @@
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+"""
+Rate limiting with sliding-window counters in a shared store.
 
+DRF's SimpleRateThrottle keeps a list of request timestamps per client in
+the default cache, which is per-process locmem here - every gunicorn
+worker enforced its own limit - and rewrites the whole list on each check.
 
-class ContactFormThrottle(AnonRateThrottle):
+These throttles keep two integer counters per client (current and previous
+fixed window) and estimate the sliding window as
+    previous * (1 - elapsed / duration) + current
+The counters live in the store chosen by settings.THROTTLE_STORE:
+- 'database' (default) - ThrottleCounter rows, shared by all workers
+- 'cache' - the settings.THROTTLE_CACHE alias; use with Redis/Memcached
+"""
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from rest_framework.throttling import AnonRateThrottle
+
+from brashfox_app.models import ThrottleCounter
+
+
+class DatabaseThrottleStore:
+    """Window counters in the ThrottleCounter table."""
+
+    def get_counts(self, key, windows):
+        counts = dict(
+            ThrottleCounter.objects
+            .filter(key=key, window__in=windows)
+            .values_list('window', 'count')
+        )
+        return [counts.get(window, 0) for window in windows]
+
+    def increment(self, key, window, expires, now):
+        updated = ThrottleCounter.objects.filter(key=key, window=window).update(
+            count=F('count') + 1
+        )
+        if updated:
+            return
+
+        expires_at = self.to_datetime(expires)
+        try:
+            with transaction.atomic():
+                ThrottleCounter.objects.create(
+                    key=key, window=window, count=1, expires=expires_at
+                )
+        except IntegrityError:
+            # Another worker opened the window first
+            ThrottleCounter.objects.filter(key=key, window=window).update(
+                count=F('count') + 1
+            )
+            return
+
+        # A new window is opened at most once per key and duration,
+        # which makes it a cheap moment to drop expired counters
+        ThrottleCounter.objects.filter(expires__lt=self.to_datetime(now)).delete()
+
+    @staticmethod
+    def to_datetime(timestamp):
+        return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+
+
+class CacheThrottleStore:
+    """Window counters in a (shared) cache backend, via atomic incr()."""
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+
+    def window_key(self, key, window):
+        return f'{key}:{window}'
+
+    def get_counts(self, key, windows):
+        keys = [self.window_key(key, window) for window in windows]
+        counts = self.cache.get_many(keys)
+        return [counts.get(window_key, 0) for window_key in keys]
+
+    def increment(self, key, window, expires, now):
+        window_key = self.window_key(key, window)
+        timeout = max(int(expires - now), 1)
+        if self.cache.add(window_key, 1, timeout):
+            return
+        try:
+            self.cache.incr(window_key)
+        except ValueError:
+            # Expired between add() and incr()
+            self.cache.set(window_key, 1, timeout)
+
+
+def get_throttle_store():
+    """Return the store configured by settings.THROTTLE_STORE."""
+    if getattr(settings, 'THROTTLE_STORE', 'database') == 'cache':
+        return CacheThrottleStore(getattr(settings, 'THROTTLE_CACHE', 'default'))
+    return DatabaseThrottleStore()
+
+
+class SlidingWindowThrottle(AnonRateThrottle):
+    """
+    Anonymous rate throttle backed by sliding-window counters.
+    Subclasses set `scope` to a key of DEFAULT_THROTTLE_RATES.
+    """
+    timer = time.time
+
+    def get_store(self):
+        return get_throttle_store()
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        window = int(now // self.duration)
+        previous, current = self.get_store().get_counts(self.key, [window - 1, window])
+
+        self.elapsed = now - window * self.duration
+        self.previous, self.current = previous, current
+        if self.estimate(previous, current, self.elapsed) >= self.num_requests:
+            return False
+
+        # Counter outlives its own window by one duration (it is the
+        # "previous" window of the next one)
+        expires = (window + 2) * self.duration
+        self.get_store().increment(self.key, window, expires, now)
+        return True
+
+    def estimate(self, previous, current, elapsed):
+        return previous * (1 - elapsed / self.duration) + current
+
+    def wait(self):
+        """Seconds until the estimate drops below the limit."""
+        if self.current >= self.num_requests:
+            # Next window: this window's count decays as the "previous" one
+            remaining = self.duration - self.elapsed
+            return remaining + self.duration * (1 - self.num_requests / self.current)
+        if not self.previous:
+            return None
+        needed = 1 - (self.num_requests - self.current) / self.previous
+        return max(self.duration * needed - self.elapsed, 0)
+
+
+class ContactFormThrottle(SlidingWindowThrottle):
     """
     Rate limit for contact form submissions.
     Prevents spam from anonymous users.
     """
-    rate = 'contact'
-    
+    scope = 'contact'
+
 
-class RegisterThrottle(AnonRateThrottle):
+class RegisterThrottle(SlidingWindowThrottle):
     """
     Rate limit for user registration.
     Prevents automated account creation.
     """
-    rate = 'register'
+    scope = 'register'
 
 
-class LoginThrottle(AnonRateThrottle):
+class LoginThrottle(SlidingWindowThrottle):
     """
     Rate limit for login attempts.
     Prevents brute force attacks.
     """
-    rate = 'login'
+    scope = 'login'
+
+
+class TokenRefreshThrottle(SlidingWindowThrottle):
+    """
+    Rate limit for JWT refresh requests.
+    """
+    scope = 'token_refresh'
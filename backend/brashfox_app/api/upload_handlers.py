@@ -0,0 +1,94 @@
+"""
+Streaming upload handler for image uploads.
+
+Django's default handlers keep uploads up to FILE_UPLOAD_MAX_MEMORY_SIZE
+in memory, so concurrent 10MB photo uploads multiply worker memory.
+StreamingImageUploadHandler writes every chunk straight to a temporary
+file and rejects the upload while it is still being received:
+- the format is checked on the magic bytes of the first chunk
+- the size limit (FileUpload.MAX_IMAGE_SIZE) is checked on every chunk
+
+Photos (API) and the AboutMe profile image (admin) are the only file
+uploads, so the handler is installed globally in FILE_UPLOAD_HANDLERS.
+"""
+import os
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http.multipartparser import MultiPartParserError
+from django.utils.translation import gettext_lazy as _
+
+from brashfox_app.api.utils.constants import FileUpload
+from brashfox_app.api.utils.validators import detect_image_format, validate_image_header
+
+
+class UploadRejected(MultiPartParserError):
+    """
+    Upload aborted by StreamingImageUploadHandler.
+    Answered with 400 - by DRF as a ParseError, by Django for other views.
+    """
+
+
+class StreamingImageUploadHandler(FileUploadHandler):
+    """
+    Spool image uploads to disk in chunks, enforcing format and size
+    before the rest of the request body is read.
+    The detected format is kept as `image_format` on the uploaded file.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = TemporaryUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
+        )
+        self.max_size = FileUpload.MAX_IMAGE_SIZE
+        self.received = 0
+        self.image_format = None
+
+    def receive_data_chunk(self, raw_data, start):
+        if start == 0:
+            header = raw_data[:FileUpload.SIGNATURE_LENGTH]
+            try:
+                validate_image_header(header)
+            except ValidationError as exc:
+                self.reject(exc.messages[0])
+            self.image_format = detect_image_format(header)
+
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.reject(
+                _(f'File size exceeds maximum allowed size of {self.max_size / (1024*1024):.0f}MB.')
+            )
+
+        self.file.write(raw_data)
+        # Nothing for later handlers: the data is stored here
+        return None
+
+    def file_complete(self, file_size):
+        if not self.received:
+            # Empty file: no chunk was ever checked
+            self.reject(
+                _(f'Invalid file format. Allowed formats: {", ".join(FileUpload.ALLOWED_IMAGE_FORMATS)}')
+            )
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.image_format = self.image_format
+        return self.file
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file'):
+            self.discard()
+
+    def reject(self, message):
+        self.discard()
+        raise UploadRejected(f'{self.field_name}: {message}')
+
+    def discard(self):
+        temp_location = self.file.temporary_file_path()
+        try:
+            self.file.close()
+            os.remove(temp_location)
+        except FileNotFoundError:
+            # NamedTemporaryFile removes itself on close
+            pass
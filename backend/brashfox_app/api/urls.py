@@ -7,6 +7,7 @@ from brashfox_app.api.views import (
     FotoCategoryViewSet,
     FotoDescriptionViewSet,
     FotoTagsViewSet,
+    PhotoUploadViewSet,
     BlogPostViewSet,
     PostCategoryViewSet,
     PostCommentsViewSet,
@@ -24,6 +25,7 @@ router.register(r'groups', GroupViewSet, basename='group')
 router.register(r'photos', FotoDescriptionViewSet, basename='photo')
 router.register(r'photo-categories', FotoCategoryViewSet, basename='photo-category')
 router.register(r'photo-tags', FotoTagsViewSet, basename='photo-tag')
+router.register(r'photo-uploads', PhotoUploadViewSet, basename='photo-upload')
 
 # Blog posts
 router.register(r'blog-posts', BlogPostViewSet, basename='blog-post')
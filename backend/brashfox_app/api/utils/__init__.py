@@ -29,7 +29,9 @@ from .constants import (
 )
 
 from .validators import (
+    detect_image_format,
     validate_image_file,
+    validate_image_dimensions,
     validate_avatar_file,
     validate_slug,
     validate_username,
@@ -78,7 +80,9 @@ __all__ = [
     'URLPatterns',
     
     # Validators
+    'detect_image_format',
     'validate_image_file',
+    'validate_image_dimensions',
     'validate_avatar_file',
     'validate_slug',
     'validate_username',
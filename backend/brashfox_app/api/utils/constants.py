@@ -11,14 +11,42 @@ class FileUpload:
     # Image formats
     ALLOWED_IMAGE_FORMATS = ['jpg', 'jpeg', 'png', 'gif', 'webp']
     
+    # Leading bytes identifying each format (checked instead of the extension)
+    IMAGE_SIGNATURES = {
+        'jpeg': [b'\xff\xd8\xff'],
+        'png': [b'\x89PNG\r\n\x1a\n'],
+        'gif': [b'GIF87a', b'GIF89a'],
+        'webp': [b'RIFF'],  # plus b'WEBP' at offset 8
+    }
+    SIGNATURE_LENGTH = 12
+    
     # File size limits (in bytes)
     MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
     MAX_AVATAR_SIZE = 2 * 1024 * 1024  # 2MB
     
+    # Resumable uploads (/api/photo-uploads/)
+    UPLOAD_CHUNK_READ_SIZE = 64 * 1024  # bytes read from the request at a time
+    UPLOAD_SESSION_LIFETIME = 24 * 60 * 60  # seconds before abandoned sessions are purged
+    UPLOAD_PURGE_INTERVAL = 60 * 60  # seconds between purges by an idle process_images
+    
     # Image dimensions
     MAX_IMAGE_WIDTH = 4000
     MAX_IMAGE_HEIGHT = 4000
     THUMBNAIL_SIZE = (300, 300)
+    
+    # Responsive renditions generated for every photo (name -> bounding box)
+    IMAGE_VARIANTS = {
+        'thumbnail': THUMBNAIL_SIZE,
+        'medium': (800, 800),
+        'large': (1600, 1600),
+    }
+    VARIANT_FORMAT = 'WEBP'
+    VARIANT_EXTENSION = 'webp'
+    VARIANT_QUALITY = 80
+    
+    # Inline low-quality placeholder (LQIP) shown until the image loads
+    PLACEHOLDER_SIZE = (20, 20)
+    PLACEHOLDER_QUALITY = 40
 
 
 # Text Validation
@@ -62,6 +90,9 @@ class API:
     CACHE_SHORT = 60 * 5  # 5 minutes
     CACHE_MEDIUM = 60 * 30  # 30 minutes
     CACHE_LONG = 60 * 60 * 24  # 24 hours
+    
+    # Cached JWT user principal (see CachedJWTAuthentication)
+    AUTH_USER_CACHE_TIMEOUT = 60
 
 
 # Model Defaults
@@ -4,8 +4,10 @@ Helper Functions
 Utility functions used across the application.
 """
 import os
+import re
 import uuid
 from datetime import datetime
+from django.db.models import Q
 from django.utils.text import slugify
 from django.utils import timezone
 
@@ -165,6 +167,10 @@ def generate_unique_slug(model_class, base_slug, instance_id=None):
     """
     Generate a unique slug for a model.
     
+    Fetches every taken `base_slug` / `base_slug-N` in a single query and
+    picks the lowest free suffix. Callers still have to handle the race
+    between this check and their insert (see BlogPostService).
+    
     Args:
         model_class: Django model class
         base_slug: Base slug to start from
@@ -173,18 +179,24 @@ def generate_unique_slug(model_class, base_slug, instance_id=None):
     Returns:
         Unique slug string
     """
-    slug = base_slug
-    counter = 1
+    queryset = model_class.objects.filter(
+        Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-")
+    )
+    if instance_id:
+        queryset = queryset.exclude(id=instance_id)
     
-    while True:
-        # Check if slug exists (excluding current instance if updating)
-        queryset = model_class.objects.filter(slug=slug)
-        if instance_id:
-            queryset = queryset.exclude(id=instance_id)
-        
-        if not queryset.exists():
-            return slug
-        
-        # Append counter and try again
-        slug = f"{base_slug}-{counter}"
+    taken = set(queryset.values_list('slug', flat=True))
+    if base_slug not in taken:
+        return base_slug
+    
+    suffix_pattern = re.compile(rf"^{re.escape(base_slug)}-(\d+)$")
+    used = set()
+    for slug in taken:
+        match = suffix_pattern.match(slug)
+        if match:
+            used.add(int(match.group(1)))
+    
+    counter = 1
+    while counter in used:
         counter += 1
+    return f"{base_slug}-{counter}"
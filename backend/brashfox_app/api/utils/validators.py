@@ -3,7 +3,6 @@ Custom Validators
 
 Reusable validation functions for models and serializers.
 """
-import os
 import re
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
@@ -11,6 +10,64 @@ from django.utils.translation import gettext_lazy as _
 from .constants import FileUpload, TextValidation, URLPatterns
 
 
+def detect_image_format(header):
+    """
+    Identify an image format from the file's leading bytes.
+    
+    Args:
+        header: First bytes of the file (FileUpload.SIGNATURE_LENGTH is enough)
+        
+    Returns:
+        Format name ('jpeg', 'png', 'gif', 'webp') or None
+    """
+    for image_format, signatures in FileUpload.IMAGE_SIGNATURES.items():
+        if any(header.startswith(signature) for signature in signatures):
+            if image_format == 'webp' and header[8:12] != b'WEBP':
+                continue
+            return image_format
+    return None
+
+
+def read_image_format(file):
+    """
+    Get the detected format of an uploaded file.
+    
+    Uploads parsed by StreamingImageUploadHandler carry it already;
+    other files have their first bytes read (and the position restored).
+    
+    Args:
+        file: UploadedFile instance
+        
+    Returns:
+        Format name or None
+    """
+    image_format = getattr(file, 'image_format', None)
+    if image_format:
+        return image_format
+    
+    position = file.tell()
+    file.seek(0)
+    header = file.read(FileUpload.SIGNATURE_LENGTH)
+    file.seek(position)
+    return detect_image_format(header)
+
+
+def validate_image_header(header):
+    """
+    Validate the leading bytes of an image upload.
+    
+    Args:
+        header: First bytes of the file
+        
+    Raises:
+        ValidationError: If the content is not an allowed image format
+    """
+    if detect_image_format(header) not in FileUpload.ALLOWED_IMAGE_FORMATS:
+        raise ValidationError(
+            _(f'Invalid file format. Allowed formats: {", ".join(FileUpload.ALLOWED_IMAGE_FORMATS)}')
+        )
+
+
 def validate_image_file(file):
     """
     Validate uploaded image file format and size.
@@ -30,14 +87,31 @@ def validate_image_file(file):
             _(f'File size exceeds maximum allowed size of {FileUpload.MAX_IMAGE_SIZE / (1024*1024):.0f}MB.')
         )
     
-    # Check file extension
-    ext = os.path.splitext(file.name)[1].lower().lstrip('.')
-    if ext not in FileUpload.ALLOWED_IMAGE_FORMATS:
+    # Check file content (magic bytes), not the client-supplied extension
+    if read_image_format(file) not in FileUpload.ALLOWED_IMAGE_FORMATS:
         raise ValidationError(
             _(f'Invalid file format. Allowed formats: {", ".join(FileUpload.ALLOWED_IMAGE_FORMATS)}')
         )
 
 
+def validate_image_dimensions(width, height):
+    """
+    Validate image dimensions read from the file header.
+    
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+        
+    Raises:
+        ValidationError: If the image is larger than allowed
+    """
+    if width > FileUpload.MAX_IMAGE_WIDTH or height > FileUpload.MAX_IMAGE_HEIGHT:
+        raise ValidationError(
+            _(f'Image dimensions exceed maximum allowed size of '
+              f'{FileUpload.MAX_IMAGE_WIDTH}x{FileUpload.MAX_IMAGE_HEIGHT} px.')
+        )
+
+
 def validate_avatar_file(file):
     """
     Validate uploaded avatar file (stricter size limit).
@@ -57,9 +131,8 @@ def validate_avatar_file(file):
             _(f'Avatar size exceeds maximum allowed size of {FileUpload.MAX_AVATAR_SIZE / (1024*1024):.0f}MB.')
         )
     
-    # Check file extension
-    ext = os.path.splitext(file.name)[1].lower().lstrip('.')
-    if ext not in FileUpload.ALLOWED_IMAGE_FORMATS:
+    # Check file content (magic bytes), not the client-supplied extension
+    if read_image_format(file) not in FileUpload.ALLOWED_IMAGE_FORMATS:
         raise ValidationError(
             _(f'Invalid file format. Allowed formats: {", ".join(FileUpload.ALLOWED_IMAGE_FORMATS)}')
         )
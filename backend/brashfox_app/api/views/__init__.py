@@ -4,7 +4,8 @@ API Views - Export all ViewSets
 This module aggregates all API ViewSets for easy import in urls.py.
 Organized by domain:
 - User/Auth: UserViewSet, GroupViewSet
-- Photos: FotoCategoryViewSet, FotoDescriptionViewSet, FotoTagsViewSet
+- Photos: FotoCategoryViewSet, FotoDescriptionViewSet, FotoTagsViewSet,
+  PhotoUploadViewSet
 - Blog: BlogPostViewSet, PostCategoryViewSet
 - Comments: PostCommentsViewSet
 - Messages: MessageViewSet
@@ -18,6 +19,7 @@ from .photo import (
     FotoCategoryViewSet,
     FotoDescriptionViewSet,
     FotoTagsViewSet,
+    PhotoUploadViewSet,
 )
 
 # Blog
@@ -44,6 +46,7 @@ __all__ = [
     'FotoCategoryViewSet',
     'FotoDescriptionViewSet',
     'FotoTagsViewSet',
+    'PhotoUploadViewSet',
     # Blog
     'BlogPostViewSet',
     'PostCategoryViewSet',
@@ -8,17 +8,29 @@ from rest_framework.permissions import AllowAny
 
 from brashfox_app.models import AboutMe
 from brashfox_app.api.serializers import AboutMeSerializer
+from brashfox_app.api.cache import CachedResponseMixin
+from brashfox_app.api.conditional import ConditionalGetMixin
 
 
-class AboutMeView(APIView):
+class AboutMeView(ConditionalGetMixin, CachedResponseMixin, APIView):
     """
     Retrieve the AboutMe singleton instance.
     Public endpoint - no authentication required.
     """
     permission_classes = [AllowAny]
+    cache_namespace = 'about'
     
     def get(self, request):
-        """Get AboutMe data."""
+        """
+        Get AboutMe data (cached for anonymous visitors).
+        The 'about' namespace changes only with AboutMe itself, so its
+        invalidation time doubles as Last-Modified without a query.
+        """
+        return self.conditional_response(
+            request, ['about'], None, self.cached_response, self.get_about
+        )
+    
+    def get_about(self, request):
         about = AboutMe.get_instance()
         
         if not about:
@@ -1,6 +1,9 @@
 """
 Blog-related ViewSets: BlogPost, PostCategory
 """
+from django.db.models import Count, Prefetch
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.filters import OrderingFilter
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.decorators import action
@@ -13,14 +16,18 @@ from brashfox_app.api.serializers import (
     PostCategorySerializer,
     PostCommentsSerializer,
 )
+from brashfox_app.api.cache import CachedResponseMixin
+from brashfox_app.api.conditional import ConditionalGetMixin
+from brashfox_app.api.pagination import CursorOrPageNumberPagination
 from brashfox_app.api.permissions import (
     IsAuthorOrReadOnly,
     IsAdminOrReadOnly,
 )
 from brashfox_app.api.services import BlogPostService
+from brashfox_app.api.filters import BlogPostSearchFilter
 
 
-class BlogPostViewSet(ModelViewSet):
+class BlogPostViewSet(ConditionalGetMixin, CachedResponseMixin, ModelViewSet):
     """
     API endpoint for blog posts.
     - Read: Anyone
@@ -29,13 +36,18 @@ class BlogPostViewSet(ModelViewSet):
     Uses different serializers for list and detail views.
     Supports lookup by slug or pk.
     Automatically sets author to current user on create.
+    ?search= uses the full-text index (ranked, prefix matching).
+    Supports ?pagination=cursor for keyset pagination (infinite scroll).
     """
-    queryset = BlogPost.objects.select_related('author').all()
+    # Counters are stored columns (comments_count, author_stats) - no joins
+    queryset = BlogPost.objects.select_related('author', 'author__author_stats').all()
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
+    pagination_class = CursorOrPageNumberPagination
+    cache_namespace = 'blog-posts'
     lookup_field = 'slug'
+    filter_backends = [DjangoFilterBackend, BlogPostSearchFilter, OrderingFilter]
     filterset_fields = ['author']
-    search_fields = ['title', 'post']
-    ordering_fields = ['created', 'edited', 'title']
+    ordering_fields = ['created', 'edited', 'title', 'comments_count']
     
     def get_serializer_class(self):
         if self.action in ['retrieve', 'create', 'update', 'partial_update']:
@@ -55,14 +67,26 @@ class BlogPostViewSet(ModelViewSet):
         return Response(serializer.data)
 
 
-class PostCategoryViewSet(ModelViewSet):
+class PostCategoryViewSet(ConditionalGetMixin, CachedResponseMixin, ModelViewSet):
     """
     API endpoint for post categories.
     - Read: Anyone
     - Write: Admins only
     """
-    queryset = PostCategory.objects.prefetch_related('blog_post').all()
+    queryset = PostCategory.objects.prefetch_related(
+        Prefetch(
+            'blog_post',
+            queryset=BlogPost.objects.select_related('author', 'author__author_stats'),
+        )
+    )
     serializer_class = PostCategorySerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = 'post-categories'
     search_fields = ['category']
-    ordering_fields = ['category']
+    ordering_fields = ['category', 'posts_count']
+    
+    def get_queryset(self):
+        # Explicit order: Meta.ordering doesn't count for GROUP BY querysets
+        return super().get_queryset().annotate(
+            posts_count=Count('blog_post', distinct=True)
+        ).order_by('category')
@@ -6,20 +6,25 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
 from brashfox_app.models import PostComments
 from brashfox_app.api.serializers import PostCommentsSerializer
+from brashfox_app.api.conditional import ConditionalGetMixin
+from brashfox_app.api.pagination import CursorOrPageNumberPagination
 from brashfox_app.api.permissions import IsAuthorOrReadOnly
 
 
-class PostCommentsViewSet(ModelViewSet):
+class PostCommentsViewSet(ConditionalGetMixin, ModelViewSet):
     """
     API endpoint for post comments.
     - Read: Anyone
     - Create: Authenticated users
     - Update/Delete: Author or Admin only
     Automatically sets author to current user on create.
+    Supports ?pagination=cursor for keyset pagination (infinite scroll).
     """
     queryset = PostComments.objects.select_related('blog_post', 'blog_post__author').all()
     serializer_class = PostCommentsSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
+    pagination_class = CursorOrPageNumberPagination
+    cache_namespace = 'comments'
     filterset_fields = ['blog_post', 'author']
     search_fields = ['comment']
     ordering_fields = ['created']
@@ -2,20 +2,21 @@
 Message-related ViewSets: Message (contact form)
 """
 from rest_framework.viewsets import ModelViewSet
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 
 from brashfox_app.models import Message
 from brashfox_app.api.serializers import MessageSerializer
 from brashfox_app.api.throttles import ContactFormThrottle
 from brashfox_app.api.services import MessageService
+from brashfox_app.api.conditional import ConditionalGetMixin
 
 
-class MessageViewSet(ModelViewSet):
+class MessageViewSet(ConditionalGetMixin, ModelViewSet):
     """
     API endpoint for contact form messages.
     - Create: Anyone (throttled)
     - Read/Update/Delete: Admins only (via permission)
-    Throttled to prevent spam (10/hour from same IP).
+    Throttled to prevent spam (contact rate, sliding window per IP).
     """
     queryset = Message.objects.all()
     serializer_class = MessageSerializer
@@ -23,6 +24,10 @@ class MessageViewSet(ModelViewSet):
     ordering_fields = ['created']
     ordering = ['-created']
     
+    def perform_create(self, serializer):
+        """Create message and queue admin notification in one transaction"""
+        serializer.instance = MessageService.create_message(serializer.validated_data)
+    
     def get_permissions(self):
         """
         Allow anyone to create messages (contact form),
@@ -30,4 +35,4 @@ class MessageViewSet(ModelViewSet):
         """
         if self.action == 'create':
             return [AllowAny()]
-        return super().get_permissions()
+        return [IsAdminUser()]
@@ -1,28 +1,50 @@
 """
-Photo-related ViewSets: FotoCategory, FotoDescription, FotoTags
+Photo-related ViewSets: FotoCategory, FotoDescription, FotoTags, PhotoUpload
 """
-from rest_framework.viewsets import ModelViewSet
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+import io
+import re
+
+from django.db.models import Count, Prefetch
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework import mixins, status
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
 from brashfox_app.models import (
     FotoCategory,
     FotoDescription,
     FotoTags,
+    PhotoUpload,
 )
 from brashfox_app.api.serializers import (
     FotoCategorySerializer,
     FotoDescriptionListSerializer,
     FotoDescriptionDetailSerializer,
     FotoTagsSerializer,
+    FotoTagsExpandedSerializer,
+    PhotoUploadSerializer,
 )
+from brashfox_app.api.cache import CachedResponseMixin
+from brashfox_app.api.conditional import ConditionalGetMixin
+from brashfox_app.api.filters import PhotoTagFilter
+from brashfox_app.api.pagination import CursorOrPageNumberPagination
 from brashfox_app.api.permissions import (
     IsAuthorOrReadOnly,
     IsAdminOrReadOnly,
 )
-from brashfox_app.api.services import PhotoService
+from brashfox_app.api.services import PhotoService, TagSuggestService, UploadService
+
+
+def photo_tags_prefetch():
+    """Load tags of a whole page of photos in one query"""
+    return Prefetch('tags', queryset=FotoTags.objects.only('id', 'tags'))
 
 
-class FotoCategoryViewSet(ModelViewSet):
+class FotoCategoryViewSet(ConditionalGetMixin, CachedResponseMixin, ModelViewSet):
     """
     API endpoint for photo categories.
     - Read: Anyone
@@ -31,9 +53,16 @@ class FotoCategoryViewSet(ModelViewSet):
     queryset = FotoCategory.objects.all()
     serializer_class = FotoCategorySerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = 'photo-categories'
+    
+    def get_queryset(self):
+        # Explicit order: Meta.ordering doesn't count for GROUP BY querysets
+        return super().get_queryset().annotate(
+            photos_count=Count('photos')
+        ).order_by('category')
     
 
-class FotoDescriptionViewSet(ModelViewSet):
+class FotoDescriptionViewSet(ConditionalGetMixin, CachedResponseMixin, ModelViewSet):
     """
     API endpoint for photos.
     - Read: Anyone
@@ -41,12 +70,24 @@ class FotoDescriptionViewSet(ModelViewSet):
     - Update/Delete: Author or Admin only
     Uses different serializers for list and detail views.
     Automatically sets author to current user on create.
+    Supports ?pagination=cursor for keyset pagination (infinite scroll).
+    Supports ?tags=a,b&match=all|any for tag filtering.
+    Supports ?orientation=landscape|portrait|square and ?image_format=.
+    /api/photos/facets/ returns a filtered page plus per-facet counts
+    (?category=, ?tag=, ?event=, ?author= and ?ordering= only).
     """
-    queryset = FotoDescription.objects.select_related('foto_category').all()
+    queryset = (
+        FotoDescription.objects
+        .select_related('foto_category')
+        .prefetch_related(photo_tags_prefetch())
+    )
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
-    filterset_fields = ['foto_category', 'author']
+    pagination_class = CursorOrPageNumberPagination
+    cache_namespace = 'photos'
+    filter_backends = [DjangoFilterBackend, PhotoTagFilter, SearchFilter, OrderingFilter]
+    filterset_fields = ['foto_category', 'author', 'orientation', 'image_format']
     search_fields = ['name', 'author', 'event']
-    ordering_fields = ['created', 'edited', 'name']
+    ordering_fields = ['created', 'edited', 'name', 'file_size']
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -54,18 +95,172 @@ class FotoDescriptionViewSet(ModelViewSet):
         return FotoDescriptionListSerializer
     
     def perform_create(self, serializer):
-        """Automatically set author to current user"""
-        serializer.save(author=self.request.user.username)
+        """Automatically set author to current user and build image variants"""
+        serializer.instance = PhotoService.create_photo(
+            self.request.user, serializer.validated_data
+        )
+    
+    def perform_update(self, serializer):
+        """Update photo through service so image variants stay in sync"""
+        serializer.instance = PhotoService.update_photo(
+            serializer.instance, serializer.validated_data
+        )
+    
+    def get_facet_filters(self):
+        """
+        Read multi-select facet filters from the query string.
+        Accepts repeated (?tag=1&tag=2) and comma-separated (?tag=1,2) values.
+        """
+        filters = {}
+        for facet in PhotoService.FACET_LOOKUPS:
+            values = []
+            for raw in self.request.query_params.getlist(facet):
+                values += [value.strip() for value in raw.split(',') if value.strip()]
+            if facet in ('category', 'tag'):
+                try:
+                    values = [int(value) for value in values]
+                except ValueError:
+                    raise ValidationError({facet: 'Podaj identyfikatory liczbowe.'})
+            filters[facet] = values
+        return filters
+    
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """Filtered photo page with counts per category, tag, event and author"""
+        filters = self.get_facet_filters()
+        # Only facet filters and ordering, so the page matches the counts
+        # (DjangoFilterBackend would also read ?author= as one exact value)
+        queryset = OrderingFilter().filter_queryset(
+            request, PhotoService.filter_photos(self.get_queryset(), filters), self
+        )
+        facets = PhotoService.get_facet_counts(filters)
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+        else:
+            response = Response({'results': self.get_serializer(queryset, many=True).data})
+        response.data['facets'] = facets
+        return response
     
 
-class FotoTagsViewSet(ModelViewSet):
+class FotoTagsViewSet(ConditionalGetMixin, CachedResponseMixin, ModelViewSet):
     """
     API endpoint for photo tags.
     - Read: Anyone
     - Write: Authenticated users only
+    Compact output (id, tags, photo_count) by default;
+    ?expand=photos embeds the tagged photos.
+    /api/photo-tags/suggest/?q= serves type-ahead suggestions.
     """
-    queryset = FotoTags.objects.prefetch_related('foto_description').all()
-    serializer_class = FotoTagsSerializer
+    queryset = FotoTags.objects.all()
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_namespace = 'photo-tags'
     search_fields = ['tags']
-    ordering_fields = ['tags']
+    ordering_fields = ['tags', 'photo_count']
+    
+    def expand_photos(self):
+        return 'photos' in self.request.query_params.get('expand', '').split(',')
+    
+    def get_queryset(self):
+        queryset = super().get_queryset().annotate(
+            photo_count=Count('foto_description')
+        ).order_by('tags')
+        if self.expand_photos():
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'foto_description',
+                    queryset=FotoDescription.objects
+                    .select_related('foto_category')
+                    .prefetch_related(photo_tags_prefetch()),
+                )
+            )
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action in ['list', 'retrieve'] and self.expand_photos():
+            return FotoTagsExpandedSerializer
+        return FotoTagsSerializer
+    
+    @action(detail=False, methods=['get'])
+    def suggest(self, request):
+        """Tags starting with ?q=, most used first (?limit=, default 10)"""
+        try:
+            limit = int(request.query_params.get('limit', TagSuggestService.DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError({'limit': 'Podaj liczbę.'})
+        if limit < 1:
+            raise ValidationError({'limit': 'Podaj liczbę dodatnią.'})
+        return Response(TagSuggestService.suggest(request.query_params.get('q', ''), limit))
+
+
+class PhotoUploadViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+    GenericViewSet,
+):
+    """
+    Resumable chunked photo upload (own sessions only).
+    1. POST /api/photo-uploads/ {filename, size} - start a session
+    2. PUT /api/photo-uploads/{id}/ with `Content-Range: bytes start-end/size`
+       and the raw bytes as body - any order, repeat failed chunks;
+       GET the session to see `received_ranges` when resuming
+    3. POST /api/photo-uploads/{id}/finalize/ with the photo fields
+       (name, foto_category_id, event) - creates the photo
+    """
+    serializer_class = PhotoUploadSerializer
+    permission_classes = [IsAuthenticated]
+    content_range_pattern = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+    
+    def get_queryset(self):
+        return PhotoUpload.objects.filter(user=self.request.user)
+    
+    def perform_create(self, serializer):
+        serializer.instance = UploadService.create_session(
+            self.request.user,
+            serializer.validated_data['filename'],
+            serializer.validated_data['size'],
+        )
+    
+    def perform_destroy(self, instance):
+        UploadService.discard(instance)
+    
+    def get_content_range(self, upload):
+        """Parse Content-Range into a half-open [start, end) byte range"""
+        match = self.content_range_pattern.match(self.request.headers.get('Content-Range', ''))
+        if not match:
+            raise ValidationError({'range': 'Podaj nagłówek Content-Range: bytes start-end/size.'})
+        start, last, total = map(int, match.groups())
+        if total != upload.size:
+            raise ValidationError({'range': f'Rozmiar pliku to {upload.size} bajtów.'})
+        return start, last + 1
+    
+    def update(self, request, *args, **kwargs):
+        """Write one chunk; the body is read straight from the request stream"""
+        upload = self.get_object()
+        start, end = self.get_content_range(upload)
+        upload = UploadService.write_chunk(upload, start, end, request.stream or io.BytesIO())
+        return Response(self.get_serializer(upload).data)
+    
+    @action(detail=True, methods=['post'])
+    def finalize(self, request, pk=None):
+        """Create the photo from the assembled file and close the session"""
+        upload = self.get_object()
+        image = UploadService.assemble(upload)
+        try:
+            data = request.data.copy()
+            data['image'] = image
+            serializer = FotoDescriptionListSerializer(
+                data=data, context=self.get_serializer_context()
+            )
+            serializer.is_valid(raise_exception=True)
+            photo = PhotoService.create_photo(request.user, serializer.validated_data)
+        finally:
+            image.close()
+        
+        UploadService.discard(upload)
+        return Response(
+            FotoDescriptionListSerializer(photo, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
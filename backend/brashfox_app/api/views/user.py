@@ -24,7 +24,7 @@ class UserViewSet(ModelViewSet):
     - Create: Anyone (registration) - rate limited to 3/hour
     - Update/Delete: Owner or Admin only
     """
-    queryset = User.objects.all().order_by('-date_joined')
+    queryset = User.objects.select_related('author_stats').order_by('-date_joined')
     
     def get_permissions(self):
         if self.action == 'create':
@@ -47,11 +47,13 @@ class UserViewSet(ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def me(self, request):
         """Get current user profile with statistics"""
-        serializer = self.get_serializer(request.user)
+        # request.user only carries the cached auth principal
+        user = self.get_queryset().get(pk=request.user.pk)
+        serializer = self.get_serializer(user)
         data = serializer.data
         
         # Add user statistics using service
-        data['statistics'] = UserService.get_user_statistics(request.user)
+        data['statistics'] = UserService.get_user_statistics(user)
         
         return Response(data)
 
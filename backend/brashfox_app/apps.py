@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BrashfoxAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'brashfox_app'
+
+    def ready(self):
+        # Register signal handlers
+        from brashfox_app import signals  # noqa: F401
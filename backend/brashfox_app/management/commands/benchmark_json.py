@@ -0,0 +1,110 @@
+"""
+Compare JSON rendering time of the stdlib and orjson renderers.
+
+Renders pages shaped like the photo and blog post list responses
+(serializers have already turned datetimes into strings at this point).
+
+Usage:
+    python manage.py benchmark_json
+    python manage.py benchmark_json --rows 1000 --repeat 50
+"""
+import timeit
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.fields import DateTimeField
+from rest_framework.renderers import JSONRenderer
+
+from brashfox_app.api.renderers import ORJSONRenderer, orjson
+
+
+def timestamp(value):
+    return DateTimeField().to_representation(value)
+
+
+def photo_page(rows):
+    now = timezone.now()
+    return {
+        'count': rows * 10,
+        'next': 'http://localhost:8000/api/photos/?page=2',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'name': f'Sesja ślubna {i} – Kraków',
+                'author': 'brashfox',
+                'event': 'Wesele Anny i Piotra',
+                'image': f'http://localhost:8000/media/photos/photo_{i}.jpg',
+                'srcset': {
+                    variant: {
+                        'url': f'http://localhost:8000/media/photos/variants/photo_{i}_{variant}.webp',
+                        'width': width,
+                        'height': width * 2 // 3,
+                    }
+                    for variant, width in (('thumbnail', 300), ('medium', 800), ('large', 1600))
+                },
+                'processing_status': 'ready',
+                'foto_category': {'id': i % 7, 'category': 'Ślub'},
+                'tags': ['plener', 'wesele', 'portret'],
+                'created': timestamp(now - timedelta(hours=i)),
+                'edited': timestamp(now),
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def blog_page(rows):
+    now = timezone.now()
+    return {
+        'next': 'http://localhost:8000/api/blog-posts/?cursor=cD0yMDI2',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'title': f'Makijaż ślubny krok po kroku #{i}',
+                'excerpt': 'Zaczynamy od przygotowania skóry – nawilżenie i baza. ' * 4,
+                'slug': f'makijaz-slubny-krok-po-kroku-{i}',
+                'author': {
+                    'id': 1, 'username': 'brashfox', 'email': 'kontakt@brashfox.pl',
+                    'first_name': 'Anna', 'last_name': 'Kowalska', 'blog_posts_count': rows,
+                },
+                'created': timestamp(now - timedelta(days=i)),
+                'edited': timestamp(now),
+                'comments_count': i % 13,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the stdlib JSON renderer against the orjson renderer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500, help='Items per page (default: 500).')
+        parser.add_argument('--repeat', type=int, default=20, help='Renders per measurement (default: 20).')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError('orjson is not installed.')
+
+        renderers = [('json', JSONRenderer()), ('orjson', ORJSONRenderer())]
+        pages = [('photos', photo_page(options['rows'])), ('blog-posts', blog_page(options['rows']))]
+
+        for name, page in pages:
+            size = len(JSONRenderer().render(page))
+            self.stdout.write(f"{name} ({options['rows']} rows, {size / 1024:.0f} KiB):")
+
+            timings = {}
+            for label, renderer in renderers:
+                best = min(timeit.repeat(
+                    lambda: renderer.render(page), number=options['repeat'], repeat=3
+                ))
+                timings[label] = best / options['repeat'] * 1000
+                self.stdout.write(f"  {label:<8} {timings[label]:8.2f} ms/page")
+
+            self.stdout.write(self.style.SUCCESS(
+                f"  orjson is {timings['json'] / timings['orjson']:.1f}x faster"
+            ))
@@ -0,0 +1,37 @@
+"""
+Show hit/miss counters of the API response cache.
+
+Usage:
+    python manage.py cache_stats
+    python manage.py cache_stats --invalidate    # also drop all cached responses
+"""
+from django.core.management.base import BaseCommand
+
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.signals import CACHE_DEPENDENCIES
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters of the API response cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--invalidate',
+            action='store_true',
+            help='Invalidate every cached response namespace.',
+        )
+
+    def handle(self, *args, **options):
+        namespaces = sorted({ns for group in CACHE_DEPENDENCIES.values() for ns in group})
+
+        for namespace, stats in ResponseCache.get_stats(namespaces).items():
+            total = stats['hits'] + stats['misses']
+            ratio = stats['hits'] / total * 100 if total else 0
+            self.stdout.write(
+                f"{namespace:<18} hits={stats['hits']:<8} misses={stats['misses']:<8} "
+                f"hit ratio={ratio:.1f}%"
+            )
+
+        if options['invalidate']:
+            ResponseCache.invalidate(*namespaces)
+            self.stdout.write(self.style.SUCCESS('Invalidated all response caches.'))
@@ -0,0 +1,83 @@
+"""
+Deduplicate photo files stored before content-addressed uploads.
+
+Hashes every photo without an ImageBlob (in chunks), keeps one file per
+distinct content and points duplicates at it.
+
+Usage:
+    python manage.py dedupe_media
+    python manage.py dedupe_media --dry-run
+"""
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from brashfox_app.models import FotoDescription, ImageBlob
+from brashfox_app.api.services import ImageBlobService
+
+
+class Command(BaseCommand):
+    help = 'Share one stored file between photos with identical image content.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report duplicates, change nothing.',
+        )
+
+    def handle(self, *args, **options):
+        photos = (
+            FotoDescription.objects
+            .filter(image_blob__isnull=True)
+            .exclude(image='')
+            .order_by('id')
+        )
+
+        if options['dry_run']:
+            self.report(photos)
+            return
+
+        adopted = merged = freed = missing = 0
+        for photo in photos.iterator():
+            if not photo.image.storage.exists(photo.image.name):
+                self.stderr.write(f'Photo {photo.pk}: missing file {photo.image.name}')
+                missing += 1
+                continue
+
+            was_merged, size = ImageBlobService.adopt(photo)
+            if was_merged:
+                merged += 1
+                freed += size
+            else:
+                adopted += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Adopted {adopted} file(s), merged {merged} duplicate(s), '
+            f'freed {freed} byte(s); {missing} file(s) missing.'
+        ))
+
+    def report(self, photos):
+        known = set(ImageBlob.objects.values_list('sha256', flat=True))
+        by_hash = defaultdict(list)
+        for photo in photos.iterator():
+            storage = photo.image.storage
+            if not storage.exists(photo.image.name):
+                continue
+            with storage.open(photo.image.name, 'rb') as file:
+                sha256, size = ImageBlobService.hash_file(file)
+            by_hash[sha256].append((photo.pk, size))
+
+        duplicates = freed = 0
+        for sha256, entries in by_hash.items():
+            # Content already stored as a blob makes every entry a duplicate
+            extra = entries if sha256 in known else entries[1:]
+            duplicates += len(extra)
+            freed += sum(size for _, size in extra)
+            if extra:
+                ids = ', '.join(str(pk) for pk, _ in entries)
+                self.stdout.write(f'{sha256[:12]}: photos {ids}')
+
+        self.stdout.write(
+            f'{duplicates} duplicate(s) would be merged, freeing {freed} byte(s).'
+        )
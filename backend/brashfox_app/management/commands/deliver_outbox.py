@@ -0,0 +1,62 @@
+"""
+Worker for the e-mail outbox.
+
+Usage:
+    python manage.py deliver_outbox              # run forever
+    python manage.py deliver_outbox --once       # send what is due and exit
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from brashfox_app.api.services import OutboxService
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued e-mails in batches over a single connection.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='E-mails sent per connection.',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=OutboxService.MAX_ATTEMPTS,
+            help='Attempts before an e-mail is marked as failed.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=10.0,
+            help='Seconds to sleep when nothing is due.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once no e-mail is due.',
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+
+        while True:
+            emails = OutboxService.claim_batch(options['batch_size'])
+            if not emails:
+                if options['once']:
+                    break
+                close_old_connections()
+                time.sleep(options['poll_interval'])
+                continue
+
+            sent, failed = OutboxService.deliver_batch(emails, options['max_attempts'])
+            total_sent += sent
+            total_failed += failed
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Sent {total_sent} e-mail(s), {total_failed} failed attempt(s).'
+        ))
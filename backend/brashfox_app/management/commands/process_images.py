@@ -0,0 +1,122 @@
+"""
+Worker for the image processing queue.
+
+Usage:
+    python manage.py process_images              # run forever
+    python manage.py process_images --once       # drain the queue and exit
+    python manage.py process_images --enqueue-missing --once
+
+While the queue is idle, expired upload sessions are purged as well
+(at most every FileUpload.UPLOAD_PURGE_INTERVAL seconds).
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from brashfox_app.models import FotoDescription
+from brashfox_app.api.services import (
+    ImageProcessingService,
+    ImageVariantService,
+    UploadService,
+)
+from brashfox_app.api.utils.constants import FileUpload
+
+
+class Command(BaseCommand):
+    help = 'Generate image variants for queued photos using a process pool.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes (default: CPU count).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Jobs claimed per round (default: 2 x workers).',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=3,
+            help='Attempts before a job is marked as failed.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to sleep when the queue is empty.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once the queue is empty.',
+        )
+        parser.add_argument(
+            '--enqueue-missing',
+            action='store_true',
+            help='Queue every photo that has no variants yet before starting.',
+        )
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        batch_size = options['batch_size'] or workers * 2
+
+        if options['enqueue_missing']:
+            queued = self.enqueue_missing()
+            self.stdout.write(f'Queued {queued} photo(s) without variants.')
+
+        processed = 0
+        next_purge = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                jobs = ImageProcessingService.claim_jobs(batch_size)
+                if not jobs:
+                    if time.monotonic() >= next_purge:
+                        UploadService.purge_expired()
+                        next_purge = time.monotonic() + FileUpload.UPLOAD_PURGE_INTERVAL
+                    if options['once']:
+                        break
+                    close_old_connections()
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                processed += self.process_batch(pool, jobs, options['max_attempts'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} image(s).'))
+
+    def enqueue_missing(self):
+        photos = FotoDescription.objects.filter(variants={}).exclude(image='')
+        queued = 0
+        for photo in photos.iterator():
+            ImageProcessingService.enqueue(photo)
+            queued += 1
+        return queued
+
+    def process_batch(self, pool, jobs, max_attempts):
+        """Render a batch in worker processes, then store results here."""
+        futures = {}
+        for job in jobs:
+            try:
+                source = ImageVariantService.read_source(job.photo)
+            except Exception as exc:
+                ImageProcessingService.fail_job(job, exc, max_attempts)
+                continue
+            futures[job] = pool.submit(ImageVariantService.render_variants, source)
+
+        done = 0
+        for job, future in futures.items():
+            try:
+                ImageProcessingService.complete_job(job, future.result())
+            except Exception as exc:
+                ImageProcessingService.fail_job(job, exc, max_attempts)
+                self.stderr.write(f'Photo {job.photo_id}: {exc}')
+                continue
+            done += 1
+        return done
@@ -0,0 +1,19 @@
+"""
+Discard abandoned resumable upload sessions and their temporary files.
+
+Usage:
+    python manage.py purge_uploads
+
+Also run by `manage.py process_images` while its queue is idle.
+"""
+from django.core.management.base import BaseCommand
+
+from brashfox_app.api.services import UploadService
+
+
+class Command(BaseCommand):
+    help = 'Delete upload sessions older than FileUpload.UPLOAD_SESSION_LIFETIME.'
+
+    def handle(self, *args, **options):
+        purged = UploadService.purge_expired()
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} upload session(s).'))
@@ -0,0 +1,33 @@
+"""
+Rebuild the blog post full-text search index.
+
+Usage:
+    python manage.py rebuild_search_index
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.services import BlogSearchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for blog posts.'
+
+    def handle(self, *args, **options):
+        backend = BlogSearchService.backend()
+        if backend is None:
+            self.stdout.write(self.style.WARNING(
+                'Database has no full-text support, search falls back to icontains.'
+            ))
+            return
+
+        with transaction.atomic():
+            count = BlogSearchService.rebuild()
+
+        # Cached search results may predate the rebuild
+        ResponseCache.invalidate('blog-posts')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {backend} search index for {count} post(s).'
+        ))
@@ -0,0 +1,25 @@
+"""
+Repair denormalized counters (BlogPost.comments_count, AuthorStats).
+
+Usage:
+    python manage.py recount
+"""
+from django.core.management.base import BaseCommand
+
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.services import BlogPostService
+
+
+class Command(BaseCommand):
+    help = 'Recompute stored comment and post counters from the source tables.'
+
+    def handle(self, *args, **options):
+        posts, authors = BlogPostService.recount()
+
+        if posts or authors:
+            # Counters are updated with QuerySet.update(), which sends no signals
+            ResponseCache.invalidate('blog-posts', 'post-categories', 'comments')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Corrected {posts} post(s) and {authors} author counter(s).'
+        ))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0011_aboutme'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fotodescription',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text="Resized renditions: {'thumbnail': {'path', 'width', 'height'}, ...}", verbose_name='Warianty zdjęcia'),
+        ),
+    ]
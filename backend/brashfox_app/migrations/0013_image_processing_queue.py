@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0012_fotodescription_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fotodescription',
+            name='processing_status',
+            field=models.CharField(choices=[('pending', 'Oczekuje na przetworzenie'), ('ready', 'Gotowe'), ('failed', 'Błąd przetwarzania')], default='pending', editable=False, max_length=16, verbose_name='Status przetwarzania'),
+        ),
+        migrations.CreateModel(
+            name='ImageProcessingJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Oczekuje'), ('processing', 'W trakcie'), ('done', 'Zakończone'), ('failed', 'Błąd')], default='pending', max_length=16, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Liczba prób')),
+                ('error', models.TextField(blank=True, verbose_name='Błąd')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data utworzenia')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Data aktualizacji')),
+                ('photo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='processing_jobs', to='brashfox_app.fotodescription', verbose_name='Zdjęcie')),
+            ],
+            options={
+                'verbose_name': 'Zadanie przetwarzania zdjęcia',
+                'verbose_name_plural': 'Zadania przetwarzania zdjęć',
+                'ordering': ['created'],
+                'indexes': [models.Index(fields=['status', 'created'], name='brashfox_ap_status_ebaeb3_idx')],
+            },
+        ),
+    ]
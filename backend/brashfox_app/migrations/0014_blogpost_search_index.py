@@ -0,0 +1,74 @@
+import sqlite3
+
+from django.db import migrations
+
+
+PG_CREATE = [
+    """
+    ALTER TABLE brashfox_app_blogpost
+    ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(post, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX brashfox_app_blogpost_search_gin
+    ON brashfox_app_blogpost USING gin (search_vector)
+    """,
+]
+PG_DROP = [
+    "DROP INDEX IF EXISTS brashfox_app_blogpost_search_gin",
+    "ALTER TABLE brashfox_app_blogpost DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE brashfox_app_blogpost_fts
+    USING fts5(title, post, tokenize = 'unicode61 remove_diacritics 2')
+    """,
+    """
+    INSERT INTO brashfox_app_blogpost_fts (rowid, title, post)
+    SELECT id, title, post FROM brashfox_app_blogpost
+    """,
+]
+SQLITE_DROP = [
+    "DROP TABLE IF EXISTS brashfox_app_blogpost_fts",
+]
+
+
+def sqlite_has_fts5():
+    with sqlite3.connect(':memory:') as conn:
+        options = {row[0] for row in conn.execute('PRAGMA compile_options')}
+    return 'ENABLE_FTS5' in options
+
+
+def run_statements(schema_editor, postgresql, sqlite):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        statements = postgresql
+    elif vendor == 'sqlite' and sqlite_has_fts5():
+        statements = sqlite
+    else:
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(schema_editor, PG_CREATE, SQLITE_CREATE)
+
+
+def drop_search_index(apps, schema_editor):
+    run_statements(schema_editor, PG_DROP, SQLITE_DROP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0013_image_processing_queue'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0014_blogpost_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='brashfox_ap_created_77ed38_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-created', '-id'], name='brashfox_ap_created_ce4dcf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fotodescription',
+            index=models.Index(fields=['-created', '-id'], name='brashfox_ap_created_90dad2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postcomments',
+            index=models.Index(fields=['-created', '-id'], name='brashfox_ap_created_db6e3e_idx'),
+        ),
+    ]
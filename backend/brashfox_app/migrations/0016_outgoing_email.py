@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:59
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0015_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Temat')),
+                ('body', models.TextField(verbose_name='Treść')),
+                ('from_email', models.CharField(max_length=255, verbose_name='Nadawca')),
+                ('recipients', models.JSONField(default=list, help_text='List of recipient addresses', verbose_name='Odbiorcy')),
+                ('status', models.CharField(choices=[('pending', 'Oczekuje'), ('sent', 'Wysłane'), ('failed', 'Błąd')], default='pending', max_length=16, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Liczba prób')),
+                ('next_attempt', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Następna próba')),
+                ('last_error', models.TextField(blank=True, verbose_name='Ostatni błąd')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data utworzenia')),
+                ('sent', models.DateTimeField(blank=True, null=True, verbose_name='Data wysłania')),
+            ],
+            options={
+                'verbose_name': 'E-mail do wysłania',
+                'verbose_name_plural': 'E-maile do wysłania',
+                'ordering': ['created'],
+                'indexes': [models.Index(fields=['status', 'next_attempt'], name='brashfox_ap_status_17419e_idx')],
+            },
+        ),
+    ]
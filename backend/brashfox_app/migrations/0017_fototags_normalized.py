@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+def normalize(name):
+    return ' '.join(str(name).split()).lower()
+
+
+def populate_normalized(apps, schema_editor):
+    """Fill the normalized column, merging tags that differ only in case."""
+    FotoTags = apps.get_model('brashfox_app', 'FotoTags')
+    keepers = {}
+    for tag in FotoTags.objects.order_by('id'):
+        key = normalize(tag.tags)
+        keeper = keepers.get(key)
+        if keeper is None:
+            tag.normalized = key
+            tag.save(update_fields=['normalized'])
+            keepers[key] = tag
+        else:
+            keeper.foto_description.add(*tag.foto_description.all())
+            tag.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0016_outgoing_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fototags',
+            name='normalized',
+            field=models.CharField(editable=False, help_text='Lower-cased tag used for exact, indexed lookups', max_length=60, null=True, verbose_name='Tag znormalizowany'),
+        ),
+        migrations.RunPython(populate_normalized, migrations.RunPython.noop),
+    ]
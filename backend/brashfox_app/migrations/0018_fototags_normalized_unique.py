@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from 0017 so PostgreSQL doesn't alter a table with
+    # deferred constraint checks pending from the data merge
+
+    dependencies = [
+        ('brashfox_app', '0017_fototags_normalized'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='fototags',
+            name='normalized',
+            field=models.CharField(editable=False, help_text='Lower-cased tag used for exact, indexed lookups', max_length=60, unique=True, verbose_name='Tag znormalizowany'),
+        ),
+    ]
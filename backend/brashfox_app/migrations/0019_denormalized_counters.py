@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    BlogPost = apps.get_model('brashfox_app', 'BlogPost')
+    PostComments = apps.get_model('brashfox_app', 'PostComments')
+    AuthorStats = apps.get_model('brashfox_app', 'AuthorStats')
+
+    comments = (
+        PostComments.objects
+        .filter(blog_post=OuterRef('pk'))
+        .order_by()
+        .values('blog_post')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    BlogPost.objects.update(comments_count=Coalesce(Subquery(comments), Value(0)))
+
+    AuthorStats.objects.bulk_create([
+        AuthorStats(user_id=row['author'], blog_posts_count=row['total'])
+        for row in BlogPost.objects.order_by().values('author').annotate(total=Count('pk'))
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('brashfox_app', '0018_fototags_normalized_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='author_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='Autor')),
+                ('blog_posts_count', models.PositiveIntegerField(default=0, help_text='Maintained by signals, repaired by `manage.py recount`', verbose_name='Liczba postów')),
+            ],
+            options={
+                'verbose_name': 'Statystyki autora',
+                'verbose_name_plural': 'Statystyki autorów',
+            },
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained by signals, repaired by `manage.py recount`', verbose_name='Liczba komentarzy'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-comments_count', '-id'], name='brashfox_ap_comment_11b17a_idx'),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
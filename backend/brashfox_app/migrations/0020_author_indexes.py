@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0019_denormalized_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fotodescription',
+            index=models.Index(fields=['author'], name='brashfox_ap_author_f480fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postcomments',
+            index=models.Index(fields=['author'], name='brashfox_ap_author_3785a4_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0020_author_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThrottleCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='Klucz')),
+                ('window', models.BigIntegerField(help_text='Window number: epoch seconds // window duration', verbose_name='Okno czasowe')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Liczba żądań')),
+                ('expires', models.DateTimeField(db_index=True, verbose_name='Wygasa')),
+            ],
+            options={
+                'verbose_name': 'Licznik limitu żądań',
+                'verbose_name_plural': 'Liczniki limitów żądań',
+                'constraints': [models.UniqueConstraint(fields=('key', 'window'), name='throttle_counter_key_window')],
+            },
+        ),
+    ]
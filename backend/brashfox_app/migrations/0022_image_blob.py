@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0021_throttle_counter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='Skrót SHA-256')),
+                ('path', models.CharField(max_length=255, verbose_name='Ścieżka pliku')),
+                ('size', models.PositiveBigIntegerField(verbose_name='Rozmiar (bajty)')),
+                ('ref_count', models.PositiveIntegerField(default=0, help_text='Photos using this file; maintained by ImageBlobService', verbose_name='Liczba odwołań')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data zapisania')),
+            ],
+            options={
+                'verbose_name': 'Plik zdjęcia',
+                'verbose_name_plural': 'Pliki zdjęć',
+            },
+        ),
+        migrations.AddField(
+            model_name='fotodescription',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='photos', to='brashfox_app.imageblob', verbose_name='Plik zdjęcia'),
+        ),
+    ]
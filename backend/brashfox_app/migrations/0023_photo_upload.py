@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:30
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0022_image_blob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PhotoUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='Nazwa pliku')),
+                ('size', models.PositiveIntegerField(verbose_name='Rozmiar (bajty)')),
+                ('received', models.PositiveIntegerField(default=0, verbose_name='Odebrane bajty')),
+                ('received_ranges', models.JSONField(blank=True, default=list, help_text='Merged half-open byte ranges: [[start, end], ...]', verbose_name='Odebrane zakresy')),
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Data utworzenia')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Data aktualizacji')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='photo_uploads', to=settings.AUTH_USER_MODEL, verbose_name='Użytkownik')),
+            ],
+            options={
+                'verbose_name': 'Przesyłanie zdjęcia',
+                'verbose_name_plural': 'Przesyłane zdjęcia',
+                'ordering': ['-created'],
+            },
+        ),
+    ]
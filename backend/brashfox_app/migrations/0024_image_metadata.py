@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:33
+
+from django.db import migrations, models
+from PIL import ExifTags, Image
+
+
+def populate_metadata(apps, schema_editor):
+    """Read header metadata of photos uploaded before the columns existed."""
+    FotoDescription = apps.get_model('brashfox_app', 'FotoDescription')
+    photos = FotoDescription.objects.exclude(image='').filter(width__isnull=True)
+    for photo in photos.iterator():
+        try:
+            with photo.image.open('rb') as file, Image.open(file) as image:
+                width, height = image.size
+                image_format = (image.format or '').lower()
+                exif_orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+            file_size = photo.image.size
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+            # Missing or broken file - left empty
+            continue
+
+        if exif_orientation in (5, 6, 7, 8):
+            width, height = height, width
+        if width > height:
+            orientation = 'landscape'
+        elif width < height:
+            orientation = 'portrait'
+        else:
+            orientation = 'square'
+
+        FotoDescription.objects.filter(pk=photo.pk).update(
+            width=width,
+            height=height,
+            file_size=file_size,
+            image_format={'mpo': 'jpeg'}.get(image_format, image_format),
+            orientation=orientation,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0023_photo_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fotodescription',
+            name='file_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Rozmiar pliku (bajty)'),
+        ),
+        migrations.AddField(
+            model_name='fotodescription',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='As displayed, i.e. after EXIF rotation', null=True, verbose_name='Wysokość (px)'),
+        ),
+        migrations.AddField(
+            model_name='fotodescription',
+            name='image_format',
+            field=models.CharField(blank=True, editable=False, max_length=8, verbose_name='Format pliku'),
+        ),
+        migrations.AddField(
+            model_name='fotodescription',
+            name='orientation',
+            field=models.CharField(blank=True, choices=[('landscape', 'Pozioma'), ('portrait', 'Pionowa'), ('square', 'Kwadratowa')], editable=False, max_length=16, verbose_name='Orientacja'),
+        ),
+        migrations.AddField(
+            model_name='fotodescription',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='As displayed, i.e. after EXIF rotation', null=True, verbose_name='Szerokość (px)'),
+        ),
+        migrations.AddIndex(
+            model_name='fotodescription',
+            index=models.Index(fields=['orientation'], name='brashfox_ap_orienta_0c07f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fotodescription',
+            index=models.Index(fields=['image_format'], name='brashfox_ap_image_f_1ced26_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fotodescription',
+            index=models.Index(fields=['width', 'height'], name='brashfox_ap_width_edb932_idx'),
+        ),
+        migrations.RunPython(populate_metadata, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:35
+
+import base64
+from io import BytesIO
+
+from django.db import migrations, models
+from PIL import Image, ImageOps
+
+
+def render_placeholder(file):
+    with Image.open(file) as image:
+        image.draft('RGB', (20, 20))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        image.thumbnail((20, 20), Image.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, format='WEBP', quality=40)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def populate_placeholders(apps, schema_editor):
+    """Placeholders of processed photos (from their thumbnail) and the profile image."""
+    FotoDescription = apps.get_model('brashfox_app', 'FotoDescription')
+    AboutMe = apps.get_model('brashfox_app', 'AboutMe')
+
+    photos = FotoDescription.objects.filter(processing_status='ready', placeholder='')
+    for photo in photos.iterator():
+        path = photo.variants.get('thumbnail', {}).get('path')
+        if not path:
+            continue
+        try:
+            with photo.image.storage.open(path, 'rb') as file:
+                placeholder = render_placeholder(file)
+        except (OSError, SyntaxError, ValueError):
+            # Missing or broken file - filled in when the photo is reprocessed
+            continue
+        FotoDescription.objects.filter(pk=photo.pk).update(placeholder=placeholder)
+
+    for about in AboutMe.objects.exclude(profile_image='').filter(profile_image_placeholder=''):
+        try:
+            with about.profile_image.open('rb') as file:
+                placeholder = render_placeholder(file)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        AboutMe.objects.filter(pk=about.pk).update(profile_image_placeholder=placeholder)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0024_image_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aboutme',
+            name='profile_image_placeholder',
+            field=models.TextField(blank=True, editable=False, help_text='~20px WebP data URI, rendered when a new profile image is saved', verbose_name='Podgląd zastępczy zdjęcia'),
+        ),
+        migrations.AddField(
+            model_name='fotodescription',
+            name='placeholder',
+            field=models.TextField(blank=True, editable=False, help_text='~20px WebP data URI shown until the image loads', verbose_name='Podgląd zastępczy'),
+        ),
+        migrations.RunPython(populate_placeholders, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_created(apps, schema_editor):
+    """Existing messages were never edited."""
+    Message = apps.get_model('brashfox_app', 'Message')
+    Message.objects.update(edited=models.F('created'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brashfox_app', '0025_image_placeholders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='edited',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Data aktualizacji'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_created, migrations.RunPython.noop),
+    ]
@@ -2,10 +2,10 @@
 Models package - organized by domain
 """
 # Photo models
-from .photo import FotoCategory, FotoDescription, FotoTags
+from .photo import FotoCategory, FotoDescription, FotoTags, ImageBlob
 
 # Blog models
-from .blog import BlogPost, PostCategory
+from .blog import BlogPost, PostCategory, AuthorStats
 
 # Comment models
 from .comment import PostComments
@@ -16,19 +16,37 @@ from .message import Message
 # About models
 from .about import AboutMe
 
+# Background job models
+from .job import ImageProcessingJob, OutgoingEmail
+
+# Chunked upload models
+from .upload import PhotoUpload
+
+# Rate limiting models
+from .throttle import ThrottleCounter
+
 # Export all models
 __all__ = [
     # Photo
     'FotoCategory',
     'FotoDescription',
     'FotoTags',
+    'ImageBlob',
     # Blog
     'BlogPost',
     'PostCategory',
+    'AuthorStats',
     # Comment
     'PostComments',
     # Message
     'Message',
     # About
     'AboutMe',
+    # Jobs
+    'ImageProcessingJob',
+    'OutgoingEmail',
+    # Uploads
+    'PhotoUpload',
+    # Rate limiting
+    'ThrottleCounter',
 ]
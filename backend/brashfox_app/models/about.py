@@ -34,6 +34,13 @@ class AboutMe(models.Model):
         help_text="Profile photo (recommended: 800x800px, max 5MB)"
     )
     
+    profile_image_placeholder = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name='Podgląd zastępczy zdjęcia',
+        help_text="~20px WebP data URI, rendered when a new profile image is saved"
+    )
+    
     specializations = models.JSONField(
         default=list,
         verbose_name='Specjalizacje',
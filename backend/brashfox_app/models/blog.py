@@ -1,7 +1,7 @@
 """
 Blog-related models: BlogPost, PostCategory
 """
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 
 
@@ -33,6 +33,12 @@ class BlogPost(models.Model):
         unique=True,
         verbose_name='Slug',
     )
+    comments_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Liczba komentarzy',
+        help_text='Maintained by signals, repaired by `manage.py recount`',
+    )
 
     class Meta:
         verbose_name = 'Post blogowy'
@@ -40,12 +46,41 @@ class BlogPost(models.Model):
         ordering = ['-created']
         indexes = [
             models.Index(fields=['slug']),
-            models.Index(fields=['-created']),
+            # Matches the (-created, -id) cursor pagination ordering
+            models.Index(fields=['-created', '-id']),
+            models.Index(fields=['-comments_count', '-id']),
         ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # post_save updates the author's counter in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class AuthorStats(models.Model):
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='author_stats',
+        verbose_name='Autor',
+    )
+    blog_posts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Liczba postów',
+        help_text='Maintained by signals, repaired by `manage.py recount`',
+    )
+
+    class Meta:
+        verbose_name = 'Statystyki autora'
+        verbose_name_plural = 'Statystyki autorów'
+
+    def __str__(self):
+        return f'Statystyki: {self.user}'
+
 
 class PostCategory(models.Model):
     category = models.CharField(
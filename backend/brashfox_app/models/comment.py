@@ -1,7 +1,7 @@
 """
 Comment-related models: PostComments
 """
-from django.db import models
+from django.db import models, transaction
 from .blog import BlogPost
 
 
@@ -33,6 +33,17 @@ class PostComments(models.Model):
         verbose_name = 'Komentarz'
         verbose_name_plural = 'Komentarze'
         ordering = ['created']
+        indexes = [
+            # Matches the (-created, -id) cursor pagination ordering
+            models.Index(fields=['-created', '-id']),
+            # Per-user comment counts match on the username string
+            models.Index(fields=['author']),
+        ]
 
     def __str__(self):
         return f'Komentarz od {self.author} do "{self.blog_post.title}"'
+
+    def save(self, *args, **kwargs):
+        # post_save updates the post's counter in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
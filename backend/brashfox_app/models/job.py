@@ -0,0 +1,134 @@
+"""
+Background job models: ImageProcessingJob, OutgoingEmail
+"""
+from django.db import models
+from django.utils import timezone
+from .photo import FotoDescription
+
+
+class ImageProcessingJob(models.Model):
+    """
+    Queue entry for generating image variants outside the request cycle.
+    Consumed by `manage.py process_images`.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Oczekuje'),
+        (STATUS_PROCESSING, 'W trakcie'),
+        (STATUS_DONE, 'Zakończone'),
+        (STATUS_FAILED, 'Błąd'),
+    ]
+
+    photo = models.ForeignKey(
+        FotoDescription,
+        on_delete=models.CASCADE,
+        related_name='processing_jobs',
+        verbose_name='Zdjęcie'
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name='Status',
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Liczba prób',
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='Błąd',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Data utworzenia',
+    )
+    updated = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Data aktualizacji',
+    )
+
+    class Meta:
+        verbose_name = 'Zadanie przetwarzania zdjęcia'
+        verbose_name_plural = 'Zadania przetwarzania zdjęć'
+        ordering = ['created']
+        indexes = [
+            models.Index(fields=['status', 'created']),
+        ]
+
+    def __str__(self):
+        return f'{self.photo} ({self.status})'
+
+
+class OutgoingEmail(models.Model):
+    """
+    Transactional e-mail outbox.
+    Rows are written in the same transaction as the data they announce
+    and delivered by `manage.py deliver_outbox`.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Oczekuje'),
+        (STATUS_SENT, 'Wysłane'),
+        (STATUS_FAILED, 'Błąd'),
+    ]
+
+    subject = models.CharField(
+        max_length=255,
+        verbose_name='Temat',
+    )
+    body = models.TextField(
+        verbose_name='Treść',
+    )
+    from_email = models.CharField(
+        max_length=255,
+        verbose_name='Nadawca',
+    )
+    recipients = models.JSONField(
+        default=list,
+        verbose_name='Odbiorcy',
+        help_text="List of recipient addresses",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name='Status',
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Liczba prób',
+    )
+    next_attempt = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Następna próba',
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='Ostatni błąd',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Data utworzenia',
+    )
+    sent = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Data wysłania',
+    )
+
+    class Meta:
+        verbose_name = 'E-mail do wysłania'
+        verbose_name_plural = 'E-maile do wysłania'
+        ordering = ['created']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt']),
+        ]
+
+    def __str__(self):
+        return f'{self.subject} ({self.status})'
@@ -23,6 +23,10 @@ class Message(models.Model):
         auto_now_add=True,
         verbose_name='Data utworzenia'
     )
+    edited = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Data aktualizacji',
+    )
 
     class Meta:
         verbose_name = 'Wiadomość'
@@ -1,5 +1,5 @@
 """
-Photo-related models: FotoCategory, FotoDescription, FotoTags
+Photo-related models: FotoCategory, ImageBlob, FotoDescription, FotoTags
 """
 from django.db import models
 
@@ -19,7 +19,60 @@ class FotoCategory(models.Model):
         return self.category
 
 
+class ImageBlob(models.Model):
+    """
+    One stored image file, addressed by the SHA-256 of its content.
+    Photos uploading identical bytes share the blob; the file is deleted
+    when the last photo referencing it goes away.
+    """
+    sha256 = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name='Skrót SHA-256',
+    )
+    path = models.CharField(
+        max_length=255,
+        verbose_name='Ścieżka pliku',
+    )
+    size = models.PositiveBigIntegerField(
+        verbose_name='Rozmiar (bajty)',
+    )
+    ref_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Liczba odwołań',
+        help_text='Photos using this file; maintained by ImageBlobService',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Data zapisania',
+    )
+
+    class Meta:
+        verbose_name = 'Plik zdjęcia'
+        verbose_name_plural = 'Pliki zdjęć'
+
+    def __str__(self):
+        return f'{self.path} ({self.ref_count})'
+
+
 class FotoDescription(models.Model):
+    PROCESSING_PENDING = 'pending'
+    PROCESSING_READY = 'ready'
+    PROCESSING_FAILED = 'failed'
+    PROCESSING_CHOICES = [
+        (PROCESSING_PENDING, 'Oczekuje na przetworzenie'),
+        (PROCESSING_READY, 'Gotowe'),
+        (PROCESSING_FAILED, 'Błąd przetwarzania'),
+    ]
+    ORIENTATION_LANDSCAPE = 'landscape'
+    ORIENTATION_PORTRAIT = 'portrait'
+    ORIENTATION_SQUARE = 'square'
+    ORIENTATION_CHOICES = [
+        (ORIENTATION_LANDSCAPE, 'Pozioma'),
+        (ORIENTATION_PORTRAIT, 'Pionowa'),
+        (ORIENTATION_SQUARE, 'Kwadratowa'),
+    ]
+
     name = models.CharField(
         max_length=255,
         verbose_name='Opis zdjęcia',
@@ -50,6 +103,69 @@ class FotoDescription(models.Model):
         upload_to='photos/',
         verbose_name='Zdjęcie',
     )
+    image_blob = models.ForeignKey(
+        ImageBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='photos',
+        verbose_name='Plik zdjęcia',
+    )
+    # Read from the image header on upload (see PhotoService.read_image_metadata)
+    width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Szerokość (px)',
+        help_text='As displayed, i.e. after EXIF rotation',
+    )
+    height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Wysokość (px)',
+        help_text='As displayed, i.e. after EXIF rotation',
+    )
+    file_size = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Rozmiar pliku (bajty)',
+    )
+    image_format = models.CharField(
+        max_length=8,
+        blank=True,
+        editable=False,
+        verbose_name='Format pliku',
+    )
+    orientation = models.CharField(
+        max_length=16,
+        choices=ORIENTATION_CHOICES,
+        blank=True,
+        editable=False,
+        verbose_name='Orientacja',
+    )
+    variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='Warianty zdjęcia',
+        help_text="Resized renditions: {'thumbnail': {'path', 'width', 'height'}, ...}",
+    )
+    placeholder = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name='Podgląd zastępczy',
+        help_text='~20px WebP data URI shown until the image loads',
+    )
+    processing_status = models.CharField(
+        max_length=16,
+        choices=PROCESSING_CHOICES,
+        default=PROCESSING_PENDING,
+        editable=False,
+        verbose_name='Status przetwarzania',
+    )
     foto_category = models.ForeignKey(
         FotoCategory,
         on_delete=models.CASCADE,
@@ -61,6 +177,16 @@ class FotoDescription(models.Model):
         verbose_name = 'Opis zdjęcia'
         verbose_name_plural = 'Opisy zdjęć'
         ordering = ['-created']
+        indexes = [
+            # Matches the (-created, -id) cursor pagination ordering
+            models.Index(fields=['-created', '-id']),
+            # Per-user photo counts match on the username string
+            models.Index(fields=['author']),
+            # Gallery filters on image metadata
+            models.Index(fields=['orientation']),
+            models.Index(fields=['image_format']),
+            models.Index(fields=['width', 'height']),
+        ]
 
     def __str__(self):
         return self.name
@@ -76,6 +202,13 @@ class FotoTags(models.Model):
         max_length=60,
         verbose_name='Tag zdjęcia',
     )
+    normalized = models.CharField(
+        max_length=60,
+        unique=True,
+        editable=False,
+        verbose_name='Tag znormalizowany',
+        help_text='Lower-cased tag used for exact, indexed lookups',
+    )
 
     class Meta:
         verbose_name = 'Tag zdjęcia'
@@ -84,3 +217,15 @@ class FotoTags(models.Model):
 
     def __str__(self):
         return self.tags
+
+    @staticmethod
+    def normalize(name):
+        """Canonical form of a tag name: trimmed, single-spaced, lower-case."""
+        return ' '.join(str(name).split()).lower()
+
+    def save(self, *args, **kwargs):
+        self.normalized = self.normalize(self.tags)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'tags' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'normalized'}
+        return super().save(*args, **kwargs)
@@ -0,0 +1,37 @@
+"""
+Rate limiting models: ThrottleCounter
+"""
+from django.db import models
+
+
+class ThrottleCounter(models.Model):
+    """
+    Request counter of one throttle key in one fixed time window.
+    Backs the sliding-window throttles when THROTTLE_STORE = 'database'.
+    """
+    key = models.CharField(
+        max_length=255,
+        verbose_name='Klucz',
+    )
+    window = models.BigIntegerField(
+        verbose_name='Okno czasowe',
+        help_text='Window number: epoch seconds // window duration',
+    )
+    count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Liczba żądań',
+    )
+    expires = models.DateTimeField(
+        db_index=True,
+        verbose_name='Wygasa',
+    )
+
+    class Meta:
+        verbose_name = 'Licznik limitu żądań'
+        verbose_name_plural = 'Liczniki limitów żądań'
+        constraints = [
+            models.UniqueConstraint(fields=['key', 'window'], name='throttle_counter_key_window'),
+        ]
+
+    def __str__(self):
+        return f'{self.key} [{self.window}]: {self.count}'
@@ -0,0 +1,64 @@
+"""
+Chunked upload models: PhotoUpload
+"""
+import uuid
+
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class PhotoUpload(models.Model):
+    """
+    Resumable upload session of one photo file.
+    Chunks are written to a sparse temporary file (see UploadService);
+    the byte ranges received so far are tracked here.
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='photo_uploads',
+        verbose_name='Użytkownik',
+    )
+    filename = models.CharField(
+        max_length=255,
+        verbose_name='Nazwa pliku',
+    )
+    size = models.PositiveIntegerField(
+        verbose_name='Rozmiar (bajty)',
+    )
+    received = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Odebrane bajty',
+    )
+    received_ranges = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name='Odebrane zakresy',
+        help_text='Merged half-open byte ranges: [[start, end], ...]',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        verbose_name='Data utworzenia',
+    )
+    updated = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Data aktualizacji',
+    )
+
+    class Meta:
+        verbose_name = 'Przesyłanie zdjęcia'
+        verbose_name_plural = 'Przesyłane zdjęcia'
+        ordering = ['-created']
+
+    def __str__(self):
+        return f'{self.filename} ({self.received}/{self.size})'
+
+    @property
+    def is_complete(self):
+        return self.received_ranges == [[0, self.size]]
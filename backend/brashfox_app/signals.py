@@ -0,0 +1,225 @@
+"""
+Model signal handlers.
+Connected in BrashfoxAppConfig.ready().
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from brashfox_app.models import (
+    AboutMe,
+    BlogPost,
+    FotoCategory,
+    FotoDescription,
+    FotoTags,
+    PostCategory,
+    PostComments,
+)
+from brashfox_app.api.authentication import CachedJWTAuthentication
+from brashfox_app.api.cache import ResponseCache
+from brashfox_app.api.services import (
+    BlogPostService,
+    BlogSearchService,
+    ImageBlobService,
+    ImageVariantService,
+    UserService,
+)
+
+
+# Full-text search index
+
+@receiver(post_save, sender=BlogPost, dispatch_uid='blogpost_search_index_save')
+def index_blog_post(sender, instance, **kwargs):
+    """Keep the full-text index in sync with saved posts."""
+    BlogSearchService.index_post(instance)
+
+
+@receiver(post_delete, sender=BlogPost, dispatch_uid='blogpost_search_index_delete')
+def unindex_blog_post(sender, instance, **kwargs):
+    """Remove deleted posts from the full-text index."""
+    BlogSearchService.remove_post(instance.pk)
+
+
+# Denormalized counters
+# BlogPost/PostComments.save() and QuerySet.delete() run these handlers
+# inside the transaction that writes the row.
+
+@receiver(pre_save, sender=PostComments, dispatch_uid='comment_counter_move')
+def remember_comment_post(sender, instance, raw=False, update_fields=None, **kwargs):
+    # A comment moved to another post moves its count as well
+    instance._previous_blog_post_id = None
+    if raw or instance._state.adding or (update_fields is not None and 'blog_post' not in update_fields):
+        return
+    instance._previous_blog_post_id = (
+        PostComments.objects.filter(pk=instance.pk).values_list('blog_post_id', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=PostComments, dispatch_uid='comment_counter_save')
+def count_created_comment(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        BlogPostService.adjust_comments_count(instance.blog_post_id, 1)
+        return
+    previous = getattr(instance, '_previous_blog_post_id', None)
+    if previous is not None and previous != instance.blog_post_id:
+        BlogPostService.adjust_comments_count(previous, -1)
+        BlogPostService.adjust_comments_count(instance.blog_post_id, 1)
+
+
+@receiver(post_delete, sender=PostComments, dispatch_uid='comment_counter_delete')
+def count_deleted_comment(sender, instance, **kwargs):
+    BlogPostService.adjust_comments_count(instance.blog_post_id, -1)
+
+
+@receiver(post_save, sender=BlogPost, dispatch_uid='blogpost_counter_save')
+def count_created_post(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        BlogPostService.adjust_author_posts_count(instance.author_id, 1)
+
+
+@receiver(post_delete, sender=BlogPost, dispatch_uid='blogpost_counter_delete')
+def count_deleted_post(sender, instance, **kwargs):
+    BlogPostService.adjust_author_posts_count(instance.author_id, -1)
+
+
+# Content-addressed photo files (ImageBlob reference counts)
+
+@receiver(post_delete, sender=FotoDescription, dispatch_uid='photo_blob_release')
+def release_photo_blob(sender, instance, **kwargs):
+    if instance.image_blob_id:
+        ImageBlobService.release(instance.image_blob_id)
+
+
+# Profile image placeholder (rendered once, when a new file is uploaded)
+
+@receiver(pre_save, sender=AboutMe, dispatch_uid='about_profile_placeholder')
+def render_profile_placeholder(sender, instance, raw=False, **kwargs):
+    image = instance.profile_image
+    if raw:
+        return
+    if not image:
+        instance.profile_image_placeholder = ''
+    elif not image._committed:
+        instance.profile_image_placeholder = ImageVariantService.render_placeholder(image.file)
+        image.file.seek(0)
+
+
+# Cached JWT user principal (CachedJWTAuthentication)
+# Dropped after commit, so a concurrent request can't re-cache the old row.
+
+@receiver(post_save, sender=User, dispatch_uid='auth_principal_save')
+def drop_cached_principal(sender, instance, update_fields=None, **kwargs):
+    # Saves covering deactivation, staff changes and password changes
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    user_id = instance.pk
+    transaction.on_commit(lambda: CachedJWTAuthentication.invalidate(user_id))
+
+
+@receiver(post_delete, sender=User, dispatch_uid='auth_principal_delete')
+def drop_deleted_principal(sender, instance, **kwargs):
+    # instance.pk is cleared once delete() returns
+    user_id = instance.pk
+    transaction.on_commit(lambda: CachedJWTAuthentication.invalidate(user_id))
+
+
+# Cached user statistics (UserService.get_user_statistics)
+
+def post_author_username(post):
+    if BlogPost._meta.get_field('author').is_cached(post):
+        return post.author.username
+    return User.objects.filter(pk=post.author_id).values_list('username', flat=True).first()
+
+
+@receiver(post_save, sender=BlogPost, dispatch_uid='user_stats_post_save')
+def count_user_post(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        UserService.adjust_user_statistic(post_author_username(instance), 'blog_posts_count', 1)
+
+
+@receiver(post_delete, sender=BlogPost, dispatch_uid='user_stats_post_delete')
+def uncount_user_post(sender, instance, **kwargs):
+    UserService.adjust_user_statistic(post_author_username(instance), 'blog_posts_count', -1)
+
+
+@receiver(post_save, sender=PostComments, dispatch_uid='user_stats_comment_save')
+def count_user_comment(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        UserService.adjust_user_statistic(instance.author, 'comments_count', 1)
+
+
+@receiver(post_delete, sender=PostComments, dispatch_uid='user_stats_comment_delete')
+def uncount_user_comment(sender, instance, **kwargs):
+    UserService.adjust_user_statistic(instance.author, 'comments_count', -1)
+
+
+@receiver(post_save, sender=FotoDescription, dispatch_uid='user_stats_photo_save')
+def count_user_photo(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        UserService.adjust_user_statistic(instance.author, 'photos_count', 1)
+
+
+@receiver(post_delete, sender=FotoDescription, dispatch_uid='user_stats_photo_delete')
+def uncount_user_photo(sender, instance, **kwargs):
+    UserService.adjust_user_statistic(instance.author, 'photos_count', -1)
+
+
+# API response cache
+# Model -> cache namespaces whose responses embed that model's data.
+# Versions are bumped after commit: bumping earlier lets a concurrent
+# request cache the old rows again under the new version.
+
+CACHE_DEPENDENCIES = {
+    FotoDescription: ('photos', 'photo-categories', 'photo-tags', 'photo-facets'),
+    FotoCategory: ('photo-categories', 'photos', 'photo-tags', 'photo-facets'),
+    FotoTags: ('photo-tags', 'photos', 'photo-facets'),
+    BlogPost: ('blog-posts', 'post-categories', 'comments'),
+    PostComments: ('blog-posts', 'post-categories', 'comments'),
+    PostCategory: ('post-categories',),
+    User: ('blog-posts', 'post-categories'),
+    AboutMe: ('about',),
+}
+
+M2M_CACHE_DEPENDENCIES = {
+    FotoTags.foto_description.through: ('photo-tags', 'photos', 'photo-facets'),
+    PostCategory.blog_post.through: ('post-categories',),
+}
+
+
+def invalidate_on_save(sender, instance, update_fields=None, **kwargs):
+    # Logins only touch last_login, which no cached payload contains
+    if sender is User and update_fields and set(update_fields) <= {'last_login'}:
+        return
+    namespaces = CACHE_DEPENDENCIES[sender]
+    transaction.on_commit(lambda: ResponseCache.invalidate(*namespaces))
+
+
+def invalidate_on_delete(sender, instance, **kwargs):
+    namespaces = CACHE_DEPENDENCIES[sender]
+    transaction.on_commit(lambda: ResponseCache.invalidate(*namespaces))
+
+
+def invalidate_on_m2m_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        namespaces = M2M_CACHE_DEPENDENCIES[sender]
+        transaction.on_commit(lambda: ResponseCache.invalidate(*namespaces))
+
+
+for model in CACHE_DEPENDENCIES:
+    post_save.connect(
+        invalidate_on_save, sender=model,
+        dispatch_uid=f'response_cache_save_{model._meta.label_lower}',
+    )
+    post_delete.connect(
+        invalidate_on_delete, sender=model,
+        dispatch_uid=f'response_cache_delete_{model._meta.label_lower}',
+    )
+
+for through in M2M_CACHE_DEPENDENCIES:
+    m2m_changed.connect(
+        invalidate_on_m2m_change, sender=through,
+        dispatch_uid=f'response_cache_m2m_{through._meta.label_lower}',
+    )
@@ -5,3 +5,22 @@ import pytest
 def client():
     from django.test import Client
     return Client()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached responses must not leak between tests (DB is rolled back)."""
+    from django.core.cache import cache
+    from brashfox_app.api.services import TagSuggestService
+    cache.clear()
+    TagSuggestService.reset()
+    yield
+    cache.clear()
+    TagSuggestService.reset()
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    """Uploaded files go to a per-test directory."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
@@ -145,6 +145,50 @@ class TestMessageThrottling:
         """Only authenticated users can list messages"""
         response = self.client.get('/api/messages/')
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def post_message(self):
+        return self.client.post('/api/messages/', {
+            'name': 'John Doe',
+            'email': 'john@test.com',
+            'topic': 'Question',
+            'message': 'Test message'
+        })
+    
+    def test_limit_enforced_with_shared_counters(self, monkeypatch):
+        """Requests over the limit get 429; counters live in the database"""
+        from brashfox_app.api.throttles import ContactFormThrottle
+        from brashfox_app.models import ThrottleCounter
+        monkeypatch.setattr(ContactFormThrottle, 'THROTTLE_RATES', {'contact': '2/hour'})
+        
+        assert self.post_message().status_code == status.HTTP_201_CREATED
+        assert self.post_message().status_code == status.HTTP_201_CREATED
+        response = self.post_message()
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert ThrottleCounter.objects.get().count == 2
+    
+    def test_previous_window_weight_decays(self, monkeypatch):
+        """Sliding window: the previous window counts proportionally"""
+        from brashfox_app.api.throttles import ContactFormThrottle
+        monkeypatch.setattr(ContactFormThrottle, 'THROTTLE_RATES', {'contact': '2/hour'})
+        now = [7200.0]
+        monkeypatch.setattr(ContactFormThrottle, 'timer', lambda self: now[0])
+        
+        self.post_message()
+        self.post_message()
+        now[0] = 3600 * 3 + 900  # next window, previous weighs 75%: 1.5
+        assert self.post_message().status_code == status.HTTP_201_CREATED
+        assert self.post_message().status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        now[0] = 3600 * 3 + 2000  # previous weighs 44%: 0.89 + 1
+        assert self.post_message().status_code == status.HTTP_201_CREATED
+    
+    def test_cache_store(self, monkeypatch, settings):
+        """Counters can live in a shared cache backend instead"""
+        from brashfox_app.api.throttles import ContactFormThrottle
+        settings.THROTTLE_STORE = 'cache'
+        monkeypatch.setattr(ContactFormThrottle, 'THROTTLE_RATES', {'contact': '1/hour'})
+        
+        assert self.post_message().status_code == status.HTTP_201_CREATED
+        assert self.post_message().status_code == status.HTTP_429_TOO_MANY_REQUESTS
 
 
 @pytest.mark.django_db
@@ -232,6 +276,18 @@ class TestJWTAuthentication:
         assert 'access' in response.data
         assert 'refresh' in response.data
     
+    def test_obtain_token_throttled(self, monkeypatch):
+        """Token endpoint is rate limited per IP"""
+        from brashfox_app.api.throttles import LoginThrottle
+        monkeypatch.setattr(LoginThrottle, 'THROTTLE_RATES', {'login': '2/hour'})
+        for _ in range(2):
+            self.client.post('/api/token/', {'username': 'testuser', 'password': 'wrongpass'})
+        response = self.client.post('/api/token/', {
+            'username': 'testuser',
+            'password': 'testpass123'
+        })
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    
     def test_obtain_token_invalid_credentials(self):
         """Invalid credentials return 401"""
         response = self.client.post('/api/token/', {
@@ -254,6 +310,47 @@ class TestJWTAuthentication:
         response = self.client.get('/api/users/me/')
         assert response.status_code == status.HTTP_200_OK
         assert response.data['username'] == 'testuser'
+    
+    def authenticate(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+    
+    def test_user_principal_cached(self):
+        """Authenticated requests don't load the user row every time"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        self.authenticate()
+        
+        def user_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                assert self.client.get('/api/photos/').status_code == status.HTTP_200_OK
+            return [q for q in ctx.captured_queries if '"auth_user"' in q['sql']]
+        
+        assert len(user_queries()) == 1
+        assert user_queries() == []
+    
+    def test_deactivation_drops_cached_principal(self, django_capture_on_commit_callbacks):
+        """Saving the user invalidates the cached principal once committed"""
+        self.authenticate()
+        assert self.client.get('/api/users/me/').status_code == status.HTTP_200_OK
+        
+        with django_capture_on_commit_callbacks() as callbacks:
+            self.user.is_active = False
+            self.user.save()
+        assert self.client.get('/api/users/me/').status_code == status.HTTP_200_OK
+        
+        for callback in callbacks:
+            callback()
+        assert self.client.get('/api/users/me/').status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_deletion_drops_cached_principal(self, django_capture_on_commit_callbacks):
+        """Deleted users can't keep using their tokens"""
+        self.authenticate()
+        assert self.client.get('/api/users/me/').status_code == status.HTTP_200_OK
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            self.user.delete()
+        assert self.client.get('/api/users/me/').status_code == status.HTTP_401_UNAUTHORIZED
 
 
 @pytest.mark.django_db
@@ -287,3 +384,33 @@ class TestSearchAndFiltering:
         assert response.status_code == status.HTTP_200_OK
         # Newest first
         assert response.data['results'][0]['title'] == 'Python Tips'
+
+
+@pytest.mark.django_db
+class TestMessagePermissions:
+    """Contact messages are readable by admins only"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='user', password='pass123')
+        self.admin = User.objects.create_superuser(username='admin', email='admin@test.com', password='admin123')
+        self.message = Message.objects.create(
+            name='John Doe', email='john@test.com', topic='Question', message='Test message'
+        )
+    
+    def test_regular_user_cannot_read_messages(self):
+        self.client.force_authenticate(user=self.user)
+        assert self.client.get('/api/messages/').status_code == status.HTTP_403_FORBIDDEN
+        response = self.client.get(f'/api/messages/{self.message.id}/')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_regular_user_cannot_delete_messages(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.delete(f'/api/messages/{self.message.id}/')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert Message.objects.exists()
+    
+    def test_admin_can_read_messages(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get('/api/messages/')
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,55 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from brashfox_app.models import BlogPost
+
+
+@pytest.mark.django_db
+class TestBlogPostFullTextSearch:
+    """Test the full-text search backend for /api/blog-posts/?search="""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='author', password='pass123')
+        self.in_body = BlogPost.objects.create(
+            title='Sesja w plenerze', slug='sesja-w-plenerze',
+            post='Zrobiłam makijaż ślubny dla panny młodej.', author=self.user
+        )
+        self.in_title = BlogPost.objects.create(
+            title='Makijaż ślubny krok po kroku', slug='makijaz-slubny',
+            post='Poradnik dla przyszłych panien młodych.', author=self.user
+        )
+        BlogPost.objects.create(
+            title='Kosmetyki', slug='kosmetyki',
+            post='Przegląd pędzli i podkładów.', author=self.user
+        )
+    
+    def search(self, query):
+        response = self.client.get('/api/blog-posts/', {'search': query})
+        return [item['slug'] for item in response.data['results']]
+    
+    def test_title_matches_rank_first(self):
+        """Title hits are ranked above body hits"""
+        assert self.search('makijaż ślubny') == ['makijaz-slubny', 'sesja-w-plenerze']
+    
+    def test_prefix_matching(self):
+        """Partial words match as prefixes"""
+        assert set(self.search('makij')) == {'makijaz-slubny', 'sesja-w-plenerze'}
+    
+    def test_index_follows_updates_and_deletes(self):
+        """Saving and deleting posts keeps the index in sync"""
+        self.in_body.post = 'Nowa treść bez tego słowa.'
+        self.in_body.save()
+        self.in_title.delete()
+        
+        assert self.search('makijaż') == []
+    
+    def test_rebuild_command(self):
+        """Rows changed behind the ORM's back are picked up by a rebuild"""
+        BlogPost.objects.filter(pk=self.in_body.pk).update(post='Pędzle')
+        assert 'sesja-w-plenerze' in self.search('makijaż')
+        
+        call_command('rebuild_search_index')
+        assert self.search('makijaż') == ['makijaz-slubny']
@@ -0,0 +1,68 @@
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+
+from brashfox_app.models import Message, OutgoingEmail
+from brashfox_app.api.services import MessageService, OutboxService
+
+
+@pytest.fixture
+def admins(settings):
+    settings.ADMINS = [('Admin', 'admin@brashfox.test')]
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+
+@pytest.mark.django_db
+class TestContactOutbox:
+    """Contact form notifications go through the outbox"""
+    
+    def send_contact_message(self):
+        return MessageService.create_message({
+            'name': 'Jan Kowalski',
+            'email': 'jan@test.com',
+            'topic': 'Makijaż ślubny',
+            'message': 'Czy termin 12 czerwca jest wolny?',
+        })
+    
+    def test_message_queues_email_without_sending(self, admins):
+        """Request only writes the outbox row"""
+        self.send_contact_message()
+        
+        assert Message.objects.count() == 1
+        queued = OutgoingEmail.objects.get()
+        assert queued.recipients == ['admin@brashfox.test']
+        assert 'Makijaż ślubny' in queued.subject
+        assert mail.outbox == []
+    
+    def test_worker_delivers_batch(self, admins):
+        """deliver_outbox sends every due e-mail and marks it as sent"""
+        self.send_contact_message()
+        self.send_contact_message()
+        
+        call_command('deliver_outbox', '--once')
+        
+        assert len(mail.outbox) == 2
+        assert set(OutgoingEmail.objects.values_list('status', flat=True)) == {OutgoingEmail.STATUS_SENT}
+    
+    def test_failed_delivery_is_retried_with_backoff(self, admins, monkeypatch):
+        """Failures are rescheduled, then given up after max attempts"""
+        self.send_contact_message()
+        
+        def broken_send(self):
+            raise ConnectionError('SMTP down')
+        monkeypatch.setattr('django.core.mail.EmailMessage.send', broken_send)
+        
+        call_command('deliver_outbox', '--once', '--max-attempts', '2')
+        queued = OutgoingEmail.objects.get()
+        assert queued.status == OutgoingEmail.STATUS_PENDING
+        assert queued.attempts == 1
+        assert queued.next_attempt > timezone.now()
+        assert 'SMTP down' in queued.last_error
+        
+        # Not due yet - nothing to claim
+        assert OutboxService.claim_batch(10) == []
+        
+        OutgoingEmail.objects.update(next_attempt=timezone.now())
+        call_command('deliver_outbox', '--once', '--max-attempts', '2')
+        assert OutgoingEmail.objects.get().status == OutgoingEmail.STATUS_FAILED
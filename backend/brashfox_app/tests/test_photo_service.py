@@ -0,0 +1,525 @@
+import base64
+import io
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from PIL import ExifTags, Image
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from brashfox_app.models import (
+    AboutMe,
+    FotoCategory,
+    FotoDescription,
+    FotoTags,
+    ImageBlob,
+    ImageProcessingJob,
+)
+from brashfox_app.api.services import ImageProcessingService, PhotoService
+
+
+def make_image(name='photo.jpg', size=(2000, 1000), fmt='JPEG'):
+    """Build an in-memory uploaded image."""
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color=(200, 120, 80)).save(buffer, format=fmt)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+def process_queue():
+    call_command('process_images', '--once', '--workers', '1')
+
+
+@pytest.mark.django_db
+class TestImageVariants:
+    """Test responsive variant generation"""
+    
+    def setup_method(self):
+        self.user = User.objects.create_user(username='photographer', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+    
+    def test_create_photo_queues_processing(self, media_root):
+        """Upload only queues the work, variants are not rendered inline"""
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        
+        assert photo.processing_status == FotoDescription.PROCESSING_PENDING
+        assert photo.variants == {}
+        assert ImageProcessingJob.objects.filter(
+            photo=photo, status=ImageProcessingJob.STATUS_PENDING
+        ).exists()
+    
+    def test_worker_generates_variants(self, media_root):
+        """Thumbnail, medium and large renditions are stored with dimensions"""
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        process_queue()
+        photo.refresh_from_db()
+        
+        assert photo.processing_status == FotoDescription.PROCESSING_READY
+        assert set(photo.variants) == {'thumbnail', 'medium', 'large'}
+        assert photo.variants['thumbnail']['width'] == 300
+        assert photo.variants['thumbnail']['height'] == 150
+        assert photo.variants['large']['width'] == 1600
+        for data in photo.variants.values():
+            assert (media_root / data['path']).exists()
+    
+    def test_update_photo_replaces_variants(self, media_root, django_capture_on_commit_callbacks):
+        """New image drops old variant files"""
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        process_queue()
+        photo.refresh_from_db()
+        old_paths = [data['path'] for data in photo.variants.values()]
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            PhotoService.update_photo(photo, {'image': make_image('other.jpg', (400, 800))})
+        process_queue()
+        photo.refresh_from_db()
+        
+        assert photo.variants['medium']['height'] == 800
+        for path in old_paths:
+            assert not (media_root / path).exists()
+    
+    def test_list_exposes_srcset(self, media_root):
+        """Photo list returns variant URLs instead of only the original"""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.post('/api/photos/', {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category_id': self.category.id,
+        }, format='multipart')
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['processing_status'] == FotoDescription.PROCESSING_PENDING
+        assert response.data['srcset'] is None
+        
+        process_queue()
+        response = client.get('/api/photos/')
+        assert response.data['results'][0]['processing_status'] == FotoDescription.PROCESSING_READY
+        srcset = response.data['results'][0]['srcset']
+        assert srcset['thumbnail']['url'].endswith('_thumbnail.webp')
+        assert srcset['medium']['width'] == 800
+    
+    def test_broken_image_marks_photo_failed(self, media_root, django_capture_on_commit_callbacks):
+        """Jobs that keep failing end up with a failed photo status"""
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        (media_root / photo.image.name).write_bytes(b'not an image')
+        client = APIClient()
+        response = client.get('/api/photos/')
+        assert response.data['results'][0]['processing_status'] == FotoDescription.PROCESSING_PENDING
+        etag = response['ETag']
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command('process_images', '--once', '--workers', '1', '--max-attempts', '1')
+        photo.refresh_from_db()
+        
+        assert photo.processing_status == FotoDescription.PROCESSING_FAILED
+        assert photo.processing_jobs.get().status == ImageProcessingJob.STATUS_FAILED
+        
+        response = client.get('/api/photos/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['results'][0]['processing_status'] == FotoDescription.PROCESSING_FAILED
+    
+    def test_stale_claim_is_reclaimed(self, media_root):
+        """Jobs of a crashed worker are claimed again once the lease expires"""
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        job = ImageProcessingService.claim_jobs(10)[0]
+        assert ImageProcessingService.claim_jobs(10) == []
+        
+        ImageProcessingJob.objects.filter(pk=job.pk).update(
+            updated=timezone.now() - ImageProcessingService.CLAIM_LEASE - timedelta(seconds=1)
+        )
+        process_queue()
+        photo.refresh_from_db()
+        assert photo.processing_status == FotoDescription.PROCESSING_READY
+        assert photo.processing_jobs.get().attempts == 2
+
+
+@pytest.mark.django_db
+class TestImageMetadata:
+    """Test metadata read from the image header on upload"""
+    
+    def setup_method(self):
+        self.user = User.objects.create_user(username='photographer', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+    
+    def create(self, image):
+        return PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': image,
+            'foto_category': self.category,
+        })
+    
+    def test_metadata_stored(self, media_root):
+        image = make_image(size=(2000, 1000))
+        photo = self.create(image)
+        photo.refresh_from_db()
+        
+        assert (photo.width, photo.height) == (2000, 1000)
+        assert photo.file_size == image.size
+        assert photo.image_format == 'jpeg'
+        assert photo.orientation == FotoDescription.ORIENTATION_LANDSCAPE
+    
+    def test_exif_rotation_applied(self, media_root):
+        buffer = io.BytesIO()
+        exif = Image.Exif()
+        exif[ExifTags.Base.Orientation] = 6
+        Image.new('RGB', (600, 400)).save(buffer, format='JPEG', exif=exif)
+        photo = self.create(SimpleUploadedFile('rotated.jpg', buffer.getvalue()))
+        
+        assert (photo.width, photo.height) == (400, 600)
+        assert photo.orientation == FotoDescription.ORIENTATION_PORTRAIT
+    
+    def test_oversized_dimensions_rejected(self, media_root):
+        with pytest.raises(ValidationError):
+            self.create(make_image(size=(4001, 100), fmt='PNG'))
+        assert not FotoDescription.objects.exists()
+    
+    def test_list_exposes_and_filters_metadata(self, media_root):
+        self.create(make_image(size=(300, 300), fmt='PNG'))
+        self.create(make_image('tall.jpg', size=(300, 900)))
+        
+        response = APIClient().get('/api/photos/?orientation=portrait')
+        assert response.data['count'] == 1
+        photo = response.data['results'][0]
+        assert (photo['width'], photo['height']) == (300, 900)
+        assert photo['image_format'] == 'jpeg'
+        assert photo['orientation'] == 'portrait'
+        
+        response = APIClient().get('/api/photos/?image_format=png')
+        assert response.data['results'][0]['orientation'] == 'square'
+
+
+@pytest.mark.django_db
+class TestImagePlaceholders:
+    """Test inline low-quality image placeholders"""
+    
+    def setup_method(self):
+        self.user = User.objects.create_user(username='photographer', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+    
+    def decode(self, placeholder):
+        prefix = 'data:image/webp;base64,'
+        assert placeholder.startswith(prefix)
+        return Image.open(io.BytesIO(base64.b64decode(placeholder[len(prefix):])))
+    
+    def test_worker_renders_placeholder(self, media_root):
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(size=(2000, 1000)),
+            'foto_category': self.category,
+        })
+        assert photo.placeholder == ''
+        process_queue()
+        photo.refresh_from_db()
+        
+        assert len(photo.placeholder) < 1000
+        with self.decode(photo.placeholder) as image:
+            assert image.format == 'WEBP'
+            assert image.size == (20, 10)
+    
+    def test_placeholder_inline_in_list(self, media_root):
+        PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        process_queue()
+        response = APIClient().get('/api/photos/')
+        assert response.data['results'][0]['placeholder'].startswith('data:image/webp;base64,')
+    
+    def test_new_image_drops_stale_placeholder(self, media_root):
+        photo = PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(),
+            'foto_category': self.category,
+        })
+        process_queue()
+        photo.refresh_from_db()
+        
+        PhotoService.update_photo(photo, {'image': make_image('other.jpg', (400, 800))})
+        assert FotoDescription.objects.get(pk=photo.pk).placeholder == ''
+    
+    def test_profile_image_placeholder(self, media_root):
+        about = AboutMe.objects.create(name='Anna', bio='Makijaż', profile_image=make_image())
+        assert about.profile_image_placeholder
+        rendered = about.profile_image_placeholder
+        
+        about.bio = 'Makijaż ślubny'
+        about.save()
+        assert about.profile_image_placeholder == rendered
+        
+        response = APIClient().get('/api/about/')
+        assert response.data['profile_image_placeholder'] == rendered
+
+
+@pytest.mark.django_db
+class TestImageDeduplication:
+    """Test content-addressed photo storage"""
+    
+    def setup_method(self):
+        self.user = User.objects.create_user(username='photographer', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+    
+    def create(self, name='photo.jpg'):
+        return PhotoService.create_photo(self.user, {
+            'name': 'Bride',
+            'image': make_image(name),
+            'foto_category': self.category,
+        })
+    
+    def test_identical_uploads_share_one_file(self, media_root):
+        first = self.create('a.jpg')
+        second = self.create('b.jpg')
+        
+        assert first.image.name == second.image.name
+        assert first.image_blob_id == second.image_blob_id
+        blob = ImageBlob.objects.get()
+        assert blob.ref_count == 2
+        assert first.image.name == f'photos/{blob.sha256[:2]}/{blob.sha256}.jpg'
+        assert len([p for p in media_root.rglob('*') if p.is_file()]) == 1
+    
+    def test_duplicate_reuses_processed_variants(self, media_root):
+        first = self.create()
+        process_queue()
+        
+        second = self.create()
+        first.refresh_from_db()
+        assert second.processing_status == FotoDescription.PROCESSING_READY
+        assert second.variants == first.variants
+        assert second.placeholder == first.placeholder
+        assert not ImageProcessingJob.objects.filter(photo=second).exists()
+    
+    def test_file_deleted_with_last_reference(self, media_root, django_capture_on_commit_callbacks):
+        first = self.create()
+        second = self.create()
+        process_queue()
+        path = media_root / first.image.name
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            first.delete()
+        assert path.exists()
+        assert ImageBlob.objects.get().ref_count == 1
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            second.delete()
+        assert not path.exists()
+        assert not ImageBlob.objects.exists()
+        assert not list(media_root.rglob('*.webp'))
+    
+    def test_dedupe_media_merges_existing_files(self, media_root, django_capture_on_commit_callbacks):
+        content = make_image().read()
+        (media_root / 'photos').mkdir()
+        for name in ('a.jpg', 'b.jpg'):
+            (media_root / 'photos' / name).write_bytes(content)
+        first = FotoDescription.objects.create(
+            name='A', image='photos/a.jpg', foto_category=self.category,
+        )
+        second = FotoDescription.objects.create(
+            name='B', image='photos/b.jpg', foto_category=self.category,
+        )
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command('dedupe_media')
+        first.refresh_from_db()
+        second.refresh_from_db()
+        
+        assert second.image.name == first.image.name == 'photos/a.jpg'
+        assert ImageBlob.objects.get().ref_count == 2
+        assert not (media_root / 'photos' / 'b.jpg').exists()
+
+
+@pytest.mark.django_db
+class TestPhotoFacets:
+    """Test faceted photo search"""
+    
+    def setup_method(self):
+        self.wedding = FotoCategory.objects.create(category='Ślub')
+        self.portrait = FotoCategory.objects.create(category='Portret')
+        self.bride = FotoDescription.objects.create(
+            name='Bride', image='photos/bride.jpg', foto_category=self.wedding,
+            event='Wesele', author='anna',
+        )
+        self.groom = FotoDescription.objects.create(
+            name='Groom', image='photos/groom.jpg', foto_category=self.wedding,
+            event='Wesele', author='piotr',
+        )
+        self.face = FotoDescription.objects.create(
+            name='Face', image='photos/face.jpg', foto_category=self.portrait,
+            author='anna',
+        )
+        self.outdoor = FotoTags.objects.create(tags='plener')
+        self.outdoor.foto_description.add(self.bride, self.face)
+        self.client = APIClient()
+    
+    def test_counts_without_filters(self):
+        response = self.client.get('/api/photos/facets/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        facets = response.data['facets']
+        assert facets['categories'] == [
+            {'id': self.wedding.id, 'name': 'Ślub', 'count': 2},
+            {'id': self.portrait.id, 'name': 'Portret', 'count': 1},
+        ]
+        assert facets['tags'] == [{'id': self.outdoor.id, 'name': 'plener', 'count': 2}]
+        assert facets['events'] == [{'value': 'Wesele', 'count': 2}]
+        assert facets['authors'] == [{'value': 'anna', 'count': 2}, {'value': 'piotr', 'count': 1}]
+    
+    def test_multi_select_filters(self):
+        """OR inside a facet, AND across facets; own filter ignored for own counts"""
+        response = self.client.get(
+            f'/api/photos/facets/?category={self.wedding.id},{self.portrait.id}&author=anna'
+        )
+        assert response.data['count'] == 2
+        facets = response.data['facets']
+        assert {c['id']: c['count'] for c in facets['categories']} == {
+            self.wedding.id: 1, self.portrait.id: 1,
+        }
+        assert facets['authors'] == [{'value': 'anna', 'count': 2}, {'value': 'piotr', 'count': 1}]
+        
+        response = self.client.get(f'/api/photos/facets/?tag={self.outdoor.id}&author=piotr')
+        assert response.data['count'] == 0
+    
+    def test_one_grouped_query_per_facet(self, django_assert_num_queries):
+        filters = {'tag': [self.outdoor.id], 'author': ['anna']}
+        with django_assert_num_queries(4):
+            PhotoService.get_facet_counts(filters)
+        with django_assert_num_queries(0):
+            PhotoService.get_facet_counts(filters)
+    
+    def test_multiple_authors(self):
+        """Author is a multi-select facet in both query string forms"""
+        for query in ('author=anna,piotr', 'author=anna&author=piotr'):
+            response = self.client.get(f'/api/photos/facets/?{query}&ordering=name')
+            assert response.data['count'] == 3
+            assert [item['name'] for item in response.data['results']] == ['Bride', 'Face', 'Groom']
+        
+        response = self.client.get('/api/photos/facets/?author=piotr')
+        assert response.data['count'] == 1
+        assert response.data['facets']['authors'] == [
+            {'value': 'anna', 'count': 2}, {'value': 'piotr', 'count': 1},
+        ]
+    
+    def test_counts_cached_and_invalidated(self, django_capture_on_commit_callbacks):
+        self.client.get('/api/photos/facets/')
+        response = self.client.get('/api/photos/facets/')
+        assert response.data['facets']['tags'][0]['count'] == 2
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            self.outdoor.foto_description.add(self.groom)
+        response = self.client.get('/api/photos/facets/')
+        assert response.data['facets']['tags'][0]['count'] == 3
+    
+    def test_invalid_id_rejected(self):
+        response = self.client.get('/api/photos/facets/?category=abc')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestTagLookup:
+    """Test exact, normalized tag lookups"""
+    
+    def setup_method(self):
+        category = FotoCategory.objects.create(category='Ślub')
+        self.bride, self.groom, self.face = [
+            FotoDescription.objects.create(name=name, image=f'photos/{name}.jpg', foto_category=category)
+            for name in ('Bride', 'Groom', 'Face')
+        ]
+        self.outdoor = FotoTags.objects.create(tags='Plener  Zimowy')
+        self.bw = FotoTags.objects.create(tags='BW')
+        self.outdoor.foto_description.add(self.bride, self.groom)
+        self.bw.foto_description.add(self.bride, self.face)
+        self.client = APIClient()
+    
+    def names(self, response):
+        return sorted(item['name'] for item in response.data['results'])
+    
+    def test_tag_is_normalized(self):
+        assert self.outdoor.normalized == 'plener zimowy'
+    
+    def test_get_photos_by_tag(self):
+        photos = PhotoService.get_photos_by_tag(' plener zimowy ')
+        assert set(photos) == {self.bride, self.groom}
+        assert not PhotoService.get_photos_by_tag('plener').exists()
+    
+    def test_match_any_and_all(self):
+        response = self.client.get('/api/photos/?tags=plener zimowy,bw')
+        assert self.names(response) == ['Bride', 'Face', 'Groom']
+        
+        response = self.client.get('/api/photos/?tags=plener zimowy,bw&match=all')
+        assert self.names(response) == ['Bride']
+    
+    def test_invalid_match_rejected(self):
+        response = self.client.get('/api/photos/?tags=bw&match=some')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_duplicate_tag_rejected(self):
+        user = User.objects.create_user(username='tagger', password='pass123')
+        self.client.force_authenticate(user=user)
+        response = self.client.post('/api/photo-tags/', {
+            'tags': 'bw', 'photo_ids': [self.face.id],
+        }, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestTagSuggest:
+    """Test tag autocomplete"""
+    
+    def setup_method(self):
+        category = FotoCategory.objects.create(category='Ślub')
+        photos = [
+            FotoDescription.objects.create(name=f'Photo {i}', image=f'photos/{i}.jpg', foto_category=category)
+            for i in range(3)
+        ]
+        self.plener = FotoTags.objects.create(tags='Plener')
+        self.plaza = FotoTags.objects.create(tags='Plaża')
+        FotoTags.objects.create(tags='Studio')
+        self.plener.foto_description.add(photos[0])
+        self.plaza.foto_description.add(*photos)
+        self.client = APIClient()
+    
+    def test_prefix_ranked_by_photo_count(self):
+        response = self.client.get('/api/photo-tags/suggest/?q=PL')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {'id': self.plaza.id, 'tags': 'Plaża', 'photo_count': 3},
+            {'id': self.plener.id, 'tags': 'Plener', 'photo_count': 1},
+        ]
+        assert self.client.get('/api/photo-tags/suggest/?q=ple').data[0]['tags'] == 'Plener'
+        assert self.client.get('/api/photo-tags/suggest/?q=').data == []
+    
+    def test_index_served_from_memory(self, django_assert_num_queries):
+        self.client.get('/api/photo-tags/suggest/?q=p')
+        with django_assert_num_queries(0):
+            self.client.get('/api/photo-tags/suggest/?q=st&limit=1')
+    
+    def test_rebuilt_after_tag_change(self, django_capture_on_commit_callbacks):
+        self.client.get('/api/photo-tags/suggest/?q=p')
+        with django_capture_on_commit_callbacks(execute=True):
+            FotoTags.objects.create(tags='Portret')
+        tags = [item['tags'] for item in self.client.get('/api/photo-tags/suggest/?q=p').data]
+        assert 'Portret' in tags
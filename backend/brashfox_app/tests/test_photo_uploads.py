@@ -0,0 +1,165 @@
+import io
+import os
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from brashfox_app.models import FotoCategory, FotoDescription, PhotoUpload
+from brashfox_app.api.services import UploadService
+from brashfox_app.api.utils.constants import FileUpload
+
+
+def image_bytes(size=(400, 300), fmt='JPEG'):
+    buffer = io.BytesIO()
+    Image.effect_noise(size, 64).convert('RGB').save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def upload_dir(settings, tmp_path):
+    settings.CHUNKED_UPLOAD_DIR = str(tmp_path / 'uploads')
+    return tmp_path / 'uploads'
+
+
+@pytest.mark.django_db
+class TestChunkedUpload:
+    """Test the resumable upload protocol"""
+    
+    def setup_method(self):
+        self.user = User.objects.create_user(username='photographer', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.content = image_bytes()
+    
+    def start(self):
+        response = self.client.post('/api/photo-uploads/', {
+            'filename': 'bride.jpg', 'size': len(self.content),
+        }, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.data['id']
+    
+    def put(self, upload_id, start, end):
+        return self.client.put(
+            f'/api/photo-uploads/{upload_id}/',
+            data=self.content[start:end],
+            content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{end - 1}/{len(self.content)}',
+        )
+    
+    def test_session_uses_sparse_file(self, upload_dir):
+        upload_id = self.start()
+        path = upload_dir / f'{upload_id}.part'
+        assert path.stat().st_size == len(self.content)
+    
+    def test_chunks_in_any_order_then_finalize(self, upload_dir, media_root):
+        upload_id = self.start()
+        middle = len(self.content) // 2
+        
+        response = self.put(upload_id, middle, len(self.content))
+        assert response.data['received_ranges'] == [[middle, len(self.content)]]
+        assert response.data['complete'] is False
+        
+        response = self.put(upload_id, 0, middle)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['received'] == len(self.content)
+        assert response.data['complete'] is True
+        
+        response = self.client.post(f'/api/photo-uploads/{upload_id}/finalize/', {
+            'name': 'Bride', 'foto_category_id': self.category.id,
+        }, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+        
+        photo = FotoDescription.objects.get()
+        assert photo.author == 'photographer'
+        assert (media_root / photo.image.name).read_bytes() == self.content
+        assert not PhotoUpload.objects.exists()
+        assert not os.listdir(upload_dir)
+    
+    def test_resend_after_failure_is_merged(self, upload_dir):
+        upload_id = self.start()
+        self.put(upload_id, 0, 1000)
+        self.put(upload_id, 500, 1500)
+        
+        response = self.client.get(f'/api/photo-uploads/{upload_id}/')
+        assert response.data['received_ranges'] == [[0, 1500]]
+        assert response.data['received'] == 1500
+    
+    def test_finalize_incomplete_rejected(self, upload_dir):
+        upload_id = self.start()
+        self.put(upload_id, 0, 1000)
+        response = self.client.post(f'/api/photo-uploads/{upload_id}/finalize/', {
+            'name': 'Bride', 'foto_category_id': self.category.id,
+        }, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not FotoDescription.objects.exists()
+    
+    def test_first_chunk_checked_for_image_signature(self, upload_dir):
+        self.content = b'#!/bin/sh\n' + bytes(2000)
+        upload_id = self.start()
+        response = self.put(upload_id, 0, 1000)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert PhotoUpload.objects.get().received == 0
+    
+    def test_signature_split_across_ranges(self, upload_dir):
+        """A first range shorter than the signature is checked once completed"""
+        upload_id = self.start()
+        assert self.put(upload_id, 0, 5).status_code == status.HTTP_200_OK
+        response = self.put(upload_id, 5, len(self.content))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['complete'] is True
+        
+        self.content = b'#!/bin/sh\n' + bytes(2000)
+        upload_id = self.start()
+        self.put(upload_id, 0, 5)
+        assert self.put(upload_id, 5, 1000).status_code == status.HTTP_400_BAD_REQUEST
+        assert PhotoUpload.objects.get(pk=upload_id).received == 5
+    
+    def test_short_reads_buffered_for_signature(self, upload_dir):
+        """The body may arrive in reads shorter than the signature"""
+        class TrickleStream(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(min(size, 3))
+        
+        self.content = image_bytes(fmt='PNG')
+        upload = UploadService.create_session(self.user, 'bride.png', len(self.content))
+        upload = UploadService.write_chunk(upload, 0, 100, TrickleStream(self.content[:100]))
+        assert upload.received_ranges == [[0, 100]]
+    
+    def test_invalid_range_rejected(self, upload_dir):
+        upload_id = self.start()
+        response = self.client.put(
+            f'/api/photo-uploads/{upload_id}/',
+            data=self.content[:10],
+            content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes 0-9/{len(self.content) + 1}',
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_sessions_are_private(self, upload_dir):
+        upload_id = self.start()
+        other = APIClient()
+        other.force_authenticate(User.objects.create_user(username='other', password='pass123'))
+        assert other.get(f'/api/photo-uploads/{upload_id}/').status_code == status.HTTP_404_NOT_FOUND
+    
+    def test_expired_sessions_purged_by_command(self, upload_dir):
+        """Abandoned sessions go away without a new upload starting"""
+        upload_id = self.start()
+        self.put(upload_id, 0, 1000)
+        PhotoUpload.objects.update(
+            created=timezone.now() - timedelta(seconds=FileUpload.UPLOAD_SESSION_LIFETIME + 1)
+        )
+        
+        call_command('purge_uploads')
+        assert not PhotoUpload.objects.exists()
+        assert not os.listdir(upload_dir)
+    
+    def test_merge_range(self):
+        assert UploadService.merge_range([[0, 10], [20, 30]], 10, 20) == [[0, 30]]
+        assert UploadService.merge_range([[20, 30]], 0, 5) == [[0, 5], [20, 30]]
@@ -0,0 +1,271 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from brashfox_app.models import (
+    BlogPost,
+    FotoCategory,
+    FotoDescription,
+    FotoTags,
+    PostCategory,
+    PostComments,
+)
+
+
+def count_queries(client, url):
+    """Return (response, number of SQL queries) for a GET request."""
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    return response, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestBlogPostListQueries:
+    """List endpoint must not issue per-row COUNT queries"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.authors = [
+            User.objects.create_user(username=f'author{i}', password='pass123')
+            for i in range(3)
+        ]
+    
+    def create_posts(self, count):
+        for i in range(count):
+            post = BlogPost.objects.create(
+                title=f'Post {i}',
+                slug=f'post-{BlogPost.objects.count()}',
+                post='Content',
+                author=self.authors[i % len(self.authors)],
+            )
+            PostComments.objects.create(blog_post=post, comment='Nice post!', author='reader')
+    
+    def test_constant_queries_regardless_of_page_size(self, django_capture_on_commit_callbacks):
+        """Query count doesn't grow with the number of posts on a page"""
+        self.create_posts(2)
+        _, small_page = count_queries(self.client, '/api/blog-posts/')
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            self.create_posts(8)
+        response, full_page = count_queries(self.client, '/api/blog-posts/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 10
+        assert full_page == small_page
+    
+    def test_annotated_counts_are_correct(self):
+        """Annotated counters match the real number of rows"""
+        self.create_posts(4)
+        response = self.client.get('/api/blog-posts/')
+        
+        for item in response.data['results']:
+            post = BlogPost.objects.get(pk=item['id'])
+            assert item['comments_count'] == post.comments.count()
+            assert item['author']['blog_posts_count'] == post.author.blog_posts.count()
+
+
+@pytest.mark.django_db
+class TestPhotoTagQueries:
+    """Photo tags are prefetched for the whole page"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        category = FotoCategory.objects.create(category='Ślub')
+        self.tags = [FotoTags.objects.create(tags=name) for name in ('plener', 'studio')]
+        for i in range(5):
+            photo = FotoDescription.objects.create(
+                name=f'Photo {i}', image=f'photos/{i}.jpg', foto_category=category,
+            )
+            photo.tags.add(*self.tags[:i % 3])
+    
+    def tag_queries(self, url):
+        table = FotoTags._meta.db_table
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        return response, [q for q in ctx.captured_queries if f'"{table}"' in q['sql']]
+    
+    def test_list_loads_tags_in_one_query(self):
+        response, queries = self.tag_queries('/api/photos/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+        by_name = {item['name']: item['tags'] for item in response.data['results']}
+        assert by_name['Photo 0'] == []
+        assert by_name['Photo 2'] == ['plener', 'studio']
+    
+    def test_detail_returns_flat_tags(self):
+        photo = FotoDescription.objects.get(name='Photo 1')
+        response, queries = self.tag_queries(f'/api/photos/{photo.id}/')
+        
+        assert len(queries) == 1
+        assert response.data['tags'] == ['plener']
+
+
+@pytest.mark.django_db
+class TestPhotoTagListQueries:
+    """Tag list is compact and doesn't serialize photos unless asked"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.category = FotoCategory.objects.create(category='Ślub')
+    
+    def create_tags(self, count):
+        for i in range(count):
+            photo = FotoDescription.objects.create(
+                name=f'Photo {i}', image=f'photos/{i}.jpg', foto_category=self.category,
+            )
+            tag = FotoTags.objects.create(tags=f'tag-{FotoTags.objects.count()}')
+            tag.foto_description.add(photo)
+    
+    def test_compact_list_constant_queries(self, django_capture_on_commit_callbacks):
+        self.create_tags(2)
+        _, small_page = count_queries(self.client, '/api/photo-tags/')
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            self.create_tags(8)
+        response, full_page = count_queries(self.client, '/api/photo-tags/')
+        
+        assert full_page == small_page
+        item = response.data['results'][0]
+        assert set(item) == {'id', 'tags', 'photo_count'}
+        assert item['photo_count'] == 1
+    
+    def test_expand_photos(self):
+        self.create_tags(3)
+        response = self.client.get('/api/photo-tags/?expand=photos')
+        
+        assert response.status_code == status.HTTP_200_OK
+        for item in response.data['results']:
+            assert len(item['photos']) == item['photo_count'] == 1
+
+
+@pytest.mark.django_db
+class TestCategoryCountQueries:
+    """Category counts come from annotations, not per-row COUNTs"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.author = User.objects.create_user(username='author', password='pass123')
+    
+    def create_photo_categories(self, count):
+        for i in range(count):
+            category = FotoCategory.objects.create(category=f'Category {FotoCategory.objects.count()}')
+            for j in range(i + 1):
+                FotoDescription.objects.create(
+                    name=f'Photo {j}', image=f'photos/{j}.jpg', foto_category=category,
+                )
+    
+    def test_photo_categories_constant_queries(self, django_capture_on_commit_callbacks):
+        self.create_photo_categories(2)
+        _, small_page = count_queries(self.client, '/api/photo-categories/')
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            self.create_photo_categories(6)
+        response, full_page = count_queries(self.client, '/api/photo-categories/')
+        
+        assert full_page == small_page
+        for item in response.data['results']:
+            assert item['photos_count'] == FotoDescription.objects.filter(
+                foto_category_id=item['id']
+            ).count()
+    
+    def test_photo_list_constant_queries(self, django_capture_on_commit_callbacks):
+        """Nested category is slim, so photo rows cost no extra COUNT"""
+        self.create_photo_categories(1)
+        _, small_page = count_queries(self.client, '/api/photos/')
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            self.create_photo_categories(3)
+        response, full_page = count_queries(self.client, '/api/photos/')
+        
+        assert full_page == small_page
+        assert set(response.data['results'][0]['foto_category']) == {'id', 'category'}
+    
+    def test_post_categories_annotated_count(self):
+        category = PostCategory.objects.create(category='Ślub')
+        for i in range(3):
+            post = BlogPost.objects.create(
+                title=f'Post {i}', slug=f'post-{i}', post='Content', author=self.author,
+            )
+            category.blog_post.add(post)
+        
+        response = self.client.get('/api/post-categories/')
+        assert response.data['results'][0]['posts_count'] == 3
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+    """Opt-in keyset pagination for infinite scroll"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='author', password='pass123')
+        for i in range(15):
+            BlogPost.objects.create(
+                title=f'Post {i}', slug=f'post-{i}', post='Content', author=self.user
+            )
+    
+    def test_page_number_is_default(self):
+        """Without opting in, clients still get totals"""
+        response = self.client.get('/api/blog-posts/')
+        assert response.data['count'] == 15
+    
+    def test_cursor_mode_walks_all_posts_without_count(self):
+        """Following `next` visits every post once, newest first, no COUNT(*)"""
+        url = '/api/blog-posts/?pagination=cursor'
+        slugs = []
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert 'count' not in response.data
+            assert not any('COUNT(*)' in q['sql'] for q in ctx.captured_queries)
+            slugs += [item['slug'] for item in response.data['results']]
+            url = response.data['next']
+        
+        expected = list(BlogPost.objects.order_by('-created', '-id').values_list('slug', flat=True))
+        assert slugs == expected
+
+
+@pytest.mark.django_db
+class TestUserStatistics:
+    """Profile statistics are cached and updated incrementally"""
+    
+    def setup_method(self):
+        from brashfox_app.api.services import UserService
+        self.service = UserService
+        self.user = User.objects.create_user(username='author', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+        self.post = BlogPost.objects.create(title='Post', slug='post', post='Content', author=self.user)
+        PostComments.objects.create(blog_post=self.post, comment='Hi', author='author')
+    
+    def test_miss_is_one_query_then_cached(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            stats = self.service.get_user_statistics(self.user)
+        assert stats == {'blog_posts_count': 1, 'comments_count': 1, 'photos_count': 0}
+        
+        with django_assert_num_queries(0):
+            self.service.get_user_statistics(self.user)
+    
+    def test_signals_update_cached_counters(self, django_capture_on_commit_callbacks):
+        self.service.get_user_statistics(self.user)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            FotoDescription.objects.create(
+                name='Photo', image='photos/a.jpg', foto_category=self.category, author='author',
+            )
+            BlogPost.objects.create(title='Second', slug='second', post='Content', author=self.user)
+            self.post.comments.get().delete()
+        
+        assert self.service.get_user_statistics(self.user) == {
+            'blog_posts_count': 2, 'comments_count': 0, 'photos_count': 1,
+        }
+    
+    def test_me_endpoint_includes_statistics(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.get('/api/users/me/')
+        assert response.data['statistics']['blog_posts_count'] == 1
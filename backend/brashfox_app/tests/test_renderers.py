@@ -0,0 +1,54 @@
+import io
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from brashfox_app.api.parsers import ORJSONParser
+from brashfox_app.api.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """orjson renderer output matches DRF's JSONRenderer"""
+    
+    def test_same_bytes_as_json_renderer(self):
+        data = {
+            'created': datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            'price': Decimal('19.99'),
+            'label': gettext_lazy('Zdjęcie'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'text': 'Makijaż ślubny',
+            'nested': [{'id': 1, 'tags': ('plener', 'ślub')}],
+            3: None,
+        }
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+    
+    def test_indent(self):
+        rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        assert rendered == b'{\n  "a": 1\n}'
+    
+    def test_none_renders_empty(self):
+        assert ORJSONRenderer().render(None) == b''
+
+
+class TestORJSONParser:
+    
+    def test_parse(self):
+        assert ORJSONParser().parse(io.BytesIO('{"name": "Ślub"}'.encode())) == {'name': 'Ślub'}
+    
+    def test_invalid_json(self):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"name": NaN}'))
+
+
+@pytest.mark.django_db
+def test_api_uses_stdlib_json_by_default():
+    """orjson is opt-in (API_FAST_JSON), installing it changes nothing"""
+    from rest_framework.test import APIClient
+    response = APIClient().get('/api/photos/', HTTP_ACCEPT='application/json')
+    assert response.status_code == 200
+    assert type(response.accepted_renderer) is JSONRenderer
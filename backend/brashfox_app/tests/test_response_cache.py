@@ -0,0 +1,165 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.test import APIClient
+
+from brashfox_app.models import BlogPost, Message, PostCategory, PostComments
+from brashfox_app.api.cache import ResponseCache
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    """Test caching of anonymous GETs with signal-based invalidation"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='author', password='pass123')
+        self.post = BlogPost.objects.create(
+            title='Cached Post', slug='cached-post', post='Content', author=self.user
+        )
+    
+    def test_second_request_is_served_from_cache(self):
+        """Repeated anonymous GET is a cache hit"""
+        first = self.client.get('/api/blog-posts/')
+        second = self.client.get('/api/blog-posts/')
+        
+        assert first['X-Cache'] == 'MISS'
+        assert second['X-Cache'] == 'HIT'
+        assert second.data == first.data
+        assert ResponseCache.get_stats(['blog-posts'])['blog-posts'] == {'hits': 1, 'misses': 1}
+    
+    def test_query_string_is_part_of_key(self):
+        """Different filters/pages are cached separately"""
+        self.client.get('/api/blog-posts/?ordering=title')
+        response = self.client.get('/api/blog-posts/?ordering=-title')
+        assert response['X-Cache'] == 'MISS'
+    
+    def test_save_invalidates(self, django_capture_on_commit_callbacks):
+        """Saving a model evicts responses that embed it (after commit)"""
+        self.client.get('/api/blog-posts/')
+        with django_capture_on_commit_callbacks(execute=True):
+            PostComments.objects.create(blog_post=self.post, comment='Great post!', author='reader')
+        
+        response = self.client.get('/api/blog-posts/')
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['results'][0]['comments_count'] == 1
+    
+    def test_m2m_change_invalidates(self, django_capture_on_commit_callbacks):
+        """Adding posts to a category evicts category responses"""
+        category = PostCategory.objects.create(category='Porady')
+        self.client.get('/api/post-categories/')
+        with django_capture_on_commit_callbacks(execute=True):
+            category.blog_post.add(self.post)
+        
+        response = self.client.get('/api/post-categories/')
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['results'][0]['posts_count'] == 1
+    
+    def test_invalidated_only_after_commit(self, django_capture_on_commit_callbacks):
+        """Uncommitted changes keep the old version; rolled back ones never bump it"""
+        version = ResponseCache.get_version('blog-posts')
+        with django_capture_on_commit_callbacks() as callbacks:
+            PostComments.objects.create(blog_post=self.post, comment='Great post!', author='reader')
+            assert ResponseCache.get_version('blog-posts') == version
+        assert callbacks
+        
+        for callback in callbacks:
+            callback()
+        assert ResponseCache.get_version('blog-posts') == version + 1
+        
+        try:
+            with transaction.atomic():
+                PostComments.objects.create(blog_post=self.post, comment='Rolled back', author='reader')
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        assert ResponseCache.get_version('blog-posts') == version + 1
+    
+    def test_hits_run_no_queries(self, django_assert_num_queries):
+        """Cached responses and their validators need no database access"""
+        for url in ('/api/blog-posts/', '/api/photos/', '/api/photo-categories/',
+                    f'/api/blog-posts/{self.post.slug}/'):
+            etag = self.client.get(url)['ETag']
+            with django_assert_num_queries(0):
+                assert self.client.get(url)['X-Cache'] == 'HIT'
+                assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    
+    def test_authenticated_requests_bypass_cache(self):
+        """Logged-in users always get fresh responses"""
+        self.client.force_authenticate(user=self.user)
+        self.client.get('/api/blog-posts/')
+        response = self.client.get('/api/blog-posts/')
+        assert 'X-Cache' not in response
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Test ETag / Last-Modified handling"""
+    
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='author', password='pass123')
+        self.post = BlogPost.objects.create(
+            title='Conditional Post', slug='conditional-post', post='Content', author=self.user
+        )
+    
+    def test_detail_not_modified(self):
+        """Matching If-None-Match returns 304 without a body"""
+        url = f'/api/blog-posts/{self.post.slug}/'
+        response = self.client.get(url)
+        assert 'ETag' in response and 'Last-Modified' in response
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+        assert response.content == b''
+    
+    def test_list_if_modified_since(self):
+        """Unchanged list answers If-Modified-Since with 304"""
+        response = self.client.get('/api/blog-posts/')
+        response = self.client.get(
+            '/api/blog-posts/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+        )
+        assert response.status_code == 304
+    
+    def test_changes_produce_new_etag(self, django_capture_on_commit_callbacks):
+        """Own and related changes (e.g. new comment) change the ETag"""
+        url = f'/api/blog-posts/{self.post.slug}/'
+        etag = self.client.get(url)['ETag']
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            PostComments.objects.create(blog_post=self.post, comment='Great post!', author='reader')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data['comments_count'] == 1
+        
+        etag = response['ETag']
+        with django_capture_on_commit_callbacks(execute=True):
+            BlogPost.objects.create(title='Another', slug='another', post='Content', author=self.user)
+        response = self.client.get('/api/blog-posts/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+    
+    def test_etag_depends_on_query_string(self):
+        """Different filters get different validators"""
+        first = self.client.get('/api/blog-posts/?ordering=title')
+        second = self.client.get('/api/blog-posts/?ordering=-title')
+        assert first['ETag'] != second['ETag']
+    
+    def test_edit_without_namespace_changes_etag(self):
+        """Edited messages (no cache namespace) aren't answered with 304"""
+        admin = User.objects.create_superuser(username='admin', password='admin123')
+        message = Message.objects.create(
+            name='John Doe', email='john@test.com', topic='Question', message='Test message'
+        )
+        self.client.force_authenticate(user=admin)
+        url = f'/api/messages/{message.id}/'
+        detail_etag = self.client.get(url)['ETag']
+        list_etag = self.client.get('/api/messages/')['ETag']
+        
+        response = self.client.patch(url, {'topic': 'Answered'}, format='json')
+        assert response.status_code == 200
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=detail_etag)
+        assert response.status_code == 200
+        assert response.data['topic'] == 'Answered'
+        response = self.client.get('/api/messages/', HTTP_IF_NONE_MATCH=list_etag)
+        assert response.status_code == 200
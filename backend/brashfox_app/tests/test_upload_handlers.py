@@ -0,0 +1,105 @@
+import io
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from brashfox_app.models import FotoCategory, FotoDescription
+from brashfox_app.api.upload_handlers import StreamingImageUploadHandler, UploadRejected
+from brashfox_app.api.utils.constants import FileUpload
+from brashfox_app.api.utils.validators import validate_image_file
+
+
+def make_image(name='photo.jpg', fmt='JPEG'):
+    buffer = io.BytesIO()
+    Image.effect_noise((200, 200), 64).convert('RGB').save(buffer, format=fmt)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+def feed(handler, content, chunk_size=1024):
+    """Run content through the handler like MultiPartParser does."""
+    handler.new_file('image', 'photo.jpg', 'image/jpeg', len(content))
+    for start in range(0, len(content), chunk_size):
+        handler.receive_data_chunk(content[start:start + chunk_size], start)
+    return handler.file_complete(len(content))
+
+
+class TestStreamingImageUploadHandler:
+    """Uploads are spooled to disk and checked while being received"""
+    
+    def test_spools_to_temporary_file(self):
+        content = make_image().read()
+        uploaded = feed(StreamingImageUploadHandler(), content)
+        
+        assert isinstance(uploaded, TemporaryUploadedFile)
+        assert uploaded.image_format == 'jpeg'
+        assert uploaded.size == len(content)
+        assert uploaded.read() == content
+    
+    def test_rejects_bad_magic_bytes_on_first_chunk(self):
+        handler = StreamingImageUploadHandler()
+        handler.new_file('image', 'photo.jpg', 'image/jpeg', None)
+        with pytest.raises(UploadRejected):
+            handler.receive_data_chunk(b'<?php echo 1; ?>', 0)
+    
+    def test_aborts_as_soon_as_limit_exceeded(self, monkeypatch):
+        monkeypatch.setattr(FileUpload, 'MAX_IMAGE_SIZE', 2048)
+        handler = StreamingImageUploadHandler()
+        content = make_image().read()
+        handler.new_file('image', 'photo.jpg', 'image/jpeg', None)
+        handler.receive_data_chunk(content[:1024], 0)
+        handler.receive_data_chunk(content[1024:2048], 1024)
+        with pytest.raises(UploadRejected):
+            handler.receive_data_chunk(content[2048:3072], 2048)
+        assert handler.file.closed
+
+
+class TestImageFormatValidation:
+    """validate_image_file checks content, not the extension"""
+    
+    def test_extension_is_not_trusted(self):
+        with pytest.raises(ValidationError):
+            validate_image_file(SimpleUploadedFile('photo.jpg', b'not an image'))
+    
+    def test_content_decides(self):
+        image = make_image('photo.bin', fmt='PNG')
+        validate_image_file(image)
+        assert image.tell() == 0
+
+
+@pytest.mark.django_db
+class TestPhotoUploadEndpoint:
+    """Photo endpoint answers rejected uploads with 400"""
+    
+    def setup_method(self):
+        self.user = User.objects.create_user(username='photographer', password='pass123')
+        self.category = FotoCategory.objects.create(category='Ślub')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+    
+    def upload(self, image):
+        return self.client.post('/api/photos/', {
+            'name': 'Bride',
+            'image': image,
+            'foto_category_id': self.category.id,
+        }, format='multipart')
+    
+    def test_valid_upload(self, media_root):
+        response = self.upload(make_image())
+        assert response.status_code == status.HTTP_201_CREATED
+    
+    def test_fake_image_rejected(self, media_root):
+        response = self.upload(SimpleUploadedFile('photo.jpg', b'GIF-ish text file'))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not FotoDescription.objects.exists()
+    
+    def test_oversized_upload_rejected(self, media_root, monkeypatch):
+        monkeypatch.setattr(FileUpload, 'MAX_IMAGE_SIZE', 1024)
+        response = self.upload(make_image())
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'exceeds' in response.data['detail']
+        assert not FotoDescription.objects.exists()
@@ -10,6 +10,7 @@ from django.views.generic import CreateView, DeleteView, UpdateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 
 from brashfox_app.models import BlogPost
+from brashfox_app.api.services import BlogPostService
 
 
 class BlogView(View):
@@ -43,8 +44,7 @@ class AddPostView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         form.instance.author = self.request.user
-        form.instance.slug = slugify(form.instance.title)
-        form.save()
+        BlogPostService.save_with_unique_slug(form.instance, slugify(form.instance.title))
         return redirect(self.success_url)
 
 